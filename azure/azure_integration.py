@@ -7,15 +7,25 @@ Provides cloud processing capabilities using Azure services.
 
 import os
 import sys
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator, Awaitable, BinaryIO, Set, Tuple, Union
 import asyncio
-import tempfile
+import functools
+import tarfile
+import time
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote
 import json
 
 # Azure SDK imports
 try:
-    from azure.storage.blob import BlobServiceClient, BlobClient
+    import aiohttp
+    from azure.core.exceptions import ResourceExistsError
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.storage.blob import BlobBlock, ContainerSasPermissions, ContentSettings, generate_container_sas
+    from azure.storage.blob.aio import BlobServiceClient
     from azure.cognitiveservices.vision.computervision import ComputerVisionClient
     from azure.cognitiveservices.vision.computervision.models import OperationStatusCodes
     from msrest.authentication import CognitiveServicesCredentials
@@ -23,9 +33,16 @@ try:
 except ImportError:
     AZURE_AVAILABLE = False
 
+try:
+    from azure.batch import BatchServiceClient
+    from azure.batch.batch_auth import SharedKeyCredentials
+    import azure.batch.models as batchmodels
+    AZURE_BATCH_AVAILABLE = True
+except ImportError:
+    AZURE_BATCH_AVAILABLE = False
+
 # Core dependencies
 from loguru import logger
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from PIL import Image
 import io
@@ -34,77 +51,309 @@ import io
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from image_processor import ImageProcessor, ProcessingConfig
 
+# Maximum sub-requests the Blob batch API accepts in one call
+BLOB_BATCH_SIZE = 256
+
+# In-memory uploads above this size are sent as separately staged blocks
+STAGED_UPLOAD_THRESHOLD = 16 * 1024 * 1024
+STAGED_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Files below this size can be packed into tar bundles of up to BUNDLE_MAX_SIZE
+BUNDLE_SMALL_FILE_LIMIT = 1024 * 1024
+BUNDLE_MAX_SIZE = 64 * 1024 * 1024
+
+# Processed images are written under this prefix; the output blob's metadata
+# records the etag of the input it was produced from
+OUTPUT_BLOB_PREFIX = "processed/"
+SOURCE_ETAG_METADATA_KEY = "src_etag"
+
+# Azure Batch job files (per-job config) live under this prefix
+BATCH_BLOB_PREFIX = "batch/"
+
+# Upload bundles (tar + JSON index) live under this prefix, followed by the upload's blob prefix
+BUNDLE_BLOB_PREFIX = "bundles/"
+
+# Blobs under these prefixes are never treated as input images
+_RESERVED_BLOB_PREFIXES = (OUTPUT_BLOB_PREFIX, BATCH_BLOB_PREFIX, BUNDLE_BLOB_PREFIX)
+
+# Azure Batch fan-out: input blobs per task, tasks per add_collection call (service max)
+BATCH_BLOBS_PER_TASK = 50
+BATCH_TASKS_PER_REQUEST = 100
+BATCH_SAS_LIFETIME = timedelta(hours=24)
+
+# Runs on the pool's (Linux) nodes; the pool start task must deploy this app
+# into the node shared directory
+BATCH_TASK_COMMAND = '/bin/sh -c "python3 $AZ_BATCH_NODE_SHARED_DIR/ImageProcessorPro/cli.py --config config.json"'
+
+# (account URL, container) pairs already known to exist in this process
+_KNOWN_CONTAINERS: Set[Tuple[str, str]] = set()
+
+# Lifetime of the read-only container SAS handed to Computer Vision
+CONTAINER_SAS_LIFETIME = timedelta(hours=1)
+
+# Concurrent Computer Vision calls (S1 tier allows 10 transactions per second)
+CV_MAX_CONCURRENT_REQUESTS = 10
+
+# MIME types for processed output formats and uploaded source files
+_MIME_BY_FORMAT = MappingProxyType({
+    'JPEG': 'image/jpeg',
+    'PNG': 'image/png',
+    'WEBP': 'image/webp'
+})
+_MIME_BY_SUFFIX = MappingProxyType({
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.tif': 'image/tiff'
+})
+
+
+def _get_content_type(format_name: str) -> str:
+    """Get MIME content type for an output format."""
+    return _MIME_BY_FORMAT.get(format_name.upper(), 'image/jpeg')
+
+
+def _suffix_to_mime(suffix: str) -> str:
+    """Get MIME content type for a file suffix such as '.JPG'."""
+    return _MIME_BY_SUFFIX.get(suffix.lower(), 'application/octet-stream')
+
+
+if AZURE_AVAILABLE:
+    class _PooledAioHttpTransport(AioHttpTransport):
+        """AioHttpTransport whose session keeps at most ``connection_limit`` connections."""
+        
+        def __init__(self, connection_limit: int, **kwargs):
+            super().__init__(**kwargs)
+            self._connection_limit = connection_limit
+        
+        async def open(self) -> None:
+            # The session must be created inside the running loop
+            if self.session is None:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self._connection_limit),
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                    auto_decompress=False
+                )
+            await super().open()
+
 
 class AzureBlobStorage:
-    """Azure Blob Storage integration for image processing."""
+    """Azure Blob Storage integration for image processing.
+    
+    Uses the asyncio client; open it with ``async with storage:`` before
+    issuing requests so the underlying HTTP session is bound to the running loop.
+    """
     
-    def __init__(self, connection_string: str, container_name: str = "images"):
+    def __init__(self, connection_string: str, container_name: str = "images",
+                 max_concurrency: int = 8, http_pool_size: int = 32):
         if not AZURE_AVAILABLE:
-            raise ImportError("Azure SDK not available. Install with: pip install azure-storage-blob")
+            raise ImportError("Azure SDK not available. Install with: pip install azure-storage-blob aiohttp")
         
-        self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        # Larger single-shot/chunk sizes so multi-MB images move in few, parallel requests
+        self.blob_service_client = BlobServiceClient.from_connection_string(
+            connection_string,
+            transport=_PooledAioHttpTransport(connection_limit=http_pool_size),
+            max_single_get_size=32 * 1024 * 1024,
+            max_chunk_get_size=16 * 1024 * 1024,
+            max_single_put_size=32 * 1024 * 1024,
+            max_block_size=16 * 1024 * 1024
+        )
         self.container_name = container_name
+        self.container_client = self.blob_service_client.get_container_client(container_name)
+        self.max_concurrency = max_concurrency
+        self._sas_suffix = ""
+        self._sas_expiry: Optional[datetime] = None
+    
+    async def __aenter__(self) -> 'AzureBlobStorage':
+        await self.blob_service_client.__aenter__()
+        await self.ensure_container()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.blob_service_client.close()
+    
+    async def ensure_container(self) -> None:
+        """Create the container if it doesn't exist (checked once per process)."""
+        key = (self.blob_service_client.url, self.container_name)
+        if key in _KNOWN_CONTAINERS:
+            return
+        if not await self.container_client.exists():
+            try:
+                await self.container_client.create_container()
+            except ResourceExistsError:
+                pass  # Created concurrently by another client
+        _KNOWN_CONTAINERS.add(key)
+    
+    def get_blob_read_url(self, blob_name: str) -> str:
+        """Get a URL external services can read, signed with a shared container SAS."""
+        return f"{self.container_client.url}/{quote(blob_name)}{self._get_sas_suffix()}"
+    
+    def generate_sas_token(self, lifetime: timedelta, write: bool = False) -> str:
+        """Sign a fresh container SAS token (read, optionally write) for ``lifetime``."""
+        account_key = getattr(self.blob_service_client.credential, 'account_key', None)
+        if not account_key:
+            raise ValueError("Container SAS requires a connection string with an account key")
         
-        # Create container if it doesn't exist
-        try:
-            self.blob_service_client.create_container(container_name)
-        except Exception:
-            pass  # Container might already exist
+        return generate_container_sas(
+            account_name=self.blob_service_client.account_name,
+            container_name=self.container_name,
+            account_key=account_key,
+            permission=ContainerSasPermissions(read=True, write=write, create=write),
+            expiry=datetime.now(timezone.utc) + lifetime
+        )
     
-    def upload_image(self, image_data: bytes, blob_name: str, 
-                    content_type: str = "image/jpeg") -> str:
-        """Upload image to Azure Blob Storage."""
-        try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name, 
-                blob=blob_name
+    def _get_sas_suffix(self) -> str:
+        """Return the read SAS query string, generating it once per lifetime window."""
+        account_key = getattr(self.blob_service_client.credential, 'account_key', None)
+        if not account_key:
+            return ""  # No shared key - rely on public access or a SAS connection string
+        
+        now = datetime.now(timezone.utc)
+        if self._sas_expiry is None or now >= self._sas_expiry - timedelta(minutes=5):
+            self._sas_expiry = now + CONTAINER_SAS_LIFETIME
+            sas_token = generate_container_sas(
+                account_name=self.blob_service_client.account_name,
+                container_name=self.container_name,
+                account_key=account_key,
+                permission=ContainerSasPermissions(read=True),
+                expiry=self._sas_expiry
             )
+            self._sas_suffix = f"?{sas_token}"
+        return self._sas_suffix
+    
+    async def upload_image(self, image_data: Union[bytes, BinaryIO], blob_name: str, 
+                           content_type: str = "image/jpeg",
+                           metadata: Optional[Dict[str, str]] = None) -> str:
+        """Upload image to Azure Blob Storage.
+        
+        ``image_data`` may be an open binary file, which the SDK reads chunk by chunk.
+        Large in-memory payloads are routed through ``upload_image_staged``.
+        """
+        try:
+            if isinstance(image_data, bytes) and len(image_data) > STAGED_UPLOAD_THRESHOLD:
+                return await self.upload_image_staged(
+                    image_data, blob_name, content_type, metadata=metadata
+                )
             
-            blob_client.upload_blob(
-                image_data, 
-                overwrite=True,
-                content_settings={'content_type': content_type}
-            )
+            blob_client = self.container_client.get_blob_client(blob_name)
+            
+            async with blob_client:
+                await blob_client.upload_blob(
+                    image_data, 
+                    overwrite=True,
+                    max_concurrency=self.max_concurrency,
+                    content_settings=ContentSettings(content_type=content_type),
+                    metadata=metadata
+                )
             
             return blob_client.url
         except Exception as e:
             logger.error(f"Failed to upload {blob_name} to Azure: {e}")
             raise
     
-    def download_image(self, blob_name: str) -> bytes:
+    async def upload_image_staged(self, image_data: bytes, blob_name: str,
+                                  content_type: str = "image/jpeg",
+                                  block_size: int = STAGED_BLOCK_SIZE,
+                                  metadata: Optional[Dict[str, str]] = None) -> str:
+        """Upload image as staged blocks, then commit the block list.
+        
+        Each block is sent (and retried) independently, so a transient failure
+        only repeats that block. Uncommitted blocks are kept by the service for
+        7 days.
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+            offsets = range(0, len(image_data), block_size)
+            # Block IDs must all have the same length within a blob
+            block_ids = [f"{index:08d}" for index in range(len(offsets))]
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async def stage(block_id: str, offset: int) -> None:
+                async with semaphore:
+                    await blob_client.stage_block(block_id, image_data[offset:offset + block_size])
+            
+            async with blob_client:
+                await asyncio.gather(*[
+                    stage(block_id, offset) for block_id, offset in zip(block_ids, offsets)
+                ])
+                await blob_client.commit_block_list(
+                    [BlobBlock(block_id=block_id) for block_id in block_ids],
+                    content_settings=ContentSettings(content_type=content_type),
+                    metadata=metadata
+                )
+            
+            return blob_client.url
+        except Exception as e:
+            logger.error(f"Failed to upload {blob_name} to Azure in blocks: {e}")
+            raise
+    
+    async def download_image(self, blob_name: str) -> bytes:
         """Download image from Azure Blob Storage."""
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
-            )
+            blob_client = self.container_client.get_blob_client(blob_name)
             
-            return blob_client.download_blob().readall()
+            async with blob_client:
+                downloader = await blob_client.download_blob(max_concurrency=self.max_concurrency)
+                return await downloader.readall()
         except Exception as e:
             logger.error(f"Failed to download {blob_name} from Azure: {e}")
             raise
     
-    def list_blobs(self, prefix: str = "") -> List[str]:
-        """List blobs in the container."""
+    async def iter_blob_properties(self, prefix: str = "",
+                                   include_metadata: bool = False) -> AsyncIterator[Any]:
+        """Yield BlobProperties (name, etag, ...) as each listing page arrives."""
+        include = ['metadata'] if include_metadata else None
         try:
-            container_client = self.blob_service_client.get_container_client(self.container_name)
-            blobs = container_client.list_blobs(name_starts_with=prefix)
-            return [blob.name for blob in blobs]
+            async for blob in self.container_client.list_blobs(name_starts_with=prefix, include=include):
+                yield blob
         except Exception as e:
             logger.error(f"Failed to list blobs: {e}")
             raise
     
-    def delete_blob(self, blob_name: str) -> None:
+    async def iter_blobs(self, prefix: str = "") -> AsyncIterator[str]:
+        """Yield blob names in the container as each listing page arrives."""
+        async for blob in self.iter_blob_properties(prefix):
+            yield blob.name
+    
+    async def list_blobs(self, prefix: str = "") -> List[str]:
+        """List blobs in the container."""
+        return [blob_name async for blob_name in self.iter_blobs(prefix)]
+    
+    async def delete_blob(self, blob_name: str) -> None:
         """Delete a blob from storage."""
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
-            )
-            blob_client.delete_blob()
+            blob_client = self.container_client.get_blob_client(blob_name)
+            async with blob_client:
+                await blob_client.delete_blob()
         except Exception as e:
             logger.error(f"Failed to delete {blob_name}: {e}")
             raise
+    
+    async def delete_blobs(self, blob_names: List[str]) -> None:
+        """Delete blobs using the batch API, up to 256 per request.
+        
+        The batch response still carries a status per blob; if any delete
+        fails the SDK raises PartialBatchErrorException listing the failures.
+        """
+        try:
+            for start in range(0, len(blob_names), BLOB_BATCH_SIZE):
+                batch = blob_names[start:start + BLOB_BATCH_SIZE]
+                await self.container_client.delete_blobs(*batch)
+        except Exception as e:
+            logger.error(f"Failed to delete {len(blob_names)} blobs: {e}")
+            raise
+    
+    async def set_blobs_tier(self, blob_names: List[str], tier: str) -> None:
+        """Set the access tier (Hot, Cool, Archive) of blobs using the batch API."""
+        try:
+            for start in range(0, len(blob_names), BLOB_BATCH_SIZE):
+                batch = blob_names[start:start + BLOB_BATCH_SIZE]
+                await self.container_client.set_standard_blob_tier_blobs(tier, *batch)
+        except Exception as e:
+            logger.error(f"Failed to set tier {tier} on {len(blob_names)} blobs: {e}")
+            raise
 
 
 class AzureComputerVision:
@@ -145,12 +394,14 @@ class AzureComputerVision:
             read_response = self.client.read(image_url, raw=True)
             operation_id = read_response.headers["Operation-Location"].split("/")[-1]
             
-            # Wait for the operation to complete
+            # Wait for the operation to complete, backing off between polls
+            poll_interval = 0.5
             while True:
                 read_result = self.client.get_read_result(operation_id)
                 if read_result.status not in ['notStarted', 'running']:
                     break
-                asyncio.sleep(1)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, 5.0)
             
             # Extract text
             text_lines = []
@@ -171,7 +422,10 @@ class AzureImageProcessor:
     def __init__(self, config: ProcessingConfig, 
                  blob_connection_string: Optional[str] = None,
                  cv_subscription_key: Optional[str] = None,
-                 cv_endpoint: Optional[str] = None):
+                 cv_endpoint: Optional[str] = None,
+                 batch_account_url: Optional[str] = None,
+                 batch_account_name: Optional[str] = None,
+                 batch_account_key: Optional[str] = None):
         
         self.config = config
         self.local_processor = ImageProcessor(config)
@@ -179,143 +433,332 @@ class AzureImageProcessor:
         # Initialize Azure services if credentials provided
         self.blob_storage = None
         self.computer_vision = None
+        self.batch_client = None
         
         if blob_connection_string:
-            self.blob_storage = AzureBlobStorage(blob_connection_string)
+            self.blob_storage = AzureBlobStorage(
+                blob_connection_string,
+                max_concurrency=config.blob_max_concurrency,
+                http_pool_size=config.http_pool_size or max(32, (config.max_workers or 4) * 4)
+            )
         
         if cv_subscription_key and cv_endpoint:
             self.computer_vision = AzureComputerVision(cv_subscription_key, cv_endpoint)
+        
+        if batch_account_url and batch_account_name and batch_account_key:
+            if not AZURE_BATCH_AVAILABLE:
+                raise ImportError("Azure Batch SDK not available. Install with: pip install azure-batch")
+            self.batch_client = BatchServiceClient(
+                SharedKeyCredentials(batch_account_name, batch_account_key),
+                batch_url=batch_account_url
+            )
     
     def process_images_cloud(self, 
                            input_container: str = "input",
                            output_container: str = "output",
                            progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
         """Process images stored in Azure Blob Storage."""
+        return asyncio.run(self.process_images_cloud_async(
+            input_container, output_container, progress_callback
+        ))
+    
+    async def process_images_cloud_async(self, 
+                                         input_container: str = "input",
+                                         output_container: str = "output",
+                                         progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+        """Process images stored in Azure Blob Storage concurrently on the event loop.
+        
+        Inputs whose output is already up to date are counted in ``skipped``
+        only, so ``processed + failed + skipped == total``.
+        """
         
         if not self.blob_storage:
             raise ValueError("Azure Blob Storage not configured")
         
         try:
-            # List input images
-            input_blobs = self.blob_storage.list_blobs()
-            if not input_blobs:
-                logger.warning("No images found in input container")
-                return {"processed": 0, "failed": 0, "total": 0}
-            
-            logger.info(f"Found {len(input_blobs)} images to process")
-            
-            results = {"processed": 0, "failed": 0, "total": len(input_blobs)}
-            
-            # Process each image
-            with ThreadPoolExecutor(max_workers=self.config.max_workers or 4) as executor:
-                futures = []
+            async with self.blob_storage:
+                results = {"processed": 0, "failed": 0, "skipped": 0, "total": 0}
+                worker_count = self.config.max_workers or 32
                 
-                for blob_name in input_blobs:
-                    future = executor.submit(self._process_cloud_image, blob_name, output_container)
-                    futures.append((future, blob_name))
+                # Source etag recorded on each existing output, fetched in one listing
+                output_src_etags = {
+                    blob.name: (blob.metadata or {}).get(SOURCE_ETAG_METADATA_KEY)
+                    async for blob in self.blob_storage.iter_blob_properties(
+                        OUTPUT_BLOB_PREFIX, include_metadata=True
+                    )
+                }
+                
+                # Bounded so listing stays only a little ahead of processing
+                queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+                completed = 0
                 
-                # Process results
-                for i, (future, blob_name) in enumerate(futures):
-                    try:
-                        if future.result():
-                            results["processed"] += 1
-                            logger.info(f"Successfully processed: {blob_name}")
+                async def worker() -> None:
+                    nonlocal completed
+                    while True:
+                        blob = await queue.get()
+                        if blob is None:
+                            return
+                        blob_name = blob.name
+                        
+                        # Skip inputs whose output was produced from this exact version
+                        output_blob_name = self._get_output_blob_name(blob_name)
+                        if blob.etag and output_src_etags.get(output_blob_name) == blob.etag:
+                            results["skipped"] += 1
+                            logger.debug(f"Skipping unchanged image: {blob_name}")
                         else:
-                            results["failed"] += 1
-                            logger.error(f"Failed to process: {blob_name}")
-                    except Exception as e:
-                        results["failed"] += 1
-                        logger.error(f"Error processing {blob_name}: {e}")
-                    
-                    if progress_callback:
-                        progress_callback(i + 1, len(futures))
-            
-            return results
+                            try:
+                                success = await self._process_cloud_image(
+                                    blob_name, output_container, input_etag=blob.etag
+                                )
+                            except Exception as e:
+                                logger.error(f"Error processing {blob_name}: {e}")
+                                success = False
+                            
+                            if success:
+                                results["processed"] += 1
+                                logger.info(f"Successfully processed: {blob_name}")
+                            else:
+                                results["failed"] += 1
+                                logger.error(f"Failed to process: {blob_name}")
+                        
+                        completed += 1
+                        if progress_callback:
+                            # A raising callback must not kill the worker: the producer
+                            # would then block forever on the bounded queue
+                            try:
+                                # Total grows while the listing is still being paged in
+                                progress_callback(completed, results["total"])
+                            except Exception as e:
+                                logger.error(f"Progress callback failed: {e}")
+                
+                workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+                try:
+                    # Feed blobs to the workers as listing pages arrive
+                    async for blob in self.blob_storage.iter_blob_properties():
+                        if blob.name.startswith(_RESERVED_BLOB_PREFIXES):
+                            continue  # Our own outputs and job files
+                        results["total"] += 1
+                        await queue.put(blob)
+                finally:
+                    for _ in workers:
+                        await queue.put(None)
+                    await asyncio.gather(*workers)
+                
+                if not results["total"]:
+                    logger.warning("No images found in input container")
+                else:
+                    logger.info(f"Found {results['total']} images to process")
+                
+                return results
             
         except Exception as e:
             logger.error(f"Cloud processing failed: {e}")
             raise
     
-    def _process_cloud_image(self, input_blob_name: str, output_container: str) -> bool:
-        """Process a single image in the cloud."""
+    async def _gather_bounded(self, items: List[str],
+                              worker: Callable[[str], Awaitable[bool]],
+                              on_result: Callable[[str, bool], None],
+                              progress_callback: Optional[Callable] = None) -> None:
+        """Run ``worker`` over ``items`` with at most ``max_workers`` in flight."""
+        semaphore = asyncio.Semaphore(self.config.max_workers or 32)
+        total = len(items)
+        completed = 0
+        
+        async def run_one(item: str) -> None:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    success = await worker(item)
+                except Exception as e:
+                    logger.error(f"Error processing {item}: {e}")
+                    success = False
+            
+            on_result(item, success)
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+        
+        await asyncio.gather(*[run_one(item) for item in items])
+    
+    async def _process_cloud_image(self, input_blob_name: str, output_container: str,
+                                   input_etag: Optional[str] = None) -> bool:
+        """Process a single image in the cloud.
+        
+        ``input_etag`` is stored on the output blob so unchanged inputs are skipped next run.
+        """
         try:
             # Download image
-            image_data = self.blob_storage.download_image(input_blob_name)
+            image_data = await self.blob_storage.download_image(input_blob_name)
             
-            # Process image locally
-            with tempfile.NamedTemporaryFile(suffix=".jpg") as temp_input:
-                temp_input.write(image_data)
-                temp_input.flush()
-                
-                with tempfile.NamedTemporaryFile(suffix=f".{self.config.output_format.lower()}") as temp_output:
-                    # Process the image
-                    success = self.local_processor.process_single_image(temp_input.name, temp_output.name)
-                    
-                    if success:
-                        # Upload processed image
-                        with open(temp_output.name, 'rb') as f:
-                            processed_data = f.read()
-                        
-                        output_blob_name = self._get_output_blob_name(input_blob_name)
-                        content_type = self._get_content_type(self.config.output_format)
-                        
-                        url = self.blob_storage.upload_image(
-                            processed_data, 
-                            output_blob_name, 
-                            content_type
-                        )
-                        
-                        logger.debug(f"Uploaded processed image: {url}")
-                        return True
-                    
-                    return False
+            # Process image in memory, off the event loop (CPU-bound)
+            processed_data = await asyncio.to_thread(
+                self.local_processor.process_single_image_bytes, image_data
+            )
+            if processed_data is None:
+                return False
+            
+            # Upload processed image
+            output_blob_name = self._get_output_blob_name(input_blob_name)
+            content_type = _get_content_type(self.config.output_format)
+            
+            url = await self.blob_storage.upload_image(
+                processed_data, 
+                output_blob_name, 
+                content_type,
+                metadata={SOURCE_ETAG_METADATA_KEY: input_etag} if input_etag else None
+            )
+            
+            logger.debug(f"Uploaded processed image: {url}")
+            return True
                     
         except Exception as e:
             logger.error(f"Failed to process cloud image {input_blob_name}: {e}")
             return False
     
+    def submit_batch_job(self, pool_id: str, job_id: Optional[str] = None) -> Optional[str]:
+        """Fan processing of the container out to an Azure Batch pool.
+        
+        Runs the transform on VMs next to the storage account instead of
+        pulling every image through this machine. Each task downloads up to
+        ``BATCH_BLOBS_PER_TASK`` inputs, runs ``cli.py`` with this processor's
+        settings and uploads results to the same names ``process_images_cloud``
+        would use. Returns the job id, or None if there was nothing to process.
+        """
+        return asyncio.run(self.submit_batch_job_async(pool_id, job_id))
+    
+    async def submit_batch_job_async(self, pool_id: str, job_id: Optional[str] = None) -> Optional[str]:
+        """Create an Azure Batch job with one task per shard of input blobs."""
+        if not self.batch_client:
+            raise ValueError("Azure Batch not configured")
+        if not self.blob_storage:
+            raise ValueError("Azure Blob Storage not configured")
+        
+        job_id = job_id or f"imageprocessor-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}"
+        config_blob_name = f"{BATCH_BLOB_PREFIX}{job_id}/config.json"
+        
+        # Node-side settings: read from ./input, write flat into ./input/<subfolder>
+        # with no suffix so names match _get_output_blob_name
+        node_config = replace(
+            self.config,
+            input_folder="input",
+            output_folder="input",
+            create_subfolder=True,
+            web_output_suffix=""
+        )
+        
+        async with self.blob_storage:
+            input_blobs = [
+                blob_name async for blob_name in self.blob_storage.iter_blobs()
+                if not blob_name.startswith(_RESERVED_BLOB_PREFIXES)
+            ]
+            if not input_blobs:
+                logger.warning("No images found in input container")
+                return None
+            
+            # JSON is valid YAML, so cli.py --config can load it directly
+            await self.blob_storage.upload_image(
+                json.dumps(asdict(node_config), indent=2).encode("utf-8"),
+                config_blob_name,
+                "application/json"
+            )
+        
+        sas_token = self.blob_storage.generate_sas_token(BATCH_SAS_LIFETIME, write=True)
+        container_url = self.blob_storage.container_client.url
+        
+        def blob_url(blob_name: str) -> str:
+            return f"{container_url}/{quote(blob_name)}?{sas_token}"
+        
+        output_files = [batchmodels.OutputFile(
+            file_pattern=f"input/{node_config.subfolder_name}/*",
+            destination=batchmodels.OutputFileDestination(
+                container=batchmodels.OutputFileBlobContainerDestination(
+                    container_url=f"{container_url}?{sas_token}",
+                    path=OUTPUT_BLOB_PREFIX.rstrip("/")
+                )
+            ),
+            upload_options=batchmodels.OutputFileUploadOptions(
+                upload_condition=batchmodels.OutputFileUploadCondition.task_completion
+            )
+        )]
+        
+        tasks = []
+        for start in range(0, len(input_blobs), BATCH_BLOBS_PER_TASK):
+            shard = input_blobs[start:start + BATCH_BLOBS_PER_TASK]
+            # Inputs are flattened like _get_output_blob_name flattens outputs
+            resource_files = [batchmodels.ResourceFile(http_url=blob_url(config_blob_name), file_path="config.json")]
+            resource_files += [
+                batchmodels.ResourceFile(http_url=blob_url(name), file_path=f"input/{Path(name).name}")
+                for name in shard
+            ]
+            tasks.append(batchmodels.TaskAddParameter(
+                id=f"task-{len(tasks):05d}",
+                command_line=BATCH_TASK_COMMAND,
+                resource_files=resource_files,
+                output_files=output_files
+            ))
+        
+        def submit() -> None:
+            self.batch_client.job.add(batchmodels.JobAddParameter(
+                id=job_id,
+                pool_info=batchmodels.PoolInformation(pool_id=pool_id),
+                on_all_tasks_complete=batchmodels.OnAllTasksComplete.terminate_job
+            ))
+            for start in range(0, len(tasks), BATCH_TASKS_PER_REQUEST):
+                self.batch_client.task.add_collection(job_id, tasks[start:start + BATCH_TASKS_PER_REQUEST])
+        
+        await asyncio.to_thread(submit)
+        logger.info(f"Submitted Azure Batch job {job_id}: {len(input_blobs)} images in {len(tasks)} tasks on pool {pool_id}")
+        return job_id
+    
     def _get_output_blob_name(self, input_blob_name: str) -> str:
         """Generate output blob name."""
         path = Path(input_blob_name)
-        return f"processed/{path.stem}.{self.config.output_format.lower()}"
-    
-    def _get_content_type(self, format_name: str) -> str:
-        """Get MIME content type for format."""
-        types = {
-            'JPEG': 'image/jpeg',
-            'PNG': 'image/png',
-            'WEBP': 'image/webp'
-        }
-        return types.get(format_name.upper(), 'image/jpeg')
+        return f"{OUTPUT_BLOB_PREFIX}{path.stem}.{self.config.output_format.lower()}"
     
     def analyze_images(self, blob_names: List[str]) -> Dict[str, Dict[str, Any]]:
         """Analyze images using Azure Computer Vision."""
+        return asyncio.run(self.analyze_images_async(blob_names))
+    
+    async def analyze_images_async(self, blob_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Analyze images concurrently, capped at the Computer Vision request limit."""
         if not self.computer_vision:
             raise ValueError("Azure Computer Vision not configured")
         
-        results = {}
+        semaphore = asyncio.Semaphore(CV_MAX_CONCURRENT_REQUESTS)
         
-        for blob_name in blob_names:
-            try:
-                # Get blob URL (assuming public access or generate SAS token)
-                blob_client = self.blob_storage.blob_service_client.get_blob_client(
-                    container=self.blob_storage.container_name,
-                    blob=blob_name
-                )
-                
-                analysis = self.computer_vision.analyze_image(blob_client.url)
-                results[blob_name] = analysis
-                
-            except Exception as e:
-                logger.error(f"Failed to analyze {blob_name}: {e}")
-                results[blob_name] = {"error": str(e)}
+        async def analyze_one(blob_name: str) -> Tuple[str, Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    analysis = await asyncio.to_thread(
+                        self.computer_vision.analyze_image,
+                        self.blob_storage.get_blob_read_url(blob_name)
+                    )
+                    return blob_name, analysis
+                    
+                except Exception as e:
+                    logger.error(f"Failed to analyze {blob_name}: {e}")
+                    return blob_name, {"error": str(e)}
         
-        return results
+        return dict(await asyncio.gather(*[analyze_one(name) for name in blob_names]))
     
     def batch_upload_from_local(self, local_folder: str, 
                                blob_prefix: str = "",
-                               progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+                               progress_callback: Optional[Callable] = None,
+                               bundle_small_files: bool = False) -> Dict[str, Any]:
         """Upload local images to Azure Blob Storage."""
+        return asyncio.run(self.batch_upload_from_local_async(
+            local_folder, blob_prefix, progress_callback, bundle_small_files
+        ))
+    
+    async def batch_upload_from_local_async(self, local_folder: str, 
+                                            blob_prefix: str = "",
+                                            progress_callback: Optional[Callable] = None,
+                                            bundle_small_files: bool = False) -> Dict[str, Any]:
+        """Upload local images to Azure Blob Storage concurrently on the event loop.
+        
+        With ``bundle_small_files``, files under 1 MiB are packed into tar
+        bundles of up to 64 MiB (see ``download_bundle``) instead of one blob each.
+        """
         if not self.blob_storage:
             raise ValueError("Azure Blob Storage not configured")
         
@@ -328,53 +771,137 @@ class AzureImageProcessor:
         
         results = {"uploaded": 0, "failed": 0, "total": len(image_files)}
         
-        with ThreadPoolExecutor(max_workers=self.config.max_workers or 4) as executor:
-            futures = []
+        bundles: Dict[str, List[str]] = {}
+        upload_items = image_files
+        if bundle_small_files:
+            upload_items, bundles = self._plan_bundles(image_files, blob_prefix)
+            upload_items = upload_items + list(bundles)
+        
+        def on_result(item: str, success: bool) -> None:
+            count = len(bundles[item]) if item in bundles else 1
+            if success:
+                results["uploaded"] += count
+            else:
+                results["failed"] += count
+        
+        def upload(item: str) -> Awaitable[bool]:
+            if item in bundles:
+                return self._upload_bundle(item, bundles[item], local_folder, blob_prefix)
+            return self._upload_single_file(item, local_folder, blob_prefix)
+        
+        async with self.blob_storage:
+            await self._gather_bounded(upload_items, upload, on_result, progress_callback)
+        
+        return results
+    
+    def _plan_bundles(self, image_files: List[str],
+                      blob_prefix: str) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Split files into ones uploaded individually and tar bundles of small files."""
+        individual_files = []
+        bundles: Dict[str, List[str]] = {}
+        current_bundle: List[str] = []
+        current_size = 0
+        
+        def close_bundle() -> None:
+            bundle_name = f"{BUNDLE_BLOB_PREFIX}{blob_prefix}bundle_{len(bundles):05d}.tar"
+            bundles[bundle_name] = current_bundle
+        
+        for file_path in image_files:
+            size = os.path.getsize(file_path)
+            if size >= BUNDLE_SMALL_FILE_LIMIT:
+                individual_files.append(file_path)
+                continue
             
-            for file_path in image_files:
-                future = executor.submit(self._upload_single_file, file_path, local_folder, blob_prefix)
-                futures.append((future, file_path))
+            if current_bundle and current_size + size > BUNDLE_MAX_SIZE:
+                close_bundle()
+                current_bundle, current_size = [], 0
             
-            for i, (future, file_path) in enumerate(futures):
-                try:
-                    if future.result():
-                        results["uploaded"] += 1
-                    else:
-                        results["failed"] += 1
-                except Exception as e:
-                    results["failed"] += 1
-                    logger.error(f"Error uploading {file_path}: {e}")
-                
-                if progress_callback:
-                    progress_callback(i + 1, len(futures))
+            current_bundle.append(file_path)
+            current_size += size
         
-        return results
+        if current_bundle:
+            close_bundle()
+        
+        return individual_files, bundles
+    
+    async def _upload_bundle(self, bundle_name: str, file_paths: List[str],
+                             base_folder: str, blob_prefix: str) -> bool:
+        """Pack files into a tar bundle and upload it with a JSON index blob."""
+        try:
+            def build_bundle() -> Tuple[bytes, Dict[str, Any]]:
+                buffer = io.BytesIO()
+                index = {"bundle": bundle_name, "files": []}
+                with tarfile.open(fileobj=buffer, mode='w') as tar:
+                    for file_path in file_paths:
+                        arcname = self._get_upload_blob_name(file_path, base_folder, "")
+                        tar.add(file_path, arcname=arcname)
+                        index["files"].append({
+                            "name": arcname,
+                            "blob_name": f"{blob_prefix}{arcname}",
+                            "content_type": _suffix_to_mime(Path(file_path).suffix)
+                        })
+                return buffer.getvalue(), index
+            
+            bundle_data, index = await asyncio.to_thread(build_bundle)
+            
+            url = await self.blob_storage.upload_image(bundle_data, bundle_name, "application/x-tar")
+            await self.blob_storage.upload_image(
+                json.dumps(index, indent=2).encode("utf-8"),
+                f"{bundle_name}.json",
+                "application/json"
+            )
+            logger.debug(f"Uploaded bundle of {len(file_paths)} files to {url}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to upload bundle {bundle_name}: {e}")
+            return False
+    
+    def download_bundle(self, bundle_name: str, local_folder: str) -> List[str]:
+        """Download a tar bundle created by ``batch_upload_from_local`` and extract it."""
+        return asyncio.run(self.download_bundle_async(bundle_name, local_folder))
+    
+    async def download_bundle_async(self, bundle_name: str, local_folder: str) -> List[str]:
+        """Download a tar bundle and extract it into ``local_folder``.
+        
+        Returns the paths of the extracted files.
+        """
+        if not self.blob_storage:
+            raise ValueError("Azure Blob Storage not configured")
+        
+        async with self.blob_storage:
+            bundle_data = await self.blob_storage.download_image(bundle_name)
+        
+        def extract() -> List[str]:
+            os.makedirs(local_folder, exist_ok=True)
+            # Reject absolute paths and links where the tarfile data filter exists
+            extract_kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+            with tarfile.open(fileobj=io.BytesIO(bundle_data), mode='r') as tar:
+                members = tar.getmembers()
+                tar.extractall(local_folder, members=members, **extract_kwargs)
+            return [os.path.join(local_folder, member.name) for member in members if member.isfile()]
+        
+        extracted = await asyncio.to_thread(extract)
+        logger.info(f"Extracted {len(extracted)} files from {bundle_name} to {local_folder}")
+        return extracted
     
-    def _upload_single_file(self, file_path: str, base_folder: str, blob_prefix: str) -> bool:
+    def _get_upload_blob_name(self, file_path: str, base_folder: str, blob_prefix: str) -> str:
+        """Generate the blob name for a local file relative to its base folder."""
+        rel_path = Path(file_path).relative_to(base_folder).as_posix()
+        return f"{blob_prefix}{rel_path}"
+    
+    async def _upload_single_file(self, file_path: str, base_folder: str, blob_prefix: str) -> bool:
         """Upload a single file to blob storage."""
         try:
             # Generate blob name
-            rel_path = os.path.relpath(file_path, base_folder)
-            blob_name = f"{blob_prefix}{rel_path}".replace("\\", "/")
-            
-            # Read file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            blob_name = self._get_upload_blob_name(file_path, base_folder, blob_prefix)
             
             # Determine content type
-            ext = Path(file_path).suffix.lower()
-            content_type_map = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.bmp': 'image/bmp',
-                '.tiff': 'image/tiff',
-                '.tif': 'image/tiff'
-            }
-            content_type = content_type_map.get(ext, 'application/octet-stream')
+            content_type = _suffix_to_mime(Path(file_path).suffix)
             
-            # Upload
-            url = self.blob_storage.upload_image(file_data, blob_name, content_type)
+            # Upload straight from the file handle
+            with open(file_path, 'rb') as f:
+                url = await self.blob_storage.upload_image(f, blob_name, content_type)
             logger.debug(f"Uploaded {file_path} to {url}")
             return True
             
@@ -385,14 +912,26 @@ class AzureImageProcessor:
 
 # Configuration helper functions
 def load_azure_config() -> Dict[str, str]:
-    """Load Azure configuration from environment variables or config file."""
+    """Load Azure configuration from environment variables or config file.
+    
+    The lookup runs once per process; callers get their own copy of the result.
+    """
+    return dict(_load_azure_config_cached())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_azure_config_cached() -> Dict[str, str]:
+    """Read Azure configuration from the environment and config/azure_config.json."""
     config = {}
     
     # Try environment variables first
     env_vars = {
         'blob_connection_string': 'AZURE_STORAGE_CONNECTION_STRING',
         'cv_subscription_key': 'AZURE_CV_SUBSCRIPTION_KEY',
-        'cv_endpoint': 'AZURE_CV_ENDPOINT'
+        'cv_endpoint': 'AZURE_CV_ENDPOINT',
+        'batch_account_url': 'AZURE_BATCH_ACCOUNT_URL',
+        'batch_account_name': 'AZURE_BATCH_ACCOUNT_NAME',
+        'batch_account_key': 'AZURE_BATCH_ACCOUNT_KEY'
     }
     
     for key, env_var in env_vars.items():
@@ -420,7 +959,10 @@ def create_azure_config_template() -> None:
     config_template = {
         "blob_connection_string": "DefaultEndpointsProtocol=https;AccountName=your_account;AccountKey=your_key;EndpointSuffix=core.windows.net",
         "cv_subscription_key": "your_computer_vision_key",
-        "cv_endpoint": "https://your_region.api.cognitive.microsoft.com/"
+        "cv_endpoint": "https://your_region.api.cognitive.microsoft.com/",
+        "batch_account_url": "https://your_batch_account.your_region.batch.azure.com",
+        "batch_account_name": "your_batch_account",
+        "batch_account_key": "your_batch_key"
     }
     
     os.makedirs("config", exist_ok=True)
@@ -450,7 +992,10 @@ if __name__ == "__main__":
             config,
             blob_connection_string=azure_config['blob_connection_string'],
             cv_subscription_key=azure_config.get('cv_subscription_key'),
-            cv_endpoint=azure_config.get('cv_endpoint')
+            cv_endpoint=azure_config.get('cv_endpoint'),
+            batch_account_url=azure_config.get('batch_account_url'),
+            batch_account_name=azure_config.get('batch_account_name'),
+            batch_account_key=azure_config.get('batch_account_key')
         )
         
         print("Azure Image Processor initialized successfully")
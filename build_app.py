@@ -12,6 +12,60 @@ from pathlib import Path
 APP_NAME = "ImageProcessorPro"
 VERSION = "1.0.0"
 
+# Generated spec (kept apart from the hand-maintained ImageProcessorPro.spec)
+GENERATED_SPEC = Path("build") / f"{APP_NAME}_generated.spec"
+
+# Binaries and already-compressed assets gain nothing from DEFLATE
+INCOMPRESSIBLE_SUFFIXES = {".pyd", ".so", ".dll", ".dylib", ".exe", ".zip",
+                           ".png", ".jpg", ".jpeg", ".ico", ".icns"}
+
+# Persist PyInstaller's binary cache between builds
+PYINSTALLER_CACHE_DIR = Path("build") / "pyinstaller-cache"
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_app.py - do not edit
+from concurrent.futures import ThreadPoolExecutor
+from PyInstaller.utils.hooks import collect_all
+
+# Discover package data for both packages in parallel
+with ThreadPoolExecutor(max_workers=2) as pool:
+    collected = list(pool.map(collect_all, ['customtkinter', 'PIL']))
+
+datas = [({config_dir!r}, 'config'), ({src_dir!r}, 'src')]
+binaries = []
+hiddenimports = ['PIL._tkinter_finder', 'customtkinter']
+for pkg_datas, pkg_binaries, pkg_hiddenimports in collected:
+    datas += pkg_datas
+    binaries += pkg_binaries
+    hiddenimports += pkg_hiddenimports
+
+a = Analysis(
+    [{script!r}],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+)
+pyz = PYZ(a.pure)
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={app_name!r},
+    console=False,
+    icon={icon!r},
+)
+coll = COLLECT(exe, a.binaries, a.datas, name={app_name!r})
+"""
+
+MACOS_BUNDLE_TEMPLATE = """app = BUNDLE(
+    coll,
+    name={app_name!r} + '.app',
+    icon={icon!r},
+    bundle_identifier='com.mjwestate.imageprocessorpro',
+)
+"""
+
 def install_pyinstaller():
     """Install PyInstaller if not already installed."""
     try:
@@ -21,30 +75,36 @@ def install_pyinstaller():
         print("Installing PyInstaller...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
 
+def write_spec(icon_path: str, macos_bundle: bool = False) -> Path:
+    """Write the onedir/windowed spec used by the build functions."""
+    icon = os.path.abspath(icon_path) if os.path.exists(icon_path) else None
+    spec = SPEC_TEMPLATE.format(
+        config_dir=os.path.abspath("config"),
+        src_dir=os.path.abspath("src"),
+        script=os.path.abspath("gui_app.py"),
+        app_name=APP_NAME,
+        icon=icon
+    )
+    if macos_bundle:
+        spec += MACOS_BUNDLE_TEMPLATE.format(app_name=APP_NAME, icon=icon)
+    
+    GENERATED_SPEC.parent.mkdir(parents=True, exist_ok=True)
+    GENERATED_SPEC.write_text(spec, encoding="utf-8")
+    return GENERATED_SPEC
+
+def run_pyinstaller(spec_path: Path):
+    """Run PyInstaller in this process instead of spawning a new interpreter."""
+    from PyInstaller.__main__ import run
+    run([str(spec_path), "--noconfirm"])
+
 def build_windows():
     """Build Windows executable."""
     print("\n" + "="*50)
     print("Building Windows Executable...")
     print("="*50 + "\n")
     
-    # PyInstaller command for Windows
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name", APP_NAME,
-        "--onedir",  # Create a folder with exe and dependencies (more reliable)
-        "--windowed",  # No console window
-        "--icon", "assets/icon.ico" if os.path.exists("assets/icon.ico") else "NONE",
-        "--add-data", "config;config",  # Include config folder
-        "--add-data", "src;src",  # Include src folder
-        "--hidden-import", "PIL._tkinter_finder",
-        "--hidden-import", "customtkinter",
-        "--collect-all", "customtkinter",
-        "--collect-all", "PIL",
-        "--noconfirm",
-        "gui_app.py"
-    ]
-    
-    subprocess.run(cmd, check=True)
+    # Onedir (exe + dependencies folder, more reliable), no console window
+    run_pyinstaller(write_spec("assets/icon.ico"))
     
     # Create distribution folder
     dist_folder = Path("dist") / APP_NAME
@@ -58,25 +118,8 @@ def build_macos():
     print("Building macOS Application...")
     print("="*50 + "\n")
     
-    # PyInstaller command for macOS
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name", APP_NAME,
-        "--onedir",
-        "--windowed",
-        "--icon", "assets/icon.icns" if os.path.exists("assets/icon.icns") else "NONE",
-        "--add-data", "config:config",  # macOS uses : instead of ;
-        "--add-data", "src:src",
-        "--hidden-import", "PIL._tkinter_finder",
-        "--hidden-import", "customtkinter",
-        "--collect-all", "customtkinter",
-        "--collect-all", "PIL",
-        "--noconfirm",
-        "--osx-bundle-identifier", "com.mjwestate.imageprocessorpro",
-        "gui_app.py"
-    ]
-    
-    subprocess.run(cmd, check=True)
+    # Onedir .app bundle
+    run_pyinstaller(write_spec("assets/icon.icns", macos_bundle=True))
     
     dist_folder = Path("dist") / APP_NAME
     if dist_folder.exists():
@@ -96,10 +139,13 @@ def create_portable_zip():
     
     print(f"\nCreating portable ZIP: {zip_path}")
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
         for file in dist_folder.rglob('*'):
             arcname = file.relative_to(dist_folder.parent)
-            zipf.write(file, arcname)
+            if file.suffix.lower() in INCOMPRESSIBLE_SUFFIXES:
+                zipf.write(file, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zipf.write(file, arcname)
     
     print(f"✓ Portable ZIP created: {zip_path}")
     print(f"  Size: {zip_path.stat().st_size / (1024*1024):.1f} MB")
@@ -115,6 +161,9 @@ def main():
     # Change to script directory
     os.chdir(Path(__file__).parent)
     
+    # Must be set before PyInstaller is first imported
+    os.environ.setdefault("PYINSTALLER_CONFIG_DIR", str(PYINSTALLER_CACHE_DIR.absolute()))
+    
     # Install PyInstaller
     install_pyinstaller()
     
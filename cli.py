@@ -13,20 +13,82 @@ Optimized for Michael J Wright Estate web image processing:
 """
 
 import argparse
+import functools
+import logging
 import os
+import stat
 import sys
+import time
 from pathlib import Path
-import yaml
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Optional, Type, TYPE_CHECKING
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-from image_processor import ImageProcessor, ProcessingConfig
-from loguru import logger
+if TYPE_CHECKING:
+    from src.image_processor import ImageProcessor, ProcessingConfig
 
+# Stdlib logger until setup_logging() swaps in loguru, so importing this
+# module (or exiting from argparse) never loads loguru
+logger = logging.getLogger("ipp")
 
+# CLI defaults (MJW Estate web optimization), shared by the parser and --generate-config
+_DEFAULTS = MappingProxyType({
+    'long_edge': 1200,
+    'target_size': 300,
+    'subfolder': 'web_optimized',
+    'suffix': '_web',
+    'watermark_text': '© Michael J Wright Estate - Property of',
+    'text_opacity': 25,
+    'text_rotation': -30,
+    'text_spacing': 1.8,
+    'font_size': 0.025,
+    'format': 'JPEG',
+    'quality': 77,
+    'opacity': 0.3,
+    'position': 'bottom-right',
+    'scale': 0.2,
+    'tile_size': 0.18,
+    'tile_spacing': 1.6,
+    'tile_opacity_reduction': 0.7,
+    'max_width': 1920,
+    'max_height': 1080,
+    'pdf_dpi': 200,
+})
+
+# Option choices, shared by the cached parser and _fastparse()
+_OUTPUT_FORMATS = ('JPEG', 'PNG', 'WEBP')
+_WATERMARK_POSITIONS = ('center', 'top-left', 'top-right', 'bottom-left', 'bottom-right')
+_CONFIG_FORMATS = ('yaml', 'json')
+
+
+def _bounded_int(lo: int, hi: int):
+    """Return an argparse type that accepts integers in [lo, hi]."""
+    def convert(value: str) -> int:
+        number = int(value)
+        if not (lo <= number <= hi):
+            raise argparse.ArgumentTypeError(f"must be between {lo} and {hi}, got {number}")
+        return number
+    convert.__name__ = 'int'  # argparse names the type in "invalid int value" errors
+    return convert
+
+
+def _bounded_float(lo: float, hi: float):
+    """Return an argparse type that accepts floats in [lo, hi]."""
+    def convert(value: str) -> float:
+        number = float(value)
+        if not (lo <= number <= hi):
+            raise argparse.ArgumentTypeError(f"must be between {lo} and {hi}, got {number}")
+        return number
+    convert.__name__ = 'float'
+    return convert
+
+
+@functools.lru_cache(maxsize=None)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+    """Create and configure the argument parser.
+    
+    Cached so repeated main() calls in one process reuse the same parser;
+    parse_args() returns a fresh Namespace each time.
+    """
     
     parser = argparse.ArgumentParser(
         description="MJW Estate Web Image Optimizer - Automated watermarking and web optimization",
@@ -45,7 +107,7 @@ Examples:
   # Use configuration file
   python cli.py --config "my_settings.yaml"
   
-  # Generate default config
+  # Generate default config (add --scaffold to create input/ and watermarks/)
   python cli.py --generate-config "default.yaml"
         """
     )
@@ -58,65 +120,65 @@ Examples:
     parser.add_argument('-w', '--watermark', type=str, help='Path to watermark PNG file (optional, uses text by default)')
     
     # Web optimization settings (new defaults for MJW Estate)
-    parser.add_argument('--long-edge', type=int, default=1200,
-                       help='Long edge size in pixels for paintings (default: 1200)')
-    parser.add_argument('--target-size', type=int, default=300,
-                       help='Target max file size in KB (default: 300)')
-    parser.add_argument('--subfolder', type=str, default='web_optimized',
-                       help='Name of output subfolder (default: web_optimized)')
-    parser.add_argument('--suffix', type=str, default='_web',
-                       help='Filename suffix for processed files (default: _web)')
+    parser.add_argument('--long-edge', type=int, default=_DEFAULTS['long_edge'],
+                       help='Long edge size in pixels for paintings (default: %(default)s)')
+    parser.add_argument('--target-size', type=int, default=_DEFAULTS['target_size'],
+                       help='Target max file size in KB (default: %(default)s)')
+    parser.add_argument('--subfolder', type=str, default=_DEFAULTS['subfolder'],
+                       help='Name of output subfolder (default: %(default)s)')
+    parser.add_argument('--suffix', type=str, default=_DEFAULTS['suffix'],
+                       help='Filename suffix for processed files (default: %(default)s)')
     
     # Text watermark settings (new)
     parser.add_argument('--watermark-text', type=str, 
-                       default='© Michael J Wright Estate - Property of',
+                       default=_DEFAULTS['watermark_text'],
                        help='Text watermark to apply across images')
-    parser.add_argument('--text-opacity', type=int, default=25, metavar='0-255',
-                       help='Text watermark opacity (0=invisible, 255=solid, default: 25)')
-    parser.add_argument('--text-rotation', type=int, default=-30,
-                       help='Text rotation angle in degrees (default: -30)')
-    parser.add_argument('--text-spacing', type=float, default=1.8,
-                       help='Text spacing ratio (default: 1.8)')
-    parser.add_argument('--font-size', type=float, default=0.025,
-                       help='Font size as ratio of image width (default: 0.025)')
+    parser.add_argument('--text-opacity', type=int, default=_DEFAULTS['text_opacity'], metavar='0-255',
+                       help='Text watermark opacity (0=invisible, 255=solid, default: %(default)s)')
+    parser.add_argument('--text-rotation', type=int, default=_DEFAULTS['text_rotation'],
+                       help='Text rotation angle in degrees (default: %(default)s)')
+    parser.add_argument('--text-spacing', type=float, default=_DEFAULTS['text_spacing'],
+                       help='Text spacing ratio (default: %(default)s)')
+    parser.add_argument('--font-size', type=float, default=_DEFAULTS['font_size'],
+                       help='Font size as ratio of image width (default: %(default)s)')
     parser.add_argument('--no-text-watermark', action='store_true',
                        help='Disable text watermark (use image watermark instead)')
     
     # Output settings
-    parser.add_argument('--format', choices=['JPEG', 'PNG', 'WEBP'], default='JPEG',
-                       help='Output image format (default: JPEG)')
-    parser.add_argument('--quality', type=int, default=77, metavar='1-100',
-                       help='Output quality for JPEG/WEBP (default: 77)')
+    parser.add_argument('--format', choices=_OUTPUT_FORMATS, default=_DEFAULTS['format'],
+                       help='Output image format (default: %(default)s)')
+    parser.add_argument('--quality', type=_bounded_int(1, 100), default=_DEFAULTS['quality'], metavar='1-100',
+                       help='Output quality for JPEG/WEBP (default: %(default)s)')
     
     # Image watermark settings (legacy/optional)
-    parser.add_argument('--opacity', type=float, default=0.3, metavar='0.1-1.0',
-                       help='Image watermark opacity (default: 0.3)')
-    parser.add_argument('--position', choices=['center', 'top-left', 'top-right', 'bottom-left', 'bottom-right'],
-                       default='bottom-right', help='Image watermark position (default: bottom-right)')
-    parser.add_argument('--scale', type=float, default=0.2, metavar='0.05-0.5',
-                       help='Image watermark scale relative to image size (default: 0.2)')
+    parser.add_argument('--opacity', type=_bounded_float(0.1, 1.0), default=_DEFAULTS['opacity'], metavar='0.1-1.0',
+                       help='Image watermark opacity (default: %(default)s)')
+    parser.add_argument('--position', choices=_WATERMARK_POSITIONS,
+                       default=_DEFAULTS['position'], help='Image watermark position (default: %(default)s)')
+    parser.add_argument('--scale', type=_bounded_float(0.05, 0.5), default=_DEFAULTS['scale'], metavar='0.05-0.5',
+                       help='Image watermark scale relative to image size (default: %(default)s)')
     
     # Tiled watermark settings
     parser.add_argument('--no-tiling', action='store_true',
                        help='Use single watermark instead of tiled pattern')
-    parser.add_argument('--tile-size', type=float, default=0.18, metavar='0.1-0.3',
-                       help='Size of each tile in tiled pattern (default: 0.18)')
-    parser.add_argument('--tile-spacing', type=float, default=1.6, metavar='1.0-3.0',
-                       help='Spacing between tiles as multiplier (default: 1.6)')
-    parser.add_argument('--tile-opacity-reduction', type=float, default=0.7, metavar='0.3-1.0',
-                       help='Opacity reduction for tiled watermarks (default: 0.7)')
+    parser.add_argument('--tile-size', type=float, default=_DEFAULTS['tile_size'], metavar='0.1-0.3',
+                       help='Size of each tile in tiled pattern (default: %(default)s)')
+    parser.add_argument('--tile-spacing', type=float, default=_DEFAULTS['tile_spacing'], metavar='1.0-3.0',
+                       help='Spacing between tiles as multiplier (default: %(default)s)')
+    parser.add_argument('--tile-opacity-reduction', type=float, default=_DEFAULTS['tile_opacity_reduction'], metavar='0.3-1.0',
+                       help='Opacity reduction for tiled watermarks (default: %(default)s)')
     
     # Image size settings (legacy)
-    parser.add_argument('--max-width', type=int, default=1920,
-                       help='Maximum output width - legacy (default: 1920)')
-    parser.add_argument('--max-height', type=int, default=1080,
-                       help='Maximum output height - legacy (default: 1080)')
+    parser.add_argument('--max-width', type=int, default=_DEFAULTS['max_width'],
+                       help='Maximum output width - legacy (default: %(default)s)')
+    parser.add_argument('--max-height', type=int, default=_DEFAULTS['max_height'],
+                       help='Maximum output height - legacy (default: %(default)s)')
     parser.add_argument('--no-preserve-aspect', action='store_true',
                        help='Do not preserve aspect ratio when resizing')
     
     # PDF settings
-    parser.add_argument('--pdf-dpi', type=int, default=200,
-                       help='DPI for PDF to image conversion (default: 200)')
+    parser.add_argument('--pdf-dpi', type=int, default=_DEFAULTS['pdf_dpi'],
+                       help='DPI for PDF to image conversion (default: %(default)s)')
     
     # Performance settings
     parser.add_argument('--no-multiprocessing', action='store_true',
@@ -127,10 +189,16 @@ Examples:
     # Configuration
     parser.add_argument('--config', type=str,
                        help='Load settings from YAML configuration file')
+    parser.add_argument('--no-config-cache', action='store_true',
+                       help='Always re-parse --config instead of using the cached parse')
     parser.add_argument('--save-config', type=str,
-                       help='Save current settings to YAML file and exit')
+                       help='Save current settings to a YAML or JSON (.json) file and exit')
+    parser.add_argument('--config-format', choices=_CONFIG_FORMATS,
+                       help='Format for --config/--save-config (default: from file extension)')
     parser.add_argument('--generate-config', type=str,
                        help='Generate a default configuration file and exit')
+    parser.add_argument('--scaffold', action='store_true',
+                       help='With --generate-config, also create example input/ and watermarks/ folders')
     
     # Other options
     parser.add_argument('--dry-run', action='store_true',
@@ -143,34 +211,140 @@ Examples:
     return parser
 
 
+def reset_parser_cache() -> None:
+    """Drop the cached parser so the next create_parser() call rebuilds it."""
+    create_parser.cache_clear()
+
+
+# Flags that may accompany --generate-config on the minimal-parser fast path
+_GENERATE_CONFIG_FLAGS = {'-v', '--verbose', '-q', '--quiet', '--scaffold'}
+
+
+def _sniff_fast_path(argv: List[str]) -> Optional[str]:
+    """Return 'generate-config' if argv only asks for config generation, else None.
+    
+    Lets main() skip building the full parser for that path; anything else
+    (including --help, which needs every option) goes through create_parser().
+    """
+    tokens = iter(argv)
+    found = False
+    for token in tokens:
+        if token == '--generate-config':
+            if next(tokens, None) is None:
+                return None
+            found = True
+        elif token.startswith('--generate-config='):
+            found = True
+        elif token not in _GENERATE_CONFIG_FLAGS:
+            return None
+    return 'generate-config' if found else None
+
+
+# Every option's default, for namespaces built without argparse
+_NAMESPACE_DEFAULTS = MappingProxyType({
+    **_DEFAULTS,
+    'input': None, 'output': None, 'watermark': None,
+    'no_text_watermark': False, 'no_tiling': False, 'no_preserve_aspect': False,
+    'no_multiprocessing': False, 'max_workers': None,
+    'config': None, 'no_config_cache': False, 'save_config': None,
+    'config_format': None, 'generate_config': None, 'scaffold': False,
+    'dry_run': False, 'verbose': False, 'quiet': False,
+})
+
+# Options understood by _fastparse(): value-taking options map to their dest,
+# flags to the dest they switch on
+_FAST_VALUE_OPTIONS = {'-i': 'input', '--input': 'input', '-o': 'output',
+                       '--output': 'output', '--config': 'config',
+                       '--save-config': 'save_config', '--config-format': 'config_format'}
+_FAST_FLAG_OPTIONS = {'-v': 'verbose', '--verbose': 'verbose', '-q': 'quiet',
+                      '--quiet': 'quiet', '--dry-run': 'dry_run',
+                      '--no-config-cache': 'no_config_cache'}
+_FAST_CHOICES = {'config_format': _CONFIG_FORMATS}
+
+
+def _fastparse(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the common invocations without building the full parser.
+    
+    Handles -i/--input, -o/--output, --config, --save-config,
+    --config-format, --no-config-cache, -v, -q and --dry-run. Returns
+    None for anything else (including --help) so main() falls back to
+    create_parser(), which also produces argparse's usual error messages.
+    """
+    values = dict(_NAMESPACE_DEFAULTS)
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _FAST_FLAG_OPTIONS:
+            values[_FAST_FLAG_OPTIONS[token]] = True
+            continue
+        
+        option, sep, value = token.partition('=')
+        if option not in _FAST_VALUE_OPTIONS or (sep and not option.startswith('--')):
+            return None
+        if not sep:
+            value = next(tokens, None)
+            if value is None or value.startswith('-'):
+                return None
+        dest = _FAST_VALUE_OPTIONS[option]
+        if dest in _FAST_CHOICES and value not in _FAST_CHOICES[dest]:
+            return None
+        values[dest] = value
+    
+    return argparse.Namespace(**values)
+
+
+def create_generate_config_parser() -> argparse.ArgumentParser:
+    """Create the minimal parser used for --generate-config."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--generate-config', type=str, required=True)
+    parser.add_argument('--scaffold', action='store_true')
+    parser.add_argument('--verbose', '-v', action='store_true')
+    parser.add_argument('--quiet', '-q', action='store_true')
+    return parser
+
+
+def _import_image_processor() -> tuple:
+    """Import the image pipeline (PIL, OpenCV, PyMuPDF) on first use."""
+    from src.image_processor import ImageProcessor, ProcessingConfig
+    return ImageProcessor, ProcessingConfig
+
+
+# Sink formats; only --verbose pays for timestamp formatting
+_LOG_FORMAT_QUIET = "<red>ERROR</red>: {message}"
+_LOG_FORMAT_VERBOSE = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | {message}"
+_LOG_FORMAT_DEFAULT = "{level}: {message}"
+
+
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Setup logging configuration."""
+    global logger
+    from loguru import logger as loguru_logger
+    logger = loguru_logger
     
     # Remove default logger
     logger.remove()
+    colorize = sys.stderr.isatty()
     
     if quiet:
         # Only show errors
-        logger.add(sys.stderr, level="ERROR", format="<red>ERROR</red>: {message}")
+        logger.add(sys.stderr, level="ERROR", format=_LOG_FORMAT_QUIET, colorize=colorize)
     elif verbose:
         # Show debug and above
-        logger.add(sys.stderr, level="DEBUG", 
-                  format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | {message}")
+        logger.add(sys.stderr, level="DEBUG", format=_LOG_FORMAT_VERBOSE, colorize=colorize)
     else:
         # Show info and above
-        logger.add(sys.stderr, level="INFO", format="<level>{level}</level>: {message}")
+        logger.add(sys.stderr, level="INFO", format=_LOG_FORMAT_DEFAULT, colorize=colorize)
 
 
-def validate_args(args: argparse.Namespace) -> bool:
-    """Validate command line arguments."""
-    
-    if args.config:
-        # Config file will be validated when loaded
-        return True
-    
-    if args.generate_config or args.save_config:
-        # No validation needed for config generation
-        return True
+def _try_stat(path: str) -> Optional[os.stat_result]:
+    """Return os.stat(path), or None if the path cannot be stat'ed."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _validate_cheap(args: argparse.Namespace) -> bool:
+    """In-memory argument checks; no filesystem access."""
     
     # Check required arguments
     if not args.input:
@@ -181,36 +355,53 @@ def validate_args(args: argparse.Namespace) -> bool:
     # if not args.output:
     #     logger.info("No output folder specified - will create subfolder in input directory")
     
-    # Check input folder exists
-    if not os.path.exists(args.input):
+    # Quality, opacity and scale ranges are enforced by their argparse types
+    return True
+
+
+def _validate_fs(args: argparse.Namespace) -> bool:
+    """Filesystem checks, one stat per path."""
+    
+    # Check input folder exists (stat result is kept for main()'s final check)
+    st = _try_stat(args.input)
+    if st is None:
         logger.error(f"Input folder does not exist: {args.input}")
         return False
+    if not stat.S_ISDIR(st.st_mode):
+        logger.error(f"Input path is not a directory: {args.input}")
+        return False
+    args._input_stat = st
     
     # Check watermark file if specified
-    if args.watermark and not os.path.exists(args.watermark):
+    if args.watermark and _try_stat(args.watermark) is None:
         logger.error(f"Watermark file does not exist: {args.watermark}")
         return False
     
-    # Validate ranges
-    if not (1 <= args.quality <= 100):
-        logger.error("Quality must be between 1 and 100")
-        return False
+    return True
+
+
+def validate_args(args: argparse.Namespace) -> bool:
+    """Validate command line arguments.
     
-    if not (0.1 <= args.opacity <= 1.0):
-        logger.error("Opacity must be between 0.1 and 1.0")
-        return False
+    Cheap in-memory checks run first; the filesystem is only probed if they pass.
+    """
     
-    if not (0.05 <= args.scale <= 0.5):
-        logger.error("Scale must be between 0.05 and 0.5")
-        return False
+    if args.config:
+        # Config file will be validated when loaded
+        return True
     
-    return True
+    if args.generate_config or args.save_config:
+        # No validation needed for config generation
+        return True
+    
+    return _validate_cheap(args) and _validate_fs(args)
 
 
-def args_to_config(args: argparse.Namespace) -> ProcessingConfig:
+def args_to_config(args: argparse.Namespace,
+                   config_cls: Type['ProcessingConfig']) -> 'ProcessingConfig':
     """Convert command line arguments to ProcessingConfig."""
     
-    return ProcessingConfig(
+    return config_cls(
         input_folder=args.input or "",
         output_folder=args.output or args.input or "",  # Default to input folder for subfolder mode
         watermark_path=args.watermark or "",
@@ -257,114 +448,204 @@ def args_to_config(args: argparse.Namespace) -> ProcessingConfig:
     )
 
 
-def generate_default_config(output_path: str) -> None:
-    """Generate a default configuration file for MJW Estate web optimization."""
+def generate_default_config(output_path: str, config_cls: Type['ProcessingConfig'],
+                            scaffold: bool = False) -> None:
+    """Generate a default configuration file for MJW Estate web optimization.
+    
+    With ``scaffold``, also create the example input/ and watermarks/ folders.
+    """
     
-    config = ProcessingConfig(
+    config = config_cls(
         input_folder="input",
         output_folder="input",  # Subfolder mode
         # Text watermark
         use_text_watermark=True,
-        watermark_text="© Michael J Wright Estate - Property of",
-        text_watermark_opacity=25,
-        text_rotation_angle=-30,
-        text_spacing_ratio=1.8,
-        text_font_size_ratio=0.025,
+        watermark_text=_DEFAULTS['watermark_text'],
+        text_watermark_opacity=_DEFAULTS['text_opacity'],
+        text_rotation_angle=_DEFAULTS['text_rotation'],
+        text_spacing_ratio=_DEFAULTS['text_spacing'],
+        text_font_size_ratio=_DEFAULTS['font_size'],
         # Web optimization
-        long_edge_pixels=1200,
+        long_edge_pixels=_DEFAULTS['long_edge'],
         output_dpi=72,
         convert_to_srgb=True,
-        jpeg_quality=77,
-        target_max_size_kb=300,
-        web_output_suffix="_web",
+        jpeg_quality=_DEFAULTS['quality'],
+        target_max_size_kb=_DEFAULTS['target_size'],
+        web_output_suffix=_DEFAULTS['suffix'],
         create_subfolder=True,
-        subfolder_name="web_optimized",
-        output_format="JPEG"
+        subfolder_name=_DEFAULTS['subfolder'],
+        output_format=_DEFAULTS['format']
     )
     
     config.save_to_file(output_path)
     logger.info(f"Default configuration saved to: {output_path}")
     
-    # Also create example folder structure
-    os.makedirs("input", exist_ok=True)
-    os.makedirs("watermarks", exist_ok=True)
+    if not scaffold:
+        return
+    
+    # Example folder structure
+    for folder in ("input", "watermarks"):
+        if not os.path.isdir(folder):
+            os.mkdir(folder)
     
     logger.info("Created example folder structure: input/, watermarks/")
 
 
-def run_dry_run(processor: ImageProcessor) -> None:
+def _fast_scan(root: str, exts: frozenset, skip_dir: str = "", skip_suffix: str = "") -> Iterator[str]:
+    """Yield supported files under root using os.scandir (no per-file stat).
+    
+    Mirrors ImageProcessor.get_image_files() exclusions: directories named
+    skip_dir and files whose stem ends with skip_suffix (both lowercase).
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if entry.is_dir():
+                        if not entry.is_symlink() and name != skip_dir:
+                            stack.append(entry.path)
+                        continue
+                    stem, ext = os.path.splitext(name)
+                    if ext in exts and not (skip_suffix and stem.endswith(skip_suffix)):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def run_dry_run(processor: 'ImageProcessor') -> None:
     """Run a dry run to show what would be processed."""
     
-    input_files = processor.get_image_files(processor.config.input_folder)
+    config = processor.config
+    input_files = sorted(_fast_scan(
+        config.input_folder,
+        processor.supported_formats,
+        skip_dir=(config.subfolder_name or "web_optimized").lower(),
+        skip_suffix=(config.web_output_suffix or "_web").lower(),
+    ))
     
     if not input_files:
-        logger.warning(f"No supported files found in {processor.config.input_folder}")
+        logger.warning(f"No supported files found in {config.input_folder}")
         return
     
-    logger.info(f"Dry run - Would process {len(input_files)} files:")
-    logger.info(f"Input folder: {processor.config.input_folder}")
+    lines = [
+        f"Dry run - Would process {len(input_files)} files:",
+        f"Input folder: {config.input_folder}",
+    ]
     
     # Show output location
-    if processor.config.create_subfolder:
-        output_loc = os.path.join(processor.config.input_folder, processor.config.subfolder_name)
-        logger.info(f"Output folder: {output_loc} (subfolder)")
+    if config.create_subfolder:
+        output_loc = Path(config.input_folder) / config.subfolder_name
+        lines.append(f"Output folder: {output_loc} (subfolder)")
     else:
-        logger.info(f"Output folder: {processor.config.output_folder}")
+        lines.append(f"Output folder: {config.output_folder}")
     
-    logger.info(f"Output format: {processor.config.output_format}")
-    logger.info(f"Quality: {processor.config.jpeg_quality}")
-    logger.info(f"Target size: < {processor.config.target_max_size_kb} KB")
-    
-    # Web optimization settings
-    logger.info(f"Long edge: {processor.config.long_edge_pixels}px")
-    logger.info(f"DPI: {processor.config.output_dpi}")
-    logger.info(f"sRGB conversion: {processor.config.convert_to_srgb}")
-    logger.info(f"File suffix: {processor.config.web_output_suffix}")
+    lines += [
+        f"Output format: {config.output_format}",
+        f"Quality: {config.jpeg_quality}",
+        f"Target size: < {config.target_max_size_kb} KB",
+        # Web optimization settings
+        f"Long edge: {config.long_edge_pixels}px",
+        f"DPI: {config.output_dpi}",
+        f"sRGB conversion: {config.convert_to_srgb}",
+        f"File suffix: {config.web_output_suffix}",
+    ]
     
     # Watermark info
-    if processor.config.use_text_watermark:
-        logger.info(f"Text watermark: '{processor.config.watermark_text}'")
-        logger.info(f"  Opacity: {processor.config.text_watermark_opacity}/255")
-        logger.info(f"  Rotation: {processor.config.text_rotation_angle}°")
-    elif processor.config.watermark_path:
-        logger.info(f"Image watermark: {processor.config.watermark_path}")
-        logger.info(f"  Opacity: {processor.config.watermark_opacity}")
-        logger.info(f"  Position: {processor.config.watermark_position}")
+    if config.use_text_watermark:
+        lines += [
+            f"Text watermark: '{config.watermark_text}'",
+            f"  Opacity: {config.text_watermark_opacity}/255",
+            f"  Rotation: {config.text_rotation_angle}°",
+        ]
+    elif config.watermark_path:
+        lines += [
+            f"Image watermark: {config.watermark_path}",
+            f"  Opacity: {config.watermark_opacity}",
+            f"  Position: {config.watermark_position}",
+        ]
     else:
-        logger.info("Watermark: None")
+        lines.append("Watermark: None")
     
-    logger.info(f"Multiprocessing: {processor.config.use_multiprocessing}")
+    lines.append(f"Multiprocessing: {config.use_multiprocessing}")
     
-    if processor.config.max_workers:
-        logger.info(f"Max workers: {processor.config.max_workers}")
+    if config.max_workers:
+        lines.append(f"Max workers: {config.max_workers}")
     
-    logger.info("\nFiles to process:")
+    lines.append("\nFiles to process:")
+    # _fast_scan() joins onto input_folder, so a plain prefix strip suffices
+    input_root = Path(config.input_folder)
     for i, file_path in enumerate(input_files[:10], 1):  # Show first 10 files
-        rel_path = os.path.relpath(file_path, processor.config.input_folder)
-        logger.info(f"  {i}. {rel_path}")
+        lines.append(f"  {i}. {Path(file_path).relative_to(input_root)}")
     
     if len(input_files) > 10:
-        logger.info(f"  ... and {len(input_files) - 10} more files")
+        lines.append(f"  ... and {len(input_files) - 10} more files")
+    
+    # One log call for the whole block
+    logger.info("\n".join(lines))
+
+
+def _noop_progress(current: int, total: int) -> None:
+    """Progress callback for --quiet."""
+
+
+# Report progress at least this often (seconds), even between 1% steps
+PROGRESS_INTERVAL = 0.25
 
 
-def main():
+def _make_progress_callback() -> Callable[[int, int], None]:
+    """Build a throttled progress callback.
+    
+    Reports every 1%, every PROGRESS_INTERVAL seconds and on the last file,
+    through loguru like every other line on stderr (the processor's tqdm bar
+    and per-file logs share that stream, so nothing is redrawn in place).
+    """
+    last = [0, 0.0]  # last reported count, monotonic time
+    
+    def progress(current: int, total: int) -> None:
+        now = time.monotonic()
+        if not (current == total or current - last[0] >= max(1, total // 100)
+                or now - last[1] >= PROGRESS_INTERVAL):
+            return
+        last[0], last[1] = current, now
+        logger.info("Progress: {}/{} ({:.1f}%)", current, total, current * 100 / total)
+    
+    return progress
+
+
+def main(argv: Optional[List[str]] = None):
     """Main CLI function."""
     
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if _sniff_fast_path(argv) == 'generate-config':
+        args = create_generate_config_parser().parse_args(argv)
+        setup_logging(args.verbose, args.quiet)
+        _, ProcessingConfig = _import_image_processor()
+        generate_default_config(args.generate_config, ProcessingConfig, args.scaffold)
+        return 0
+    
+    args = _fastparse(argv)
+    if args is None:
+        args = create_parser().parse_args(argv)
     
     # Setup logging
     setup_logging(args.verbose, args.quiet)
     
+    # Heavy imports (PIL, OpenCV, PyMuPDF) only once arguments are known to be valid
+    ImageProcessor, ProcessingConfig = _import_image_processor()
+    
     # Handle config generation
     if args.generate_config:
-        generate_default_config(args.generate_config)
+        generate_default_config(args.generate_config, ProcessingConfig, args.scaffold)
         return 0
     
     # Load configuration
     if args.config:
         try:
-            config = ProcessingConfig.load_from_file(args.config)
+            config = ProcessingConfig.load_from_file(args.config, use_cache=not args.no_config_cache,
+                                                  fmt=args.config_format)
             logger.info(f"Loaded configuration from: {args.config}")
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
@@ -374,20 +655,22 @@ def main():
         if not validate_args(args):
             return 1
         
-        config = args_to_config(args)
+        config = args_to_config(args, ProcessingConfig)
     
     # Handle config saving
     if args.save_config:
         try:
-            config.save_to_file(args.save_config)
+            config.save_to_file(args.save_config, fmt=args.config_format)
             logger.info(f"Configuration saved to: {args.save_config}")
             return 0
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return 1
     
-    # Final validation
-    if not config.input_folder or not os.path.exists(config.input_folder):
+    # Final validation (validate_args already stat'ed the input folder on the CLI path)
+    input_checked = (getattr(args, '_input_stat', None) is not None
+                     and config.input_folder == args.input)
+    if not config.input_folder or not (input_checked or os.path.exists(config.input_folder)):
         logger.error("Valid input folder is required")
         return 1
     
@@ -406,22 +689,15 @@ def main():
             return 0
         
         # Run actual processing
-        logger.info("Starting MJW Estate web image processing...")
-        logger.info(f"Input: {config.input_folder}")
-        
-        if config.create_subfolder:
-            output_loc = os.path.join(config.input_folder, config.subfolder_name)
-            logger.info(f"Output: {output_loc}")
-        else:
-            logger.info(f"Output: {config.output_folder}")
-        
-        logger.info(f"Settings: {config.long_edge_pixels}px, {config.output_dpi} DPI, JPEG {config.jpeg_quality}%, < {config.target_max_size_kb}KB")
-        
-        def progress_callback(current: int, total: int):
-            if not args.quiet:
-                percentage = (current / total) * 100
-                logger.info(f"Progress: {current}/{total} ({percentage:.1f}%)")
+        output_loc = os.path.join(config.input_folder, config.subfolder_name) if config.create_subfolder else None
+        logger.info("\n".join([
+            "Starting MJW Estate web image processing...",
+            f"Input: {config.input_folder}",
+            f"Output: {output_loc or config.output_folder}",
+            f"Settings: {config.long_edge_pixels}px, {config.output_dpi} DPI, JPEG {config.jpeg_quality}%, < {config.target_max_size_kb}KB",
+        ]))
         
+        progress_callback = _noop_progress if args.quiet else _make_progress_callback()
         results = processor.process_folder(progress_callback)
         
         # Report results
@@ -429,13 +705,15 @@ def main():
         failed_count = results.get('failed', 0)
         total_count = results.get('total', 0)
         
-        logger.info(f"Processing complete!")
-        logger.info(f"  Successfully processed: {success_count} files")
-        logger.info(f"  Failed: {failed_count} files")
-        logger.info(f"  Total: {total_count} files")
-        
-        if config.create_subfolder:
-            logger.info(f"  Output saved to: {os.path.join(config.input_folder, config.subfolder_name)}")
+        summary = [
+            "Processing complete!",
+            f"  Successfully processed: {success_count} files",
+            f"  Failed: {failed_count} files",
+            f"  Total: {total_count} files",
+        ]
+        if output_loc:
+            summary.append(f"  Output saved to: {output_loc}")
+        logger.info("\n".join(summary))
         
         if failed_count > 0:
             logger.warning(f"{failed_count} files failed to process. Check logs for details.")
@@ -10,16 +10,51 @@ import os
 import sys
 import subprocess
 import platform
+import functools
+import shutil
 from pathlib import Path
 import json
 
+_SYSTEM, _RELEASE, _MACHINE = platform.system(), platform.release(), platform.machine()
+
+@functools.lru_cache(maxsize=16)
+def _load_font(size):
+    """Load Arial at the given size (cached), falling back to PIL's default font."""
+    from PIL import ImageFont
+    
+    try:
+        if _SYSTEM == "Windows":
+            return ImageFont.truetype('arial.ttf', size)
+        return ImageFont.truetype('/System/Library/Fonts/Arial.ttf', size)
+    except OSError:
+        return ImageFont.load_default()
+
+class _PhaseLog:
+    """Collect a setup phase's status lines and write them in one go."""
+    
+    def __init__(self, title=None):
+        self.lines = ["", "="*50, title, "="*50] if title else []
+    
+    def __call__(self, message=""):
+        self.lines.append(message)
+    
+    def flush(self):
+        sys.stdout.write("\n".join(self.lines) + "\n")
+        sys.stdout.flush()
+        self.lines = []
+
 def run_command(command, description=""):
-    """Run a command and handle errors."""
+    """Run a command and handle errors.
+    
+    ``command`` is either an argv list (run directly, no shell) or a string
+    (run through the shell).
+    """
+    is_argv = isinstance(command, (list, tuple))
     print(f"\n{description}")
-    print(f"Running: {command}")
+    print(f"Running: {subprocess.list2cmdline(command) if is_argv else command}")
     
     try:
-        result = subprocess.run(command, shell=True, check=True, 
+        result = subprocess.run(command, shell=not is_argv, check=True, 
                               capture_output=True, text=True)
         if result.stdout:
             print(result.stdout)
@@ -41,18 +76,64 @@ def check_python_version():
     print(f"✓ Python {version.major}.{version.minor}.{version.micro} detected")
     return True
 
-def install_core_dependencies():
-    """Install core dependencies."""
-    print("\n" + "="*50)
-    print("Installing Core Dependencies")
-    print("="*50)
+# package -> (description, importable module used to verify the install)
+OPTIONAL_PACKAGES = {
+    "flask": ("HTTP API server support", "flask"),
+    "azure-storage-blob": ("Azure Blob Storage integration", "azure.storage.blob"), 
+    "azure-cognitiveservices-vision-computervision": ("Azure Computer Vision",
+                                                      "azure.cognitiveservices.vision.computervision"),
+    "watchdog": ("File system monitoring", "watchdog"),
+    "psutil": ("System monitoring", "psutil"),
+    "requests": ("HTTP client for API calls", "requests")
+}
+
+def read_requirements(path="requirements.txt"):
+    """Return the requirement specifiers in a requirements file."""
+    with open(path) as f:
+        lines = (line.split('#', 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+def install_dependencies():
+    """Install core and optional dependencies in a single pip run.
+    
+    Falls back to separate core/optional installs if the combined run fails,
+    so a broken optional package can't block the core set. Returns False
+    only if the core dependencies could not be installed.
+    """
+    _PhaseLog("Installing Dependencies").flush()
     
     # Upgrade pip first
-    run_command("python -m pip install --upgrade pip", 
+    run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], 
                 "Upgrading pip...")
     
+    try:
+        core = read_requirements()
+    except OSError as e:
+        print(f"Error: could not read requirements.txt: {e}")
+        return False
+    
+    if run_command([sys.executable, "-m", "pip", "install", *core, *OPTIONAL_PACKAGES],
+                   "Installing core and optional packages..."):
+        print(f"\n✓ Successfully installed: {', '.join(OPTIONAL_PACKAGES)}")
+        return True
+    
+    print("Combined install failed - installing core and optional packages separately")
+    if not install_core_dependencies(upgrade_pip=False):
+        return False
+    install_optional_dependencies()
+    return True
+
+def install_core_dependencies(upgrade_pip=True):
+    """Install core dependencies."""
+    _PhaseLog("Installing Core Dependencies").flush()
+    
+    # Upgrade pip first
+    if upgrade_pip:
+        run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], 
+                    "Upgrading pip...")
+    
     # Install core requirements
-    if not run_command("pip install -r requirements.txt", 
+    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
                       "Installing core requirements..."):
         print("Warning: Some core dependencies failed to install")
         return False
@@ -61,28 +142,33 @@ def install_core_dependencies():
 
 def install_optional_dependencies():
     """Install optional dependencies for enhanced features."""
-    print("\n" + "="*50)
-    print("Installing Optional Dependencies")
-    print("="*50)
-    
-    optional_packages = {
-        "flask": "HTTP API server support",
-        "azure-storage-blob": "Azure Blob Storage integration", 
-        "azure-cognitiveservices-vision-computervision": "Azure Computer Vision",
-        "watchdog": "File system monitoring",
-        "psutil": "System monitoring",
-        "requests": "HTTP client for API calls"
-    }
-    
-    installed = []
-    failed = []
-    
-    for package, description in optional_packages.items():
-        print(f"\nInstalling {package} ({description})...")
-        if run_command(f"pip install {package}"):
-            installed.append(package)
-        else:
-            failed.append(package)
+    _PhaseLog("Installing Optional Dependencies").flush()
+    
+    optional_packages = OPTIONAL_PACKAGES
+    
+    for package, (description, _) in optional_packages.items():
+        print(f"  {package}: {description}")
+    
+    # One pip run resolves the whole set
+    if run_command([sys.executable, "-m", "pip", "install", *optional_packages],
+                   "Installing optional packages..."):
+        installed = list(optional_packages)
+        failed = []
+    else:
+        # pip aborts the whole batch on one bad package, so retry the missing ones individually
+        import importlib.util
+        installed = []
+        failed = []
+        for package, (description, module) in optional_packages.items():
+            try:
+                available = importlib.util.find_spec(module) is not None
+            except ImportError:
+                available = False
+            if available or run_command([sys.executable, "-m", "pip", "install", package],
+                                        f"Installing {package} ({description})..."):
+                installed.append(package)
+            else:
+                failed.append(package)
     
     print(f"\n✓ Successfully installed: {', '.join(installed)}")
     if failed:
@@ -92,9 +178,7 @@ def install_optional_dependencies():
 
 def setup_folders():
     """Create necessary project folders."""
-    print("\n" + "="*50)
-    print("Setting Up Project Folders")
-    print("="*50)
+    _PhaseLog("Setting Up Project Folders").flush()
     
     folders = [
         "input",
@@ -108,57 +192,82 @@ def setup_folders():
     ]
     
     for folder in folders:
-        folder_path = Path(folder)
-        folder_path.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Created: {folder}")
+        Path(folder).mkdir(parents=True, exist_ok=True)
+    print("\n".join(f"✓ Created: {folder}" for folder in folders))
+
+POPPLER_URL = "https://github.com/oschwartz10612/poppler-windows/releases/download/v24.08.0-0/Release-24.08.0-0.zip"
+
+def _download_poppler():
+    """Download and extract the Windows Poppler release into ./poppler.
+    
+    Streams the archive to disk with urllib and unpacks it with zipfile,
+    falling back to PowerShell if that fails.
+    """
+    import urllib.request
+    import zipfile
+    
+    try:
+        print("\nDownloading Poppler...")
+        with urllib.request.urlopen(POPPLER_URL) as response, open("poppler.zip", "wb") as f:
+            shutil.copyfileobj(response, f, length=1 << 20)
+        print("Extracting Poppler...")
+        with zipfile.ZipFile("poppler.zip") as archive:
+            archive.extractall("poppler")
+        return True
+    except Exception as e:
+        print(f"Error: {e}")
+    
+    download_cmd = f'Invoke-WebRequest -Uri "{POPPLER_URL}" -OutFile "poppler.zip"'
+    extract_cmd = 'Expand-Archive -Path "poppler.zip" -DestinationPath "poppler" -Force'
+    return (run_command(["powershell", "-NoProfile", "-Command", download_cmd], "Downloading Poppler...")
+            and run_command(["powershell", "-NoProfile", "-Command", extract_cmd], "Extracting Poppler..."))
 
 def setup_poppler():
     """Setup Poppler for PDF processing if not already available"""
-    print("\n" + "="*50)
-    print("Setting Up Poppler for PDF Processing")
-    print("="*50)
+    _PhaseLog("Setting Up Poppler for PDF Processing").flush()
     
-    try:
-        # Check if poppler is already available
-        subprocess.run(['pdftoppm', '-h'], capture_output=True, check=True)
+    # Check if poppler is already available (PATH lookup, no subprocess)
+    if shutil.which('pdftoppm'):
         print("✓ Poppler is already available")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("🔧 Poppler not found, setting up...")
+    
+    print("🔧 Poppler not found, setting up...")
+    
+    # The bundled release is Windows-only; elsewhere use the system package
+    if _SYSTEM != "Windows":
+        install_hint = "brew install poppler" if _SYSTEM == "Darwin" else "sudo apt-get install poppler-utils"
+        print("⚠️  Poppler binaries not found.")
+        print(f"   Install Poppler with: {install_hint}")
+        return False
+    
+    poppler_dir = str(Path.cwd() / 'poppler' / 'poppler-24.08.0' / 'Library' / 'bin')
+    if os.path.exists(poppler_dir):
+        # Add to current session PATH
+        current_path = os.environ.get('PATH', '')
+        if poppler_dir not in current_path.split(os.pathsep):
+            os.environ['PATH'] = os.pathsep.join([current_path, poppler_dir])
+            print(f"✓ Added Poppler to PATH: {poppler_dir}")
+        return True
+    
+    print("⚠️  Poppler binaries not found.")
+    print("   Downloading Poppler for Windows...")
+    
+    # Download Poppler
+    if _download_poppler():
+        # Add to PATH
+        os.environ['PATH'] = os.pathsep.join([os.environ.get('PATH', ''), poppler_dir])
+        print(f"✓ Poppler installed and added to PATH")
         
-        poppler_dir = os.path.join(os.getcwd(), 'poppler', 'poppler-24.08.0', 'Library', 'bin')
-        if os.path.exists(poppler_dir):
-            # Add to current session PATH
-            current_path = os.environ.get('PATH', '')
-            if poppler_dir not in current_path:
-                os.environ['PATH'] = current_path + os.pathsep + poppler_dir
-                print(f"✓ Added Poppler to PATH: {poppler_dir}")
-            return True
-        else:
-            print("⚠️  Poppler binaries not found.")
-            print("   Downloading Poppler for Windows...")
-            
-            # Download Poppler
-            download_cmd = '''Invoke-WebRequest -Uri "https://github.com/oschwartz10612/poppler-windows/releases/download/v24.08.0-0/Release-24.08.0-0.zip" -OutFile "poppler.zip"'''
-            if run_command(download_cmd, "Downloading Poppler..."):
-                extract_cmd = 'Expand-Archive -Path "poppler.zip" -DestinationPath "poppler" -Force'
-                if run_command(extract_cmd, "Extracting Poppler..."):
-                    # Add to PATH
-                    poppler_dir = os.path.join(os.getcwd(), 'poppler', 'poppler-24.08.0', 'Library', 'bin')
-                    current_path = os.environ.get('PATH', '')
-                    os.environ['PATH'] = current_path + os.pathsep + poppler_dir
-                    print(f"✓ Poppler installed and added to PATH")
-                    
-                    # Clean up zip file
-                    try:
-                        os.remove("poppler.zip")
-                        print("✓ Cleaned up installation files")
-                    except:
-                        pass
-                    return True
-            
-            print("⚠️  Failed to install Poppler. PDF processing may not work.")
-            return False
+        # Clean up zip file
+        try:
+            os.remove("poppler.zip")
+            print("✓ Cleaned up installation files")
+        except OSError:
+            pass
+        return True
+    
+    print("⚠️  Failed to install Poppler. PDF processing may not work.")
+    return False
 
 def create_sample_watermark():
     """Create a sample watermark if none exists."""
@@ -169,7 +278,7 @@ def create_sample_watermark():
         return True
     
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
         
         print("Creating sample watermark...")
         
@@ -178,13 +287,7 @@ def create_sample_watermark():
         draw = ImageDraw.Draw(img)
         
         # Try to use a system font
-        try:
-            if platform.system() == "Windows":
-                font = ImageFont.truetype('arial.ttf', 48)
-            else:
-                font = ImageFont.truetype('/System/Library/Fonts/Arial.ttf', 48)
-        except:
-            font = ImageFont.load_default()
+        font = _load_font(48)
         
         # Draw semi-transparent text
         text = 'SAMPLE'
@@ -211,12 +314,12 @@ def create_sample_watermark():
 
 def create_sample_images():
     """Create sample images for testing."""
-    print("\n" + "="*50)
-    print("Creating Sample Images")
-    print("="*50)
+    _PhaseLog("Creating Sample Images").flush()
     
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        import numpy as np
+        from concurrent.futures import ThreadPoolExecutor
+        from PIL import Image, ImageColor, ImageDraw
         
         input_folder = Path("input")
         
@@ -228,18 +331,17 @@ def create_sample_images():
             {'name': 'small', 'size': (640, 480), 'color': '#D0021B'}
         ]
         
+        # Render serially, then encode in parallel (libjpeg releases the GIL)
+        rendered = []
         for sample in samples:
-            img = Image.new('RGB', sample['size'], sample['color'])
-            draw = ImageDraw.Draw(img)
-            
-            # Add some visual elements
             width, height = sample['size']
             
-            # Background pattern
-            for i in range(0, width, 100):
-                draw.line([(i, 0), (i, height)], fill=(255, 255, 255, 50), width=1)
-            for i in range(0, height, 100):
-                draw.line([(0, i), (width, i)], fill=(255, 255, 255, 50), width=1)
+            # Solid background with a white 100px grid, drawn by slicing
+            pixels = np.full((height, width, 3), ImageColor.getrgb(sample['color']), dtype=np.uint8)
+            pixels[::100, :] = 255
+            pixels[:, ::100] = 255
+            img = Image.fromarray(pixels, 'RGB')
+            draw = ImageDraw.Draw(img)
             
             # Central circle
             margin = min(width, height) // 4
@@ -247,13 +349,7 @@ def create_sample_images():
                         outline='white', width=8)
             
             # Text
-            try:
-                if platform.system() == "Windows":
-                    font = ImageFont.truetype('arial.ttf', min(width, height) // 20)
-                else:
-                    font = ImageFont.load_default()
-            except:
-                font = ImageFont.load_default()
+            font = _load_font(min(width, height) // 20)
             
             text = f"{sample['name'].upper()}\n{width}x{height}"
             bbox = draw.multiline_textbbox((0, 0), text, font=font)
@@ -265,11 +361,16 @@ def create_sample_images():
             draw.multiline_text((x, y), text, font=font, fill='white', 
                                align='center')
             
-            # Save image
-            output_path = input_folder / f"sample_{sample['name']}.jpg"
-            img.save(str(output_path), 'JPEG', quality=95)
+            rendered.append((input_folder / f"sample_{sample['name']}.jpg", img))
+        
+        with ThreadPoolExecutor(max_workers=len(rendered)) as executor:
+            futures = [executor.submit(img.save, str(output_path), 'JPEG', quality=95)
+                       for output_path, img in rendered]
+        
+        for (output_path, _), future in zip(rendered, futures):
+            future.result()  # Re-raise any save error
             print(f"✓ Created: {output_path}")
-            
+        
         return True
         
     except Exception as e:
@@ -278,9 +379,7 @@ def create_sample_images():
 
 def check_system_optimization():
     """Check system for performance optimizations."""
-    print("\n" + "="*50)
-    print("System Optimization Check")
-    print("="*50)
+    log = _PhaseLog("System Optimization Check")
     
     try:
         import psutil
@@ -288,40 +387,43 @@ def check_system_optimization():
         # CPU info
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
-        print(f"✓ CPU cores: {cpu_count}")
+        log(f"✓ CPU cores: {cpu_count}")
         if cpu_freq:
-            print(f"✓ CPU frequency: {cpu_freq.current:.0f} MHz")
+            log(f"✓ CPU frequency: {cpu_freq.current:.0f} MHz")
         
         # Memory info
         memory = psutil.virtual_memory()
-        print(f"✓ Total RAM: {memory.total // (1024**3)} GB")
-        print(f"✓ Available RAM: {memory.available // (1024**3)} GB")
+        log(f"✓ Total RAM: {memory.total // (1024**3)} GB")
+        log(f"✓ Available RAM: {memory.available // (1024**3)} GB")
         
         # Disk info
         disk = psutil.disk_usage('.')
-        print(f"✓ Free disk space: {disk.free // (1024**3)} GB")
+        log(f"✓ Free disk space: {disk.free // (1024**3)} GB")
         
         # Recommendations
-        print("\nPerformance Recommendations:")
+        log("\nPerformance Recommendations:")
         if cpu_count >= 8:
-            print("✓ Excellent CPU for multiprocessing")
+            log("✓ Excellent CPU for multiprocessing")
         elif cpu_count >= 4:
-            print("✓ Good CPU, multiprocessing will help")
+            log("✓ Good CPU, multiprocessing will help")
         else:
-            print("⚠ Consider disabling multiprocessing for single-core systems")
+            log("⚠ Consider disabling multiprocessing for single-core systems")
         
         if memory.total >= 16 * (1024**3):
-            print("✓ Excellent RAM for large image processing")
+            log("✓ Excellent RAM for large image processing")
         elif memory.total >= 8 * (1024**3):
-            print("✓ Good RAM, suitable for most image processing")
+            log("✓ Good RAM, suitable for most image processing")
         else:
-            print("⚠ Limited RAM, consider processing smaller batches")
+            log("⚠ Limited RAM, consider processing smaller batches")
         
         return True
         
     except ImportError:
-        print("⚠ psutil not available for system monitoring")
+        log("⚠ psutil not available for system monitoring")
         return False
+    
+    finally:
+        log.flush()
 
 def create_environment_file():
     """Create a .env template file for configuration."""
@@ -360,49 +462,57 @@ LOG_RETENTION_DAYS=30
     print(f"✓ Created environment template: {env_file}")
 
 def main():
-    """Main installation function."""
-    print("="*60)
-    print("Image Processor Pro - Enhanced Setup")
-    print("="*60)
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Architecture: {platform.machine()}")
+    """Main installation function.
+    
+    Flags: --with-samples creates sample images and a watermark;
+    --no-diagnostics skips the system check (also skipped when stdin
+    is not a terminal).
+    """
+    log = _PhaseLog()
+    log("="*60)
+    log("Image Processor Pro - Enhanced Setup")
+    log("="*60)
+    log(f"Platform: {_SYSTEM} {_RELEASE}")
+    log(f"Architecture: {_MACHINE}")
+    log.flush()
     
     # Check Python version
     if not check_python_version():
         return False
     
-    # Install dependencies
-    if not install_core_dependencies():
+    # Install core and optional dependencies
+    if not install_dependencies():
         print("\n❌ Core dependency installation failed")
         return False
     
-    # Optional dependencies
-    install_optional_dependencies()
-    
     # Setup project structure
     setup_folders()
     
     # Setup Poppler for PDF processing
     setup_poppler()
     
-    # Create sample content
-    create_sample_watermark()
-    create_sample_images()
+    # Create sample content (opt-in: needs PIL and writes into input/)
+    if '--with-samples' in sys.argv:
+        create_sample_watermark()
+        create_sample_images()
     
-    # System optimization check
-    check_system_optimization()
+    # System optimization check (only useful when someone is reading)
+    if sys.stdin.isatty() and '--no-diagnostics' not in sys.argv:
+        check_system_optimization()
     
     # Create configuration templates
     create_environment_file()
     
-    print("\n" + "="*60)
-    print("✓ Setup Complete!")
-    print("="*60)
-    print("\nNext steps:")
-    print("1. Run 'python gui_app.py' to start the GUI application")
-    print("2. Or run 'python cli.py --help' for command-line usage")
-    print("3. Check the README.md for detailed documentation")
-    print("4. Customize config files for your specific needs")
+    log = _PhaseLog()
+    log("\n" + "="*60)
+    log("✓ Setup Complete!")
+    log("="*60)
+    log("\nNext steps:")
+    log("1. Run 'python gui_app.py' to start the GUI application")
+    log("2. Or run 'python cli.py --help' for command-line usage")
+    log("3. Check the README.md for detailed documentation")
+    log("4. Customize config files for your specific needs")
+    log.flush()
     
     return True
 
@@ -414,4 +524,5 @@ if __name__ == "__main__":
         sys.exit(1)
     
     print("\n🎉 Ready to process images!")
-    input("\nPress Enter to exit...")
+    if sys.stdin.isatty():
+        input("\nPress Enter to exit...")
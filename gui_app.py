@@ -39,9 +39,18 @@ try:
     log_error("✓ customtkinter imported")
     
     from pathlib import Path
+    import asyncio
     import threading
-    from typing import Optional, Callable
+    import contextlib
+    import functools
+    import copy
+    import itertools
+    import multiprocessing
+    from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+    from dataclasses import dataclass, asdict
+    from typing import Optional, Callable, Dict, List, Tuple
     import json
+    import hashlib
     log_error("✓ other imports complete")
     
 except Exception as e:
@@ -50,20 +59,16 @@ except Exception as e:
     log_error(traceback.format_exc())
     raise
 
+# PyInstaller unpacks to a temp folder and stores its path in _MEIPASS
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller."""
-    try:
-        if hasattr(sys, '_MEIPASS'):
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(os.path.abspath(__file__))
-        result = os.path.join(base_path, relative_path)
-        log_error(f"Resource path for '{relative_path}': {result}")
-        return result
-    except Exception as e:
-        log_error(f"ERROR in get_resource_path: {e}")
-        raise
+    result = os.path.join(_BASE_PATH, relative_path)
+    log_error(f"Resource path for '{relative_path}': {result}")
+    return result
 
 
 # Add src to path for imports
@@ -73,7 +78,8 @@ try:
         sys.path.insert(0, src_path)
     log_error(f"✓ Added src to path: {src_path}")
     
-    from image_processor import ImageProcessor, ProcessingConfig
+    from image_processor import ImageProcessor, ProcessingConfig, iter_image_files
+    from loguru import logger
     log_error("✓ image_processor imported")
 except Exception as e:
     log_error(f"ERROR importing image_processor: {e}")
@@ -91,9 +97,165 @@ except Exception as e:
     raise
 
 
+# Slider drags fire on every pixel; value labels redraw once the drag pauses this long
+SLIDER_DEBOUNCE_MS = 40
+
+# Slider name -> (value label attribute, format string, value conversion)
+_SLIDER_LABELS = {
+    'text_opacity': ('text_opacity_label', '{:d}', int),
+    'rotation': ('rotation_label', '{:d}°', int),
+    'text_spacing': ('text_spacing_label', '{:.1f}', float),
+    'font_size': ('font_size_label', '{:.3f}', float),
+    'quality': ('quality_label', '{:d}', int),
+}
+
+# Progress bar refresh period while processing (~60 Hz)
+PROGRESS_PUMP_MS = 16
+
+# How often the processing asyncio loop gets a turn inside the Tk mainloop
+ASYNCIO_TICK_MS = 10
+
+# The file count shown after a scan stops here and reads "10000+"
+SCAN_COUNT_CAP = 10000
+
+# GUI settings are saved as JSON; the YAML file is still read if no JSON exists yet
+DEFAULT_SETTINGS_PATH = os.path.join("config", "default_settings.json")
+LEGACY_SETTINGS_PATH = os.path.join("config", "default_settings.yaml")
+SETTINGS_FILETYPES = [("JSON files", "*.json"), ("YAML files", "*.yaml *.yml"), ("All files", "*.*")]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> ProcessingConfig:
+    """Parse a settings file once per (path, mtime, size); re-opening an unchanged file is free."""
+    return ProcessingConfig.load_from_file(path)
+
+
+def load_settings_file(path: str) -> ProcessingConfig:
+    """Load a JSON or YAML settings file through the mtime/size-keyed cache.
+    
+    Returns a shallow copy so callers can't alter the cached instance; every
+    field is a scalar, string or tuple, so nothing deeper is shared mutably.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    return copy.copy(_load_config_cached(path, st.st_mtime_ns, st.st_size))
+
+
+@dataclass
+class _LegacyDefaults:
+    """Settings with no widget in the simplified UI, kept as plain values."""
+    watermark_opacity: float = 0.1
+    watermark_position: str = "center"
+    watermark_scale: float = 0.2
+    use_tiled_watermark: bool = True
+    tile_size_ratio: float = 0.18
+    max_width: int = 1920
+    max_height: int = 1080
+    preserve_aspect_ratio: bool = True
+    use_multiprocessing: bool = True
+    max_workers: int = 4
+    text_font_path: Optional[str] = None
+
+
+# Per output folder record of what was processed, used to skip unchanged files
+MANIFEST_NAME = ".manifest.json"
+
+# Config fields that don't affect output pixels, left out of the manifest fingerprint
+_FINGERPRINT_IGNORED = frozenset({'input_folder', 'output_folder', 'use_multiprocessing',
+                                  'max_workers', 'blob_max_concurrency', 'http_pool_size'})
+
+
+def _config_fingerprint(config: ProcessingConfig) -> str:
+    """Hash of the output-affecting settings; a change invalidates every manifest."""
+    data = {k: v for k, v in asdict(config).items() if k not in _FINGERPRINT_IGNORED}
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _read_manifest(output_dir: str) -> dict:
+    """Read an output folder's manifest, or an empty one if missing or unreadable."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def filter_unprocessed(pairs: List[Tuple[str, str]], fingerprint: str) -> List[Tuple[str, str]]:
+    """Drop (source, output) pairs whose source and output match their manifest entry."""
+    manifests: Dict[str, dict] = {}
+    todo = []
+    for src, out in pairs:
+        out_dir, src_name = os.path.dirname(out), os.path.basename(src)
+        if out_dir not in manifests:
+            manifests[out_dir] = _read_manifest(out_dir)
+        manifest = manifests[out_dir]
+        
+        entry = manifest.get('files', {}).get(src_name) if manifest.get('config') == fingerprint else None
+        if entry is not None:
+            try:
+                src_stat, out_stat = os.stat(src), os.stat(out)
+                if entry == [src_stat.st_size, src_stat.st_mtime_ns, out_stat.st_mtime_ns]:
+                    continue
+            except OSError:
+                pass  # Output (or source) gone - process it again
+        todo.append((src, out))
+    return todo
+
+
+def record_processed(pairs: List[Tuple[str, str]], fingerprint: str) -> None:
+    """Add successfully processed (source, output) pairs to their folders' manifests."""
+    by_dir: Dict[str, List[Tuple[str, str]]] = {}
+    for src, out in pairs:
+        by_dir.setdefault(os.path.dirname(out), []).append((src, out))
+    
+    for out_dir, dir_pairs in by_dir.items():
+        manifest = _read_manifest(out_dir)
+        if manifest.get('config') != fingerprint:
+            manifest = {'config': fingerprint, 'files': {}}
+        files = manifest.setdefault('files', {})
+        for src, out in dir_pairs:
+            try:
+                src_stat, out_stat = os.stat(src), os.stat(out)
+            except OSError:
+                continue  # PDFs write per-page outputs, so there's no single file to track
+            files[os.path.basename(src)] = [src_stat.st_size, src_stat.st_mtime_ns, out_stat.st_mtime_ns]
+        try:
+            with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, separators=(',', ':'))
+        except OSError as e:
+            logger.error(f"Failed to write manifest in {out_dir}: {e}")
+
+
+# Per-process ImageProcessor, built once by _init_worker in each pool worker
+_worker_processor: Optional[ImageProcessor] = None
+
+
+def _init_worker(config_dict: dict, stop_event) -> None:
+    """Build the ImageProcessor used by _process_one in this worker process."""
+    global _worker_processor
+    _worker_processor = ImageProcessor(ProcessingConfig(**config_dict))
+    _worker_processor.stop_event = stop_event
+
+
+def _process_one(input_path: str, output_path: str) -> bool:
+    """Process a single file in a worker process (module-level so it pickles)."""
+    return _worker_processor.process_single_image(input_path, output_path)
+
+
 class ImageProcessorGUI:
     """Modern GUI for the Image Processor application."""
     
+    # One CTkFont per (size, weight); each is a named Tk font, so labels share them
+    _font_cache: Dict[Tuple[Optional[int], Optional[str]], "ctk.CTkFont"] = {}
+    
+    @classmethod
+    def _font(cls, size: Optional[int] = None, weight: Optional[str] = None) -> "ctk.CTkFont":
+        """Return the shared font for size and weight (None = theme default)."""
+        font = cls._font_cache.get((size, weight))
+        if font is None:
+            font = cls._font_cache[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
+    
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("MJW Estate Web Image Optimizer")
@@ -102,9 +264,41 @@ class ImageProcessorGUI:
         
         # Initialize variables
         self.config = ProcessingConfig()
+        self._legacy = _LegacyDefaults()
+        # get_current_config() result, rebuilt only after a settings variable changes
+        self._cached_config: Optional[ProcessingConfig] = None
+        self._config_dirty = True
+        # hash(repr(config)) of the defaults file as last loaded or saved
+        self._last_saved_hash: Optional[int] = None
         self.processor: Optional[ImageProcessor] = None
-        self.processing_thread: Optional[threading.Thread] = None
+        # (config, processor) pairs for the two most recent distinct configs
+        self._processor_pool: List[Tuple[ProcessingConfig, ImageProcessor]] = []
+        # Processing runs as an asyncio task on a loop ticked from the Tk mainloop
+        self._loop = asyncio.new_event_loop()
+        self._task: Optional[asyncio.Task] = None
+        self._tick_after: Optional[str] = None
+        self._executor: Optional[Executor] = None
+        # Set by Stop; workers check it between decode, resize and encode
+        self._stop_event = None
+        self.pending_futures: List[Future] = []
+        # Pending after() handles for debounced slider labels, by slider
+        self._pending_after: Dict[str, str] = {}
+        # Last text requested per slider label (drawn or still pending)
+        self._label_text: Dict[str, str] = {}
+        # Label updates collected while _suspend_ui_updates() is active
+        self._suspended_labels: Optional[Dict[str, tuple]] = None
+        # Last directory chosen per dialog kind, used as the next initialdir
+        self._last_dir: Dict[str, str] = {}
+        # Scan file counts keyed on (folder, mtime_ns, subfolder, suffix)
+        self._scan_cache: Dict[Tuple[str, int, str, str], int] = {}
         self.is_processing = False
+        # Latest (current, total) from the processing task, drawn by _pump_progress
+        self._progress_state: Optional[Tuple[int, int]] = None
+        self._shown_progress: Optional[Tuple[int, int]] = None
+        self._pump_after: Optional[str] = None
+        self._file_count_text = "No input folder selected"
+        # (folder, subfolder, suffix) of the count currently shown
+        self._last_scanned: Optional[Tuple[str, str, str]] = None
         
         # Create GUI elements
         self.create_widgets()
@@ -124,7 +318,7 @@ class ImageProcessorGUI:
         title_label = ctk.CTkLabel(
             main_frame, 
             text="MJW Estate Web Image Optimizer", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font(24, "bold")
         )
         title_label.pack(pady=(0, 10))
         
@@ -132,13 +326,13 @@ class ImageProcessorGUI:
         subtitle_label = ctk.CTkLabel(
             main_frame, 
             text="2400px long edge • sRGB • 300 DPI • JPEG 100% • © Outlined Watermark", 
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="gray"
         )
         subtitle_label.pack(pady=(0, 15))
         
         # Create tabview
-        self.tabview = ctk.CTkTabview(main_frame)
+        self.tabview = ctk.CTkTabview(main_frame, command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True)
         
         # Add tabs
@@ -146,37 +340,71 @@ class ImageProcessorGUI:
         self.tab_advanced = self.tabview.add("Advanced Settings")
         self.tab_processing = self.tabview.add("Processing")
         
+        # Only the first tab is built now; the others are built when first shown.
+        # Their variables exist from the start so settings can be applied and read.
+        self.create_variables()
         self.create_basic_tab()
-        self.create_advanced_tab()
-        self.create_processing_tab()
+        self._tab_builders: Dict[str, Callable[[], None]] = {
+            "Advanced Settings": self.create_advanced_tab,
+            "Processing": self.create_processing_tab,
+        }
+        
+        # Any write to a settings variable invalidates the cached config
+        for var in (self.input_folder_var, self.output_folder_var, self.watermark_path_var,
+                    self.watermark_text_var, self.format_var, self.quality_var,
+                    self.text_opacity_var, self.rotation_var, self.text_spacing_var,
+                    self.font_size_var, self.long_edge_var, self.target_size_var,
+                    self.subfolder_var, self.suffix_var):
+            var.trace_add('write', self._mark_config_dirty)
+    
+    def create_variables(self):
+        """Create the settings variables for the lazily built tabs."""
+        self.text_opacity_var = ctk.IntVar(value=63)  # 0-255, 63 is ~25%
+        self.rotation_var = ctk.IntVar(value=-30)
+        self.text_spacing_var = ctk.DoubleVar(value=-0.3)
+        self.font_size_var = ctk.DoubleVar(value=0.015)
+        self.long_edge_var = ctk.StringVar(value="2400")
+        self.target_size_var = ctk.StringVar(value="5000")
+        self.subfolder_var = ctk.StringVar(value="web_optimized")
+        self.suffix_var = ctk.StringVar(value="_web")
+        self.force_reprocess_var = ctk.BooleanVar(value=False)
+    
+    def _on_tab_change(self):
+        """Tabview command: build the selected tab on its first visit."""
+        self.ensure_tab(self.tabview.get())
+    
+    def ensure_tab(self, name: str):
+        """Build a lazily created tab's widgets if that hasn't happened yet."""
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            builder()
     
     def create_basic_tab(self):
         """Create basic settings tab - simplified for web optimization."""
         
-        # Input folder selection
+        # Input folder selection (one gridded frame: entry stretches, Browse stays fixed)
         input_frame = ctk.CTkFrame(self.tab_basic)
         input_frame.pack(fill="x", pady=(0, 10))
+        input_frame.columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(input_frame, text="Select Folder with Images:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
-        
-        ctk.CTkLabel(input_frame, text="Select a folder containing paintings/images to process for web.", 
-                    text_color="gray").pack(anchor="w", padx=10, pady=(0, 5))
+        ctk.CTkLabel(input_frame, text="Select Folder with Images:", font=self._font(14, "bold")).grid(
+            row=0, column=0, columnspan=2, sticky="w", padx=10, pady=(10, 5))
         
-        input_path_frame = ctk.CTkFrame(input_frame)
-        input_path_frame.pack(fill="x", padx=10, pady=(0, 10))
+        ctk.CTkLabel(input_frame, text="Select a folder containing paintings/images to process for web.",
+                    text_color="gray").grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 5))
         
         self.input_folder_var = ctk.StringVar()
-        self.input_entry = ctk.CTkEntry(input_path_frame, textvariable=self.input_folder_var, placeholder_text="Select input folder...")
-        self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        self.input_entry = ctk.CTkEntry(input_frame, textvariable=self.input_folder_var, placeholder_text="Select input folder...")
+        self.input_entry.grid(row=2, column=0, sticky="ew", padx=(10, 10), pady=(0, 10))
         
-        self.input_browse_btn = ctk.CTkButton(input_path_frame, text="Browse", command=self.browse_input_folder, width=100)
-        self.input_browse_btn.pack(side="right")
+        self.input_browse_btn = ctk.CTkButton(input_frame, text="Browse", command=self.browse_input_folder, width=100)
+        self.input_browse_btn.grid(row=2, column=1, padx=(0, 10), pady=(0, 10))
         
         # Output info (read-only, shows where files will be saved)
         output_frame = ctk.CTkFrame(self.tab_basic)
         output_frame.pack(fill="x", pady=(0, 10))
         
-        ctk.CTkLabel(output_frame, text="Output Location:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(output_frame, text="Output Location:", font=self._font(14, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
         self.output_info_label = ctk.CTkLabel(
             output_frame, 
@@ -193,7 +421,7 @@ class ImageProcessorGUI:
         watermark_frame = ctk.CTkFrame(self.tab_basic)
         watermark_frame.pack(fill="x", pady=(0, 10))
         
-        ctk.CTkLabel(watermark_frame, text="Watermark Text:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(watermark_frame, text="Watermark Text:", font=self._font(14, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
         self.watermark_text_var = ctk.StringVar(value="Michael J Wright Estate | All Rights Reserved")
         self.watermark_text_entry = ctk.CTkEntry(
@@ -207,14 +435,14 @@ class ImageProcessorGUI:
             watermark_frame, 
             text="This text will be repeated diagonally across each image with light transparency.",
             text_color="gray",
-            font=ctk.CTkFont(size=11)
+            font=self._font(11)
         ).pack(anchor="w", padx=10, pady=(0, 10))
         
         # Quick settings summary
         summary_frame = ctk.CTkFrame(self.tab_basic)
         summary_frame.pack(fill="x", pady=(0, 10))
         
-        ctk.CTkLabel(summary_frame, text="Processing Settings:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(summary_frame, text="Processing Settings:", font=self._font(14, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
         settings_text = """• Resize: 2400px on long edge (paintings optimized)
 • Color: sRGB color space
@@ -228,7 +456,7 @@ class ImageProcessorGUI:
             summary_frame, 
             text=settings_text,
             justify="left",
-            font=ctk.CTkFont(size=12)
+            font=self._font(12)
         ).pack(anchor="w", padx=10, pady=(0, 10))
         
         # Format and quality (keep for compatibility but set defaults)
@@ -239,129 +467,114 @@ class ImageProcessorGUI:
     def create_advanced_tab(self):
         """Create advanced settings tab - text watermark options."""
         
-        # Text watermark settings
+        # Text watermark settings: one grid of label | slider | value rows
         watermark_frame = ctk.CTkFrame(self.tab_advanced)
         watermark_frame.pack(fill="x", pady=(0, 10))
+        watermark_frame.columnconfigure(1, weight=1)
         
-        ctk.CTkLabel(watermark_frame, text="Text Watermark Settings:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
-        
-        # Opacity (transparency)
-        opacity_frame = ctk.CTkFrame(watermark_frame)
-        opacity_frame.pack(fill="x", padx=10, pady=(0, 5))
-        
-        ctk.CTkLabel(opacity_frame, text="Opacity (lower = more subtle):").pack(side="left", padx=(10, 10))
-        self.text_opacity_var = ctk.IntVar(value=63)  # 0-255, 63 is ~25%
-        opacity_slider = ctk.CTkSlider(opacity_frame, from_=30, to=150, variable=self.text_opacity_var, number_of_steps=120)
-        opacity_slider.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        ctk.CTkLabel(watermark_frame, text="Text Watermark Settings:", font=self._font(14, "bold")).grid(
+            row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
-        self.text_opacity_label = ctk.CTkLabel(opacity_frame, text="63")
-        self.text_opacity_label.pack(side="left", padx=(0, 10))
-        opacity_slider.configure(command=self.update_text_opacity_label)
-        
-        # Rotation angle
-        rotation_frame = ctk.CTkFrame(watermark_frame)
-        rotation_frame.pack(fill="x", padx=10, pady=(0, 5))
-        
-        ctk.CTkLabel(rotation_frame, text="Rotation Angle:").pack(side="left", padx=(10, 10))
-        self.rotation_var = ctk.IntVar(value=-30)
-        rotation_slider = ctk.CTkSlider(rotation_frame, from_=-45, to=45, variable=self.rotation_var, number_of_steps=90)
-        rotation_slider.pack(side="left", fill="x", expand=True, padx=(0, 10))
-        
-        self.rotation_label = ctk.CTkLabel(rotation_frame, text="-30°")
-        self.rotation_label.pack(side="left", padx=(0, 10))
-        rotation_slider.configure(command=self.update_rotation_label)
-        
-        # Text spacing
-        spacing_frame = ctk.CTkFrame(watermark_frame)
-        spacing_frame.pack(fill="x", padx=10, pady=(0, 5))
-        
-        ctk.CTkLabel(spacing_frame, text="Text Spacing:").pack(side="left", padx=(10, 10))
-        self.text_spacing_var = ctk.DoubleVar(value=-0.3)
-        spacing_slider = ctk.CTkSlider(spacing_frame, from_=-0.5, to=0.5, variable=self.text_spacing_var, number_of_steps=20)
-        spacing_slider.pack(side="left", fill="x", expand=True, padx=(0, 10))
-        
-        self.text_spacing_label = ctk.CTkLabel(spacing_frame, text="-0.3")
-        self.text_spacing_label.pack(side="left", padx=(0, 10))
-        spacing_slider.configure(command=self.update_text_spacing_label)
-        
-        # Font size
-        font_frame = ctk.CTkFrame(watermark_frame)
-        font_frame.pack(fill="x", padx=10, pady=(0, 10))
-        
-        ctk.CTkLabel(font_frame, text="Font Size Ratio:").pack(side="left", padx=(10, 10))
-        self.font_size_var = ctk.DoubleVar(value=0.015)
-        font_slider = ctk.CTkSlider(font_frame, from_=0.010, to=0.05, variable=self.font_size_var, number_of_steps=40)
-        font_slider.pack(side="left", fill="x", expand=True, padx=(0, 10))
-        
-        self.font_size_label = ctk.CTkLabel(font_frame, text="0.015")
-        self.font_size_label.pack(side="left", padx=(0, 10))
-        font_slider.configure(command=self.update_font_size_label)
-        
-        # Image size settings
+        # (name, caption, variable, from_, to, steps)
+        slider_rows = (
+            ('text_opacity', "Opacity (lower = more subtle):", self.text_opacity_var, 30, 150, 120),
+            ('rotation', "Rotation Angle:", self.rotation_var, -45, 45, 90),
+            ('text_spacing', "Text Spacing:", self.text_spacing_var, -0.5, 0.5, 20),
+            ('font_size', "Font Size Ratio:", self.font_size_var, 0.010, 0.05, 40),
+        )
+        for row, (name, caption, var, from_, to, steps) in enumerate(slider_rows, start=1):
+            label_attr, fmt, convert = _SLIDER_LABELS[name]
+            pady = (0, 10) if row == len(slider_rows) else (0, 5)
+            ctk.CTkLabel(watermark_frame, text=caption).grid(row=row, column=0, sticky="w", padx=(20, 10), pady=pady)
+            ctk.CTkSlider(watermark_frame, from_=from_, to=to, variable=var, number_of_steps=steps,
+                          command=functools.partial(self._on_slider, name)).grid(
+                row=row, column=1, sticky="ew", padx=(0, 10), pady=pady)
+            # Settings may have been applied before this tab was built
+            label = ctk.CTkLabel(watermark_frame, text=fmt.format(convert(var.get())))
+            label.grid(row=row, column=2, padx=(0, 20), pady=pady)
+            setattr(self, label_attr, label)
+        
+        # Image size settings: label | entry | label | entry rows
         size_frame = ctk.CTkFrame(self.tab_advanced)
         size_frame.pack(fill="x", pady=(0, 10))
         
-        ctk.CTkLabel(size_frame, text="Image Size Settings:", font=ctk.CTkFont(weight="bold", size=14)).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(size_frame, text="Image Size Settings:", font=self._font(14, "bold")).grid(
+            row=0, column=0, columnspan=4, sticky="w", padx=10, pady=(10, 5))
         
-        dimensions_frame = ctk.CTkFrame(size_frame)
-        dimensions_frame.pack(fill="x", padx=10, pady=(0, 10))
+        # Digits-only entries: Tk rejects any other keystroke, so the vars always parse
+        digits_only = (self.root.register(lambda text: text == '' or text.isdigit()), '%P')
         
         # Long edge pixels
-        ctk.CTkLabel(dimensions_frame, text="Long Edge (px):").pack(side="left", padx=(10, 10))
-        self.long_edge_var = ctk.IntVar(value=2400)
-        long_edge_entry = ctk.CTkEntry(dimensions_frame, textvariable=self.long_edge_var, width=100)
-        long_edge_entry.pack(side="left", padx=(0, 20))
+        ctk.CTkLabel(size_frame, text="Long Edge (px):").grid(row=1, column=0, sticky="w", padx=(20, 10), pady=(0, 10))
+        ctk.CTkEntry(size_frame, textvariable=self.long_edge_var, width=100,
+                     validate="key", validatecommand=digits_only).grid(row=1, column=1, sticky="w", padx=(0, 20), pady=(0, 10))
         
         # Target file size
-        ctk.CTkLabel(dimensions_frame, text="Target Max KB:").pack(side="left", padx=(0, 10))
-        self.target_size_var = ctk.IntVar(value=5000)
-        target_size_entry = ctk.CTkEntry(dimensions_frame, textvariable=self.target_size_var, width=100)
-        target_size_entry.pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(size_frame, text="Target Max KB:").grid(row=1, column=2, sticky="w", padx=(0, 10), pady=(0, 10))
+        ctk.CTkEntry(size_frame, textvariable=self.target_size_var, width=100,
+                     validate="key", validatecommand=digits_only).grid(row=1, column=3, sticky="w", padx=(0, 10), pady=(0, 10))
         
         # Output subfolder name
-        subfolder_frame = ctk.CTkFrame(size_frame)
-        subfolder_frame.pack(fill="x", padx=10, pady=(0, 10))
+        ctk.CTkLabel(size_frame, text="Output Subfolder:").grid(row=2, column=0, sticky="w", padx=(20, 10), pady=(0, 10))
+        ctk.CTkEntry(size_frame, textvariable=self.subfolder_var, width=200).grid(
+            row=2, column=1, sticky="w", padx=(0, 20), pady=(0, 10))
         
-        ctk.CTkLabel(subfolder_frame, text="Output Subfolder:").pack(side="left", padx=(10, 10))
-        self.subfolder_var = ctk.StringVar(value="web_optimized")
-        subfolder_entry = ctk.CTkEntry(subfolder_frame, textvariable=self.subfolder_var, width=200)
-        subfolder_entry.pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(size_frame, text="File Suffix:").grid(row=2, column=2, sticky="w", padx=(0, 10), pady=(0, 10))
+        ctk.CTkEntry(size_frame, textvariable=self.suffix_var, width=100).grid(
+            row=2, column=3, sticky="w", padx=(0, 10), pady=(0, 10))
         
-        ctk.CTkLabel(subfolder_frame, text="File Suffix:").pack(side="left", padx=(10, 10))
-        self.suffix_var = ctk.StringVar(value="_web")
-        suffix_entry = ctk.CTkEntry(subfolder_frame, textvariable=self.suffix_var, width=100)
-        suffix_entry.pack(side="left", padx=(0, 10))
-        
-        # Hidden variables for compatibility
-        self.opacity_var = ctk.DoubleVar(value=0.1)
-        self.position_var = ctk.StringVar(value="center")
-        self.scale_var = ctk.DoubleVar(value=0.2)
-        self.tiling_var = ctk.BooleanVar(value=True)
-        self.tile_size_var = ctk.DoubleVar(value=0.18)
-        self.max_width_var = ctk.IntVar(value=1920)
-        self.max_height_var = ctk.IntVar(value=1080)
-        self.preserve_aspect_var = ctk.BooleanVar(value=True)
-        self.multiprocessing_var = ctk.BooleanVar(value=True)
-        self.max_workers_var = ctk.IntVar(value=4)
-        self.opacity_label = ctk.CTkLabel(size_frame, text="0.1")
-        self.scale_label = ctk.CTkLabel(size_frame, text="0.2")
-        self.tile_size_label = ctk.CTkLabel(size_frame, text="0.18")
+    
+    @contextlib.contextmanager
+    def _suspend_ui_updates(self):
+        """Collect slider label updates made in the block and draw each label once on exit."""
+        self._suspended_labels = {}
+        try:
+            yield
+        finally:
+            pending, self._suspended_labels = self._suspended_labels, None
+            for label, text in pending.values():
+                label.configure(text=text)
+    
+    def _set_label_later(self, key: str, label, text: str):
+        """Debounce a slider label so only the last value in a drag is drawn.
+        
+        Most drag ticks round to the text already requested; those do nothing.
+        """
+        if self._label_text.get(key) == text:
+            return
+        self._label_text[key] = text
+        if (handle := self._pending_after.pop(key, None)):
+            self.root.after_cancel(handle)
+        if self._suspended_labels is not None:
+            self._suspended_labels[key] = (label, text)
+            return
+        self._pending_after[key] = self.root.after(SLIDER_DEBOUNCE_MS, self._apply_label, key, label, text)
+    
+    def _apply_label(self, key: str, label, text: str):
+        """Draw a debounced slider label."""
+        self._pending_after.pop(key, None)
+        label.configure(text=text)
+    
+    def _on_slider(self, name: str, value):
+        """Single slider command: format the value per _SLIDER_LABELS and debounce the label."""
+        label_attr, fmt, convert = _SLIDER_LABELS[name]
+        self._set_label_later(name, getattr(self, label_attr), fmt.format(convert(value)))
     
     def update_text_opacity_label(self, value):
         """Update text opacity label when slider changes."""
-        self.text_opacity_label.configure(text=f"{int(value)}")
+        self._on_slider('text_opacity', value)
     
     def update_rotation_label(self, value):
         """Update rotation label when slider changes."""
-        self.rotation_label.configure(text=f"{int(value)}°")
+        self._on_slider('rotation', value)
     
     def update_text_spacing_label(self, value):
         """Update text spacing label when slider changes."""
-        self.text_spacing_label.configure(text=f"{value:.1f}")
+        self._on_slider('text_spacing', value)
     
     def update_font_size_label(self, value):
         """Update font size label when slider changes."""
-        self.font_size_label.configure(text=f"{value:.3f}")
+        self._on_slider('font_size', value)
     
     def create_processing_tab(self):
         """Create processing tab."""
@@ -372,8 +585,8 @@ class ImageProcessorGUI:
         
         self.file_count_label = ctk.CTkLabel(
             self.file_info_frame, 
-            text="No input folder selected", 
-            font=ctk.CTkFont(size=14)
+            text=self._file_count_text, 
+            font=self._font(14)
         )
         self.file_count_label.pack(pady=20)
         
@@ -381,7 +594,7 @@ class ImageProcessorGUI:
         progress_frame = ctk.CTkFrame(self.tab_processing)
         progress_frame.pack(fill="x", pady=(0, 20))
         
-        ctk.CTkLabel(progress_frame, text="Processing Progress:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(progress_frame, text="Processing Progress:", font=self._font(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
         self.progress_bar = ctk.CTkProgressBar(progress_frame)
         self.progress_bar.pack(fill="x", padx=10, pady=(0, 10))
@@ -390,21 +603,19 @@ class ImageProcessorGUI:
         self.progress_label = ctk.CTkLabel(progress_frame, text="Ready to process")
         self.progress_label.pack(pady=(0, 10))
         
-        # Control buttons
-        button_frame = ctk.CTkFrame(self.tab_processing)
-        button_frame.pack(fill="x", pady=(0, 20))
-        
-        buttons_container = ctk.CTkFrame(button_frame)
-        buttons_container.pack(pady=20)
+        # Control buttons, centred by the weighted empty columns either side
+        buttons_container = ctk.CTkFrame(self.tab_processing)
+        buttons_container.pack(fill="x", pady=(0, 20))
+        buttons_container.columnconfigure((0, 5), weight=1)
         
         self.scan_btn = ctk.CTkButton(
             buttons_container, 
-            text="Scan Files", 
-            command=self.scan_files,
+            text="Rescan Files", 
+            command=lambda: self.scan_files(rescan=True),
             width=120,
             height=40
         )
-        self.scan_btn.pack(side="left", padx=(0, 10))
+        self.scan_btn.grid(row=0, column=1, padx=(0, 10), pady=20)
         
         self.process_btn = ctk.CTkButton(
             buttons_container, 
@@ -415,7 +626,7 @@ class ImageProcessorGUI:
             fg_color="#28a745",
             hover_color="#218838"
         )
-        self.process_btn.pack(side="left", padx=(0, 10))
+        self.process_btn.grid(row=0, column=2, padx=(0, 10), pady=20)
         
         self.stop_btn = ctk.CTkButton(
             buttons_container, 
@@ -427,14 +638,19 @@ class ImageProcessorGUI:
             hover_color="#c82333",
             state="disabled"
         )
-        self.stop_btn.pack(side="left", padx=(0, 10))
+        self.stop_btn.grid(row=0, column=3, padx=(0, 10), pady=20)
         
-        # Settings management
-        settings_frame = ctk.CTkFrame(self.tab_processing)
-        settings_frame.pack(fill="x")
+        # Unchanged files (per the output folder manifest) are skipped unless forced
+        ctk.CTkCheckBox(
+            buttons_container,
+            text="Force reprocess",
+            variable=self.force_reprocess_var
+        ).grid(row=0, column=4, padx=(10, 0), pady=20)
         
-        settings_container = ctk.CTkFrame(settings_frame)
-        settings_container.pack(pady=20)
+        # Settings management
+        settings_container = ctk.CTkFrame(self.tab_processing)
+        settings_container.pack(fill="x")
+        settings_container.columnconfigure((0, 3), weight=1)
         
         save_settings_btn = ctk.CTkButton(
             settings_container, 
@@ -442,7 +658,7 @@ class ImageProcessorGUI:
             command=self.save_settings,
             width=120
         )
-        save_settings_btn.pack(side="left", padx=(0, 10))
+        save_settings_btn.grid(row=0, column=1, padx=(0, 10), pady=20)
         
         load_settings_btn = ctk.CTkButton(
             settings_container, 
@@ -450,11 +666,11 @@ class ImageProcessorGUI:
             command=self.load_settings_dialog,
             width=120
         )
-        load_settings_btn.pack(side="left")
+        load_settings_btn.grid(row=0, column=2, pady=20)
     
     def update_quality_label(self, value):
         """Update quality label when slider changes."""
-        self.quality_label.configure(text=f"{int(value)}")
+        self._on_slider('quality', value)
     
     def update_opacity_label(self, value):
         """Update opacity label when slider changes (compatibility)."""
@@ -472,9 +688,22 @@ class ImageProcessorGUI:
         """Toggle visibility of tiling-specific controls (compatibility)."""
         pass  # Not used in simplified UI
     
+    def _ask_path(self, kind: str, dialog: Callable[..., str], **options) -> str:
+        """Open a Tk file dialog in the last directory used for this kind of path.
+        
+        Pending redraws are flushed first so the window isn't left half-painted
+        behind the native dialog.
+        """
+        self.root.update_idletasks()
+        options.setdefault("initialdir", self._last_dir.get(kind, os.path.expanduser("~")))
+        path = dialog(parent=self.root, **options)
+        if path:
+            self._last_dir[kind] = path if os.path.isdir(path) else os.path.dirname(path)
+        return path
+    
     def browse_input_folder(self):
         """Browse for input folder."""
-        folder = filedialog.askdirectory(title="Select Folder with Images")
+        folder = self._ask_path("input", filedialog.askdirectory, title="Select Folder with Images")
         if folder:
             self.input_folder_var.set(folder)
             # Update output info label
@@ -483,42 +712,75 @@ class ImageProcessorGUI:
             self.output_info_label.configure(
                 text=f"Files will be saved to: {folder}/{subfolder}/filename{suffix}.jpg"
             )
-            self.scan_files()
+            # Let the dialog finish closing before a potentially long scan
+            self.root.after(50, self.scan_files)
     
     def browse_output_folder(self):
         """Browse for output folder (not used in simplified mode)."""
-        folder = filedialog.askdirectory(title="Select Output Folder")
+        folder = self._ask_path("output", filedialog.askdirectory, title="Select Output Folder")
         if folder:
             self.output_folder_var.set(folder)
     
     def browse_watermark(self):
         """Browse for watermark image (not used in text watermark mode)."""
-        file_path = filedialog.askopenfilename(
+        file_path = self._ask_path(
+            "watermark", filedialog.askopenfilename,
             title="Select Watermark Image",
             filetypes=[("PNG files", "*.png"), ("All files", "*.*")]
         )
         if file_path:
             self.watermark_path_var.set(file_path)
     
-    def scan_files(self):
-        """Scan input folder for supported files."""
+    def scan_files(self, rescan: bool = False):
+        """Scan input folder for supported files, reusing the last scan if unchanged."""
         input_folder = self.input_folder_var.get()
         if not input_folder or not os.path.exists(input_folder):
-            self.file_count_label.configure(text="Please select a valid input folder")
+            self._last_scanned = None
+            self._set_file_count("Please select a valid input folder")
             return
         
-        # Create temporary processor to scan files
-        temp_config = self.get_current_config()
-        temp_processor = ImageProcessor(temp_config)
-        files = temp_processor.get_image_files(input_folder)
-        
-        if files:
-            self.file_count_label.configure(text=f"Found {len(files)} supported files")
+        # The folder mtime only moves when its direct entries change, so nested
+        # edits need an explicit rescan
+        input_folder = os.path.abspath(input_folder)
+        key = (input_folder, os.stat(input_folder).st_mtime_ns,
+               self.subfolder_var.get(), self.suffix_var.get())
+        if rescan:
+            self._scan_cache.pop(key, None)
+        
+        count = self._scan_cache.get(key)
+        if count is None:
+            # Only a count is needed here; the full sorted list is built when processing starts
+            files = iter_image_files(input_folder, key[2], key[3])
+            count = sum(1 for _ in itertools.islice(files, SCAN_COUNT_CAP + 1))
+            self._scan_cache[key] = count
+        self._last_scanned = (input_folder, key[2], key[3])
+        
+        if count > SCAN_COUNT_CAP:
+            self._set_file_count(f"Found {SCAN_COUNT_CAP}+ supported files")
+        elif count:
+            self._set_file_count(f"Found {count} supported files")
         else:
-            self.file_count_label.configure(text="No supported files found (PDF, JPG, PNG, BMP, TIFF)")
+            self._set_file_count("No supported files found (PDF, JPG, PNG, BMP, TIFF)")
+    
+    def _set_file_count(self, text: str):
+        """Show a scan result, keeping it for the Processing tab if that isn't built yet."""
+        self._file_count_text = text
+        if hasattr(self, 'file_count_label'):
+            self.file_count_label.configure(text=text)
+    
+    def _mark_config_dirty(self, *_trace_args):
+        """Tk variable write trace: the next get_current_config() rebuilds."""
+        self._config_dirty = True
     
     def get_current_config(self) -> ProcessingConfig:
-        """Get current configuration from GUI - optimized for web processing."""
+        """Get current configuration from GUI, reusing the last one if nothing changed."""
+        if self._config_dirty or self._cached_config is None:
+            self._cached_config = self._build_config()
+            self._config_dirty = False
+        return self._cached_config
+    
+    def _build_config(self) -> ProcessingConfig:
+        """Build a configuration from the GUI - optimized for web processing."""
         return ProcessingConfig(
             input_folder=self.input_folder_var.get(),
             output_folder=self.output_folder_var.get() if self.output_folder_var.get() else self.input_folder_var.get(),
@@ -528,10 +790,12 @@ class ImageProcessorGUI:
             jpeg_quality=self.quality_var.get(),
             png_compression=6,
             webp_quality=self.quality_var.get(),
-            target_max_size_kb=self.target_size_var.get(),
+            target_max_size_kb=int(self.target_size_var.get() or 0) or ProcessingConfig.target_max_size_kb,
             
             # Text watermark settings (primary mode)
             use_text_watermark=True,
+            cache_text_overlay=True,
+            text_font_path=self._legacy.text_font_path,
             watermark_text=self.watermark_text_var.get(),
             text_font_size_ratio=self.font_size_var.get(),
             text_watermark_opacity=self.text_opacity_var.get(),
@@ -539,16 +803,16 @@ class ImageProcessorGUI:
             text_spacing_ratio=self.text_spacing_var.get(),
             
             # Image watermark settings (for compatibility)
-            watermark_opacity=self.opacity_var.get(),
-            watermark_position=self.position_var.get(),
-            watermark_scale=self.scale_var.get(),
-            use_tiled_watermark=self.tiling_var.get(),
-            tile_size_ratio=self.tile_size_var.get(),
+            watermark_opacity=self._legacy.watermark_opacity,
+            watermark_position=self._legacy.watermark_position,
+            watermark_scale=self._legacy.watermark_scale,
+            use_tiled_watermark=self._legacy.use_tiled_watermark,
+            tile_size_ratio=self._legacy.tile_size_ratio,
             tile_spacing_ratio=1.6,
             tile_opacity_reduction=0.7,
             
             # Web optimization settings
-            long_edge_pixels=self.long_edge_var.get(),
+            long_edge_pixels=int(self.long_edge_var.get() or 0) or ProcessingConfig.long_edge_pixels,
             output_dpi=300,
             convert_to_srgb=True,
             web_output_suffix=self.suffix_var.get(),
@@ -556,17 +820,18 @@ class ImageProcessorGUI:
             subfolder_name=self.subfolder_var.get(),
             
             # Size and format settings
-            max_width=self.max_width_var.get(),
-            max_height=self.max_height_var.get(),
+            max_width=self._legacy.max_width,
+            max_height=self._legacy.max_height,
             output_format=self.format_var.get(),
-            preserve_aspect_ratio=self.preserve_aspect_var.get(),
-            use_multiprocessing=self.multiprocessing_var.get(),
-            max_workers=self.max_workers_var.get() if self.multiprocessing_var.get() else None,
-            pdf_dpi=200
+            preserve_aspect_ratio=self._legacy.preserve_aspect_ratio,
+            use_multiprocessing=self._legacy.use_multiprocessing,
+            max_workers=self._legacy.max_workers if self._legacy.use_multiprocessing else None,
+            pdf_dpi=200,
+            reuse_pdf_context=True
         )
     
     def start_processing(self):
-        """Start the image processing in a separate thread."""
+        """Start image processing as an asyncio task driven from the Tk mainloop."""
         if self.is_processing:
             return
         
@@ -585,33 +850,139 @@ class ImageProcessorGUI:
         self.stop_btn.configure(state="normal")
         self.progress_bar.set(0)
         self.progress_label.configure(text="Initializing...")
+        self._progress_state = self._shown_progress = None
+        if self._pump_after is None:
+            self._pump_after = self.root.after(PROGRESS_PUMP_MS, self._pump_progress)
+        
+        # A run writes into (and may add) subfolders the folder mtime doesn't track
+        input_folder = os.path.abspath(config.input_folder)
+        for key in [key for key in self._scan_cache if key[0] == input_folder]:
+            del self._scan_cache[key]
+        
+        # Start processing task
+        self.processor = self._acquire_processor(config)
+        self._task = self._loop.create_task(self.run_processing())
+        if self._tick_after is None:
+            self._tick_after = self.root.after(ASYNCIO_TICK_MS, self._tick_loop)
+    
+    def _acquire_processor(self, config: ProcessingConfig) -> ImageProcessor:
+        """Return a processor for config, reusing a recent one built from an equal config.
+        
+        A reused processor keeps its loaded watermark, fonts and rendered text
+        overlays, so re-running with unchanged settings skips that setup.
+        """
+        for pooled_config, processor in self._processor_pool:
+            if pooled_config == config:
+                return processor
+        
+        processor = ImageProcessor(config)
+        # Keep the current and previous settings only
+        self._processor_pool = [(config, processor)] + self._processor_pool[:1]
+        return processor
+    
+    def _tick_loop(self):
+        """Run the asyncio callbacks that are ready, then re-arm until the task finishes."""
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
         
-        # Start processing thread
-        self.processor = ImageProcessor(config)
-        self.processing_thread = threading.Thread(target=self.run_processing)
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
+        if self._task is not None and not self._task.done():
+            self._tick_after = self.root.after(ASYNCIO_TICK_MS, self._tick_loop)
+        else:
+            self._tick_after = None
     
-    def run_processing(self):
-        """Run the image processing with progress updates."""
+    def _create_executor(self, config: ProcessingConfig, file_count: int) -> Executor:
+        """Build the executor for one run: a process pool, or one thread when multiprocessing is off."""
+        if not config.use_multiprocessing:
+            self._stop_event = self.processor.stop_event = threading.Event()
+            return ThreadPoolExecutor(max_workers=1)
+        
+        # Spawn everywhere: forking a process that already runs Tk is unsafe
+        mp_context = multiprocessing.get_context("spawn")
+        # Handed to workers at start-up, so a plain Event works without a Manager process
+        self._stop_event = mp_context.Event()
+        max_workers = config.max_workers or min(multiprocessing.cpu_count(), file_count)
+        return ProcessPoolExecutor(max_workers=max_workers,
+                                   mp_context=mp_context,
+                                   initializer=_init_worker,
+                                   initargs=(asdict(config), self._stop_event))
+    
+    async def run_processing(self):
+        """Fan files out to the executor, one task per file, and report progress."""
+        results = {"processed": 0, "failed": 0, "skipped": 0, "total": 0}
         try:
-            def progress_callback(current, total):
-                if not self.is_processing:
-                    return False  # Signal to stop
-                progress = current / total
-                # Use default args to capture current values, not references
-                self.root.after(0, lambda p=progress, c=current, t=total: self.update_progress(p, c, t))
-                return True  # Continue processing
-            
-            self.root.after(0, lambda: self.progress_label.configure(text="Processing images..."))
+            loop = asyncio.get_running_loop()
+            config = self.processor.config
+            fingerprint = _config_fingerprint(config)
+            self.progress_label.configure(text="Processing images...")
             
-            results = self.processor.process_folder(progress_callback)
+            input_files = await loop.run_in_executor(None, self.processor.get_image_files,
+                                                     config.input_folder)
+            pairs = [(path, self.processor._get_output_path(path)) for path in input_files]
+            if not self.force_reprocess_var.get():
+                pairs = await loop.run_in_executor(None, filter_unprocessed, pairs, fingerprint)
+            results["skipped"] = len(input_files) - len(pairs)
+            total = results["total"] = len(pairs)
             
-            # Update UI on completion
-            self.root.after(0, lambda: self.processing_complete(results))
+            if pairs:
+                self._executor = self._create_executor(config, total)
+                # Workers get their own ImageProcessor; the thread fallback shares ours
+                worker = _process_one if config.use_multiprocessing else self.processor.process_single_image
+                try:
+                    self.pending_futures = [self._executor.submit(worker, src, out) for src, out in pairs]
+                    waiting = [self._await_result(future, src)
+                               for future, (src, _out) in zip(self.pending_futures, pairs)]
+                    
+                    for done, next_result in enumerate(asyncio.as_completed(waiting), 1):
+                        succeeded = await next_result
+                        results["processed" if succeeded else "failed"] += 1
+                        self._progress_state = (done, total)
+                finally:
+                    # On stop, queued files are dropped and running ones finish in the pool
+                    self.cancel_pending_futures()
+                    record_processed([pair for pair, future in zip(pairs, self.pending_futures)
+                                      if future.done() and not future.cancelled()
+                                      and future.exception() is None and future.result()],
+                                     fingerprint)
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+                    self.pending_futures = []
             
+        except asyncio.CancelledError:
+            results["stopped"] = True
+        except Exception as e:
+            self.processing_error(str(e))
+            return
+        
+        self.processing_complete(results)
+    
+    async def _await_result(self, future: Future, input_path: str) -> bool:
+        """Await one pool task; a task that raised counts as failed and is logged with its file."""
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.root.after(0, lambda: self.processing_error(str(e)))
+            logger.error(f"Task failed for {input_path}: {e}")
+            return False
+    
+    def cancel_pending_futures(self):
+        """Cancel pool tasks that have not started yet."""
+        for future in self.pending_futures:
+            future.cancel()
+    
+    def _pump_progress(self):
+        """Draw the latest progress state, then re-arm while processing."""
+        if not self.is_processing:
+            self._pump_after = None
+            return
+        
+        state = self._progress_state
+        if state is not None and state != self._shown_progress:
+            self._shown_progress = state
+            current, total = state
+            self.update_progress(current / total, current, total)
+        
+        self._pump_after = self.root.after(PROGRESS_PUMP_MS, self._pump_progress)
     
     def update_progress(self, progress: float, current: int, total: int):
         """Update progress bar and label."""
@@ -627,18 +998,20 @@ class ImageProcessorGUI:
         success_count = results.get('processed', 0)
         failed_count = results.get('failed', 0)
         total_count = results.get('total', 0)
+        skipped_count = results.get('skipped', 0)
         was_stopped = results.get('stopped', False)
         
         if was_stopped:
             self.progress_label.configure(
                 text=f"Stopped: {success_count} processed before stopping"
             )
-            messagebox.showinfo(
+            self._show_completion(
                 "Processing Stopped",
                 f"Processing was stopped by user.\n\n"
                 f"Processed before stopping: {success_count} files\n"
                 f"Failed: {failed_count} files"
             )
+            return
         else:
             self.progress_bar.set(1.0)
             self.progress_label.configure(
@@ -650,12 +1023,13 @@ class ImageProcessorGUI:
         subfolder = self.subfolder_var.get() if hasattr(self, 'subfolder_var') else "web_optimized"
         output_location = os.path.join(input_folder, subfolder)
         
-        messagebox.showinfo(
+        self._show_completion(
             "Processing Complete",
             f"Web optimization finished!\n\n"
             f"Successfully processed: {success_count} files\n"
             f"Failed: {failed_count} files\n"
-            f"Total: {total_count} files\n\n"
+            f"Total: {total_count} files\n"
+            f"Skipped (unchanged): {skipped_count} files\n\n"
             f"Output saved to:\n{output_location}"
         )
     
@@ -666,22 +1040,41 @@ class ImageProcessorGUI:
         self.stop_btn.configure(state="disabled")
         self.progress_label.configure(text="Error occurred during processing")
         
-        messagebox.showerror("Processing Error", f"An error occurred:\n{error_message}")
+        self._show_completion("Processing Error", f"An error occurred:\n{error_message}")
+    
+    def _show_completion(self, title: str, body: str):
+        """Show a result panel without a modal grab, so the mainloop keeps running."""
+        win = ctk.CTkToplevel(self.root)
+        win.title(title)
+        win.transient(self.root)
+        win.resizable(False, False)
+        
+        ctk.CTkLabel(win, text=body, justify="left").pack(padx=20, pady=(20, 10))
+        ctk.CTkButton(win, text="OK", command=win.destroy, width=100).pack(pady=(0, 20))
+        win.bind("<Return>", lambda event: win.destroy())
+        win.bind("<Escape>", lambda event: win.destroy())
+        win.after(10, win.focus_force)
     
     def stop_processing(self):
         """Stop the current processing."""
         if self.is_processing:
             self.is_processing = False
-            self.progress_label.configure(text="Stopping after current file...")
+            if self._stop_event is not None:
+                self._stop_event.set()
+            self.cancel_pending_futures()
+            if self._task is not None:
+                self._task.cancel()
+            self.progress_label.configure(text="Stopping...")
             self.stop_btn.configure(state="disabled")
     
     def save_settings(self):
         """Save current settings to file."""
         try:
             config = self.get_current_config()
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".yaml",
-                filetypes=[("YAML files", "*.yaml"), ("All files", "*.*")],
+            file_path = self._ask_path(
+                "settings", filedialog.asksaveasfilename,
+                defaultextension=".json",
+                filetypes=SETTINGS_FILETYPES,
                 title="Save Settings"
             )
             if file_path:
@@ -693,12 +1086,13 @@ class ImageProcessorGUI:
     def load_settings_dialog(self):
         """Load settings from file."""
         try:
-            file_path = filedialog.askopenfilename(
-                filetypes=[("YAML files", "*.yaml"), ("All files", "*.*")],
+            file_path = self._ask_path(
+                "settings", filedialog.askopenfilename,
+                filetypes=SETTINGS_FILETYPES,
                 title="Load Settings"
             )
             if file_path:
-                config = ProcessingConfig.load_from_file(file_path)
+                config = load_settings_file(file_path)
                 self.apply_config(config)
                 messagebox.showinfo("Success", "Settings loaded successfully!")
         except Exception as e:
@@ -706,82 +1100,93 @@ class ImageProcessorGUI:
     
     def apply_config(self, config: ProcessingConfig):
         """Apply configuration to GUI."""
-        self.input_folder_var.set(config.input_folder)
-        self.output_folder_var.set(config.output_folder)
-        self.watermark_path_var.set(config.watermark_path)
-        self.format_var.set(config.output_format)
-        self.quality_var.set(config.jpeg_quality)
-        
-        # Text watermark settings
-        if hasattr(config, 'watermark_text') and hasattr(self, 'watermark_text_var'):
-            self.watermark_text_var.set(config.watermark_text)
-        if hasattr(config, 'text_watermark_opacity') and hasattr(self, 'text_opacity_var'):
-            self.text_opacity_var.set(config.text_watermark_opacity)
-        if hasattr(config, 'text_rotation_angle') and hasattr(self, 'rotation_var'):
-            self.rotation_var.set(config.text_rotation_angle)
-        if hasattr(config, 'text_spacing_ratio') and hasattr(self, 'text_spacing_var'):
-            self.text_spacing_var.set(config.text_spacing_ratio)
-        if hasattr(config, 'text_font_size_ratio') and hasattr(self, 'font_size_var'):
-            self.font_size_var.set(config.text_font_size_ratio)
-        
-        # Web optimization settings
-        if hasattr(config, 'long_edge_pixels') and hasattr(self, 'long_edge_var'):
-            self.long_edge_var.set(config.long_edge_pixels)
-        if hasattr(config, 'target_max_size_kb') and hasattr(self, 'target_size_var'):
-            self.target_size_var.set(config.target_max_size_kb)
-        if hasattr(config, 'subfolder_name') and hasattr(self, 'subfolder_var'):
-            self.subfolder_var.set(config.subfolder_name)
-        if hasattr(config, 'web_output_suffix') and hasattr(self, 'suffix_var'):
-            self.suffix_var.set(config.web_output_suffix)
-        
-        # Legacy settings (for compatibility)
-        self.opacity_var.set(config.watermark_opacity)
-        self.position_var.set(config.watermark_position)
-        self.scale_var.set(config.watermark_scale)
-        
-        if hasattr(config, 'use_tiled_watermark'):
-            self.tiling_var.set(config.use_tiled_watermark)
-        if hasattr(config, 'tile_size_ratio'):
-            self.tile_size_var.set(config.tile_size_ratio)
-        
-        self.max_width_var.set(config.max_width)
-        self.max_height_var.set(config.max_height)
-        self.preserve_aspect_var.set(config.preserve_aspect_ratio)
-        self.multiprocessing_var.set(config.use_multiprocessing)
-        if config.max_workers:
-            self.max_workers_var.set(config.max_workers)
-        
-        # Update labels
-        self.update_quality_label(config.jpeg_quality)
-        if hasattr(self, 'text_opacity_label') and hasattr(config, 'text_watermark_opacity'):
-            self.update_text_opacity_label(config.text_watermark_opacity)
-        if hasattr(self, 'rotation_label') and hasattr(config, 'text_rotation_angle'):
-            self.update_rotation_label(config.text_rotation_angle)
-        if hasattr(self, 'text_spacing_label') and hasattr(config, 'text_spacing_ratio'):
-            self.update_text_spacing_label(config.text_spacing_ratio)
-        if hasattr(self, 'font_size_label') and hasattr(config, 'text_font_size_ratio'):
-            self.update_font_size_label(config.text_font_size_ratio)
-        
-        # Scan files if input folder is set
-        if config.input_folder:
-            self.scan_files()
+        with self._suspend_ui_updates():
+            self.input_folder_var.set(config.input_folder)
+            self.output_folder_var.set(config.output_folder)
+            self.watermark_path_var.set(config.watermark_path)
+            self.format_var.set(config.output_format)
+            self.quality_var.set(config.jpeg_quality)
+            
+            # Text watermark settings
+            if hasattr(config, 'watermark_text') and hasattr(self, 'watermark_text_var'):
+                self.watermark_text_var.set(config.watermark_text)
+            if hasattr(config, 'text_watermark_opacity') and hasattr(self, 'text_opacity_var'):
+                self.text_opacity_var.set(config.text_watermark_opacity)
+            if hasattr(config, 'text_rotation_angle') and hasattr(self, 'rotation_var'):
+                self.rotation_var.set(config.text_rotation_angle)
+            if hasattr(config, 'text_spacing_ratio') and hasattr(self, 'text_spacing_var'):
+                self.text_spacing_var.set(config.text_spacing_ratio)
+            if hasattr(config, 'text_font_size_ratio') and hasattr(self, 'font_size_var'):
+                self.font_size_var.set(config.text_font_size_ratio)
+            
+            # Web optimization settings
+            if hasattr(config, 'long_edge_pixels') and hasattr(self, 'long_edge_var'):
+                self.long_edge_var.set(str(config.long_edge_pixels))
+            if hasattr(config, 'target_max_size_kb') and hasattr(self, 'target_size_var'):
+                self.target_size_var.set(str(config.target_max_size_kb))
+            if hasattr(config, 'subfolder_name') and hasattr(self, 'subfolder_var'):
+                self.subfolder_var.set(config.subfolder_name)
+            if hasattr(config, 'web_output_suffix') and hasattr(self, 'suffix_var'):
+                self.suffix_var.set(config.web_output_suffix)
+            
+            # Legacy settings (for compatibility)
+            legacy = self._legacy
+            self._config_dirty = True  # Plain attributes have no Tk trace
+            legacy.watermark_opacity = config.watermark_opacity
+            legacy.watermark_position = config.watermark_position
+            legacy.watermark_scale = config.watermark_scale
+            legacy.use_tiled_watermark = config.use_tiled_watermark
+            legacy.tile_size_ratio = config.tile_size_ratio
+            legacy.max_width = config.max_width
+            legacy.max_height = config.max_height
+            legacy.preserve_aspect_ratio = config.preserve_aspect_ratio
+            legacy.use_multiprocessing = config.use_multiprocessing
+            if config.max_workers:
+                legacy.max_workers = config.max_workers
+            legacy.text_font_path = config.text_font_path
+            
+            # Update labels
+            self.update_quality_label(config.jpeg_quality)
+            if hasattr(self, 'text_opacity_label') and hasattr(config, 'text_watermark_opacity'):
+                self.update_text_opacity_label(config.text_watermark_opacity)
+            if hasattr(self, 'rotation_label') and hasattr(config, 'text_rotation_angle'):
+                self.update_rotation_label(config.text_rotation_angle)
+            if hasattr(self, 'text_spacing_label') and hasattr(config, 'text_spacing_ratio'):
+                self.update_text_spacing_label(config.text_spacing_ratio)
+            if hasattr(self, 'font_size_label') and hasattr(config, 'text_font_size_ratio'):
+                self.update_font_size_label(config.text_font_size_ratio)
+        
+        # Scan files if input folder is set, once the new values have been drawn;
+        # the count on screen is still right if the scanned folder hasn't changed
+        if config.input_folder and (os.path.abspath(config.input_folder), config.subfolder_name,
+                                    config.web_output_suffix) != self._last_scanned:
+            self.root.after_idle(self.scan_files)
     
     def load_settings(self):
         """Load default settings from config file if it exists."""
-        config_path = "config/default_settings.yaml"
+        config_path = DEFAULT_SETTINGS_PATH
+        if not os.path.exists(config_path):
+            config_path = LEGACY_SETTINGS_PATH  # Migrated to JSON on the next save
         if os.path.exists(config_path):
             try:
-                config = ProcessingConfig.load_from_file(config_path)
+                config = load_settings_file(config_path)
                 self.apply_config(config)
+                if config_path == DEFAULT_SETTINGS_PATH:
+                    # Closing without changes then needn't rewrite the file
+                    self._last_saved_hash = hash(repr(self.get_current_config()))
             except Exception as e:
                 print(f"Failed to load default settings: {e}")
     
     def save_default_settings(self):
         """Save current settings as default."""
         try:
-            os.makedirs("config", exist_ok=True)
             config = self.get_current_config()
-            config.save_to_file("config/default_settings.yaml")
+            config_hash = hash(repr(config))
+            if config_hash == self._last_saved_hash and os.path.exists(DEFAULT_SETTINGS_PATH):
+                return  # Unchanged since last load/save
+            os.makedirs("config", exist_ok=True)
+            config.save_to_file(DEFAULT_SETTINGS_PATH)
+            self._last_saved_hash = config_hash
         except Exception as e:
             print(f"Failed to save default settings: {e}")
     
@@ -791,6 +1196,10 @@ class ImageProcessorGUI:
         if self.is_processing:
             if messagebox.askokcancel("Quit", "Processing is in progress. Do you want to quit?"):
                 self.is_processing = False
+                # Drop queued files and stop running ones so interpreter exit doesn't wait
+                if self._stop_event is not None:
+                    self._stop_event.set()
+                self.cancel_pending_futures()
                 self.root.destroy()
         else:
             self.root.destroy()
@@ -9,10 +9,12 @@ Includes Power Automate workflows, Power Apps integration, and HTTP API endpoint
 import os
 import sys
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import tempfile
 import base64
+import binascii
+import shutil
 from datetime import datetime
 
 # Flask for creating HTTP API endpoints
@@ -23,11 +25,58 @@ try:
 except ImportError:
     FLASK_AVAILABLE = False
 
+# pybase64 uses SIMD codecs for the multi-MB image payloads; fall back to the stdlib
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+    _b64encode_str = pybase64.b64encode_as_string
+except ImportError:
+    _b64decode = base64.b64decode
+    
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
 # Local imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from image_processor import ImageProcessor, ProcessingConfig
 from loguru import logger
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Base64 text is decoded this many characters at a time (a multiple of 4)
+BASE64_CHUNK_CHARS = 64 * 1024
+
+
+def _remove_quietly(path: str) -> None:
+    """Delete a temp file, ignoring it if already gone or still locked."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def write_base64(encoded: str, fileobj) -> None:
+    """Decode base64 text into a binary file a chunk at a time.
+    
+    Only one chunk of decoded bytes is held at once. If whitespace or stray
+    characters break the 4-character alignment of the chunks, the text is
+    decoded in one go instead (leniently, as before). Raises binascii.Error
+    or ValueError for data that isn't base64.
+    """
+    try:
+        for start in range(0, len(encoded), BASE64_CHUNK_CHARS):
+            chunk = encoded[start:start + BASE64_CHUNK_CHARS]
+            decoded = binascii.a2b_base64(chunk)
+            # A full chunk of clean base64 decodes to exactly 3/4 of its length
+            if start + BASE64_CHUNK_CHARS < len(encoded) and len(decoded) * 4 != len(chunk) * 3:
+                raise binascii.Error("base64 chunk not aligned")
+            fileobj.write(decoded)
+    except binascii.Error:
+        fileobj.seek(0)
+        fileobj.truncate()
+        fileobj.write(_b64decode(encoded, validate=False))
+
 
 class PowerPlatformAPI:
     """HTTP API for Power Platform integration."""
@@ -89,6 +138,61 @@ class PowerPlatformAPI:
                 logger.error(f"API error processing image: {e}")
                 return jsonify({'error': str(e)}), 500
         
+        @self.app.route('/api/process-image-stream', methods=['POST'])
+        def process_single_image_stream():
+            """Process a single uploaded image and return it as a file download."""
+            try:
+                if 'file' not in request.files:
+                    return jsonify({'error': 'No file provided'}), 400
+                
+                file = request.files['file']
+                if file.filename == '':
+                    return jsonify({'error': 'No file selected'}), 400
+                
+                if not self.allowed_file(file.filename):
+                    return jsonify({'error': 'File type not supported'}), 400
+                
+                options = self.get_processing_options(request)
+                output_path, output_format = self.process_upload_to_file(file, options)
+                if output_path is None:
+                    return jsonify({'success': False, 'filename': file.filename,
+                                    'error': 'Processing failed'}), 500
+                
+                return self.send_output_file(output_path, output_format, file.filename)
+                
+            except Exception as e:
+                logger.error(f"API error processing image stream: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/process-raw', methods=['POST'])
+        def process_raw_image():
+            """Process an image sent as a raw application/octet-stream body.
+            
+            Clients that can send binary skip base64 both ways: the body is
+            streamed to disk and the result comes back as a file download.
+            Options and the original filename are passed as query parameters.
+            """
+            try:
+                if request.mimetype != 'application/octet-stream':
+                    return jsonify({'error': 'Expected an application/octet-stream body'}), 415
+                
+                filename = request.args.get('filename', 'image.jpg')
+                if not self.allowed_file(filename):
+                    return jsonify({'error': 'File type not supported'}), 400
+                
+                options = self.get_processing_options(request)
+                output_path, output_format = self.process_stream_to_file(
+                    request.stream, Path(filename).suffix, options)
+                if output_path is None:
+                    return jsonify({'success': False, 'filename': filename,
+                                    'error': 'Processing failed'}), 500
+                
+                return self.send_output_file(output_path, output_format, filename)
+                
+            except Exception as e:
+                logger.error(f"API error processing raw image: {e}")
+                return jsonify({'error': str(e)}), 500
+        
         @self.app.route('/api/process-batch', methods=['POST'])
         def process_batch_images():
             """Process multiple uploaded images."""
@@ -123,23 +227,30 @@ class PowerPlatformAPI:
         
         @self.app.route('/api/process-base64', methods=['POST'])
         def process_base64_image():
-            """Process a base64 encoded image (useful for Power Apps)."""
+            """Process a base64 encoded image (useful for Power Apps).
+            
+            Kept for Power Automate/Power Apps; clients that can send binary
+            should use /api/process-raw instead.
+            """
             try:
                 data = request.get_json()
                 if not data or 'image' not in data:
                     return jsonify({'error': 'No image data provided'}), 400
                 
-                # Decode base64 image
+                # Decode the base64 image straight into a temp file
+                temp_input = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
                 try:
-                    image_data = base64.b64decode(data['image'])
+                    with temp_input:
+                        write_base64(data['image'], temp_input)
                 except Exception:
+                    _remove_quietly(temp_input.name)
                     return jsonify({'error': 'Invalid base64 image data'}), 400
                 
                 # Get processing options
                 options = data.get('options', {})
                 
                 # Process the image
-                result = self.process_base64_data(image_data, options)
+                result = self.process_input_file(temp_input.name, options)
                 
                 if result['success']:
                     return jsonify(result), 200
@@ -177,7 +288,8 @@ class PowerPlatformAPI:
     
     def get_processing_options(self, request) -> Dict[str, Any]:
         """Extract processing options from request."""
-        form_data = request.form.to_dict()
+        # Raw-body requests carry their options in the query string
+        form_data = {**request.args.to_dict(), **request.form.to_dict()}
         
         options = {}
         
@@ -211,99 +323,98 @@ class PowerPlatformAPI:
         
         return options
     
+    def process_file_to_file(self, input_path: str, options: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """Process a temp input file into a temp output file.
+        
+        The input is always deleted. Returns (output path, output format); the
+        path is None if processing failed. The caller owns the output file and
+        must delete it.
+        """
+        try:
+            temp_config = self.apply_options_to_config(options)
+            temp_processor = ImageProcessor(temp_config)
+            
+            with tempfile.NamedTemporaryFile(suffix=f".{temp_config.output_format.lower()}", delete=False) as temp_output:
+                pass
+            
+            try:
+                success = temp_processor.process_single_image(input_path, temp_output.name)
+            except Exception:
+                _remove_quietly(temp_output.name)
+                raise
+        finally:
+            _remove_quietly(input_path)
+        
+        if not success:
+            _remove_quietly(temp_output.name)
+            return None, temp_config.output_format
+        return temp_output.name, temp_config.output_format
+    
+    def process_stream_to_file(self, stream, suffix: str, options: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """Copy a binary stream to a temp file and process it (see process_file_to_file)."""
+        temp_input = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        try:
+            # Copy straight from the request stream instead of buffering it again
+            with temp_input:
+                shutil.copyfileobj(stream, temp_input, UPLOAD_CHUNK_SIZE)
+        except Exception:
+            _remove_quietly(temp_input.name)
+            raise
+        return self.process_file_to_file(temp_input.name, options)
+    
+    def process_upload_to_file(self, file, options: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """Process an uploaded file into a temp file (see process_file_to_file)."""
+        return self.process_stream_to_file(file.stream, Path(file.filename).suffix, options)
+    
+    def send_output_file(self, output_path: str, output_format: str, filename: str):
+        """Return a processed temp file as a download, deleting it once sent."""
+        # The file is streamed from disk, so it must outlive this request handler
+        response = send_file(
+            output_path,
+            mimetype=f'image/{output_format.lower()}',
+            as_attachment=True,
+            download_name=f"{Path(filename).stem}.{output_format.lower()}"
+        )
+        response.call_on_close(lambda: _remove_quietly(output_path))
+        return response
+    
+    def encode_output_file(self, output_path: Optional[str], output_format: str) -> Dict[str, Any]:
+        """Read a processed temp file into a base64 result dict and delete it."""
+        if output_path is None:
+            return {
+                'success': False,
+                'error': 'Processing failed'
+            }
+        
+        try:
+            # Read processed image and encode as base64
+            with open(output_path, 'rb') as f:
+                processed_data = f.read()
+        finally:
+            _remove_quietly(output_path)
+        
+        return {
+            'success': True,
+            'processed_image': _b64encode_str(processed_data),
+            'format': output_format,
+            'size': len(processed_data)
+        }
+    
     def process_uploaded_file(self, file, options: Dict[str, Any]) -> Dict[str, Any]:
-        """Process an uploaded file."""
+        """Process an uploaded file and return it base64 encoded (for Power Apps)."""
         try:
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(suffix=Path(file.filename).suffix, delete=False) as temp_input:
-                file.save(temp_input.name)
-                
-                # Apply options to config
-                temp_config = self.apply_options_to_config(options)
-                temp_processor = ImageProcessor(temp_config)
-                
-                with tempfile.NamedTemporaryFile(suffix=f".{temp_config.output_format.lower()}", delete=False) as temp_output:
-                    # Process the image
-                    success = temp_processor.process_single_image(temp_input.name, temp_output.name)
-                    
-                    if success:
-                        # Read processed image and encode as base64
-                        with open(temp_output.name, 'rb') as f:
-                            processed_data = f.read()
-                        
-                        encoded_image = base64.b64encode(processed_data).decode('utf-8')
-                        
-                        # Cleanup temp files
-                        os.unlink(temp_input.name)
-                        os.unlink(temp_output.name)
-                        
-                        return {
-                            'success': True,
-                            'filename': file.filename,
-                            'processed_image': encoded_image,
-                            'format': temp_config.output_format,
-                            'size': len(processed_data)
-                        }
-                    else:
-                        # Cleanup temp files
-                        os.unlink(temp_input.name)
-                        os.unlink(temp_output.name)
-                        
-                        return {
-                            'success': False,
-                            'filename': file.filename,
-                            'error': 'Processing failed'
-                        }
-                        
+            result = self.encode_output_file(*self.process_upload_to_file(file, options))
         except Exception as e:
-            return {
+            result = {
                 'success': False,
-                'filename': file.filename,
                 'error': str(e)
             }
+        return {'filename': file.filename, **result}
     
-    def process_base64_data(self, image_data: bytes, options: Dict[str, Any]) -> Dict[str, Any]:
-        """Process base64 image data."""
+    def process_input_file(self, input_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a temp input file (deleted afterwards) into a base64 result dict."""
         try:
-            # Apply options to config
-            temp_config = self.apply_options_to_config(options)
-            temp_processor = ImageProcessor(temp_config)
-            
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_input:
-                temp_input.write(image_data)
-                temp_input.flush()
-                
-                with tempfile.NamedTemporaryFile(suffix=f".{temp_config.output_format.lower()}", delete=False) as temp_output:
-                    # Process the image
-                    success = temp_processor.process_single_image(temp_input.name, temp_output.name)
-                    
-                    if success:
-                        # Read processed image and encode as base64
-                        with open(temp_output.name, 'rb') as f:
-                            processed_data = f.read()
-                        
-                        encoded_image = base64.b64encode(processed_data).decode('utf-8')
-                        
-                        # Cleanup temp files
-                        os.unlink(temp_input.name)
-                        os.unlink(temp_output.name)
-                        
-                        return {
-                            'success': True,
-                            'processed_image': encoded_image,
-                            'format': temp_config.output_format,
-                            'size': len(processed_data)
-                        }
-                    else:
-                        # Cleanup temp files
-                        os.unlink(temp_input.name)
-                        os.unlink(temp_output.name)
-                        
-                        return {
-                            'success': False,
-                            'error': 'Processing failed'
-                        }
-                        
+            return self.encode_output_file(*self.process_file_to_file(input_path, options))
         except Exception as e:
             return {
                 'success': False,
@@ -29,7 +29,7 @@ REM Run the enhanced setup if this is first run
 if not exist "logs" (
     echo.
     echo Running initial setup...
-    python enhanced_setup.py
+    python enhanced_setup.py --with-samples
     if errorlevel 1 (
         echo Setup failed. Please check the error messages above.
         pause
@@ -0,0 +1 @@
+"""Image processing core shared by the CLI, GUI and cloud integrations."""
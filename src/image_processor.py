@@ -16,10 +16,12 @@ Date: July 2025
 
 import os
 import sys
+import functools
+import threading
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, BinaryIO, Iterator, Union
 import logging
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import multiprocessing as mp
 
 # Core image processing
@@ -36,9 +38,10 @@ from pdf2image import convert_from_path
 from tqdm import tqdm
 
 # Configuration
-import yaml
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+import hashlib
 import json
+import pickle
 
 # Logging setup
 from loguru import logger
@@ -46,6 +49,108 @@ from loguru import logger
 # Setup logging
 logger.add("logs/image_processor_{time}.log", rotation="1 day", retention="30 days")
 
+# Parsed config files are cached here, keyed on path and validated by mtime + size
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "ipp"
+
+# Minimum ratio of draft-decoded size to final size (same default as Image.thumbnail)
+JPEG_DRAFT_REDUCING_GAP = 2.0
+
+# Rendered text watermark overlays kept per processor (one per image width)
+TEXT_OVERLAY_CACHE_SIZE = 4
+
+# Text watermark fonts tried in order when ProcessingConfig.text_font_path is unset
+WATERMARK_FONT_PATHS = (
+    "C:/Windows/Fonts/segoeui.ttf",  # Modern Windows font - crisp and clean
+    "C:/Windows/Fonts/calibri.ttf",  # Clean sans-serif
+    "C:/Windows/Fonts/arial.ttf",    # Fallback
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+)
+
+# Lowercase input extensions, matched against os.path.splitext()
+SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.pdf'})
+
+
+def _parse_yaml_file(filepath: str) -> Dict[str, Any]:
+    """Parse a YAML file, using libyaml's C loader when available.
+    
+    Older configs were dumped with the full (unsafe) dumper; their
+    !!python/tuple tags are accepted and loaded as tuples.
+    """
+    import yaml
+    
+    class ConfigLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+        pass
+    
+    ConfigLoader.add_constructor(
+        'tag:yaml.org,2002:python/tuple',
+        lambda loader, node: tuple(loader.construct_sequence(node))
+    )
+    # One unbuffered whole-file read; yaml detects the encoding from the bytes
+    return yaml.load(Path(filepath).read_bytes(), Loader=ConfigLoader)
+
+
+class ProcessingCancelled(Exception):
+    """Raised between processing stages once the processor's stop_event is set."""
+
+
+@functools.lru_cache(maxsize=None)
+def _find_watermark_font(preferred: Optional[str] = None) -> Optional[str]:
+    """Return the configured font if it exists, else the first available fallback."""
+    candidates = ((preferred,) if preferred else ()) + WATERMARK_FONT_PATHS
+    for font_path in candidates:
+        if os.path.exists(font_path):
+            logger.debug(f"Using font: {font_path}")
+            return font_path
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_watermark_font(font_path: Optional[str], size: int):
+    """Open a TrueType font once per (path, size); Pillow re-parses the file on every truetype() call."""
+    if font_path is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(font_path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+def _config_format(filepath: str, fmt: Optional[str] = None) -> str:
+    """Resolve a config file format: explicit ``fmt``, else by extension (YAML default)."""
+    if fmt:
+        return fmt.lower()
+    return 'json' if Path(filepath).suffix.lower() == '.json' else 'yaml'
+
+
+def _load_yaml_cached(filepath: str) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the cached result while the file is unchanged."""
+    file_stat = os.stat(filepath)
+    abs_path = os.path.abspath(filepath)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    cache_path = CONFIG_CACHE_DIR / f"{hashlib.sha256(abs_path.encode('utf-8')).hexdigest()}.pkl"
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_path, cached_signature, data = pickle.load(f)
+        if cached_path == abs_path and cached_signature == signature:
+            return data
+    except Exception:
+        pass  # Missing or unreadable cache - parse below
+    
+    data = _parse_yaml_file(filepath)
+    
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as f:
+            pickle.dump((abs_path, signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+    
+    return data
+
 
 @dataclass
 class ProcessingConfig:
@@ -61,6 +166,7 @@ class ProcessingConfig:
     png_compression: int = 6
     webp_quality: int = 100
     target_max_size_kb: int = 5000  # No real limit - quality is priority
+    one_shot_quality: Optional[int] = None  # Encode JPEGs once at this quality, skipping the target-size search
     preserve_metadata: bool = True  # Preserve EXIF and other metadata from original
     
     # Watermark settings
@@ -85,6 +191,7 @@ class ProcessingConfig:
     use_text_outline: bool = False  # No outline - clean single color
     text_outline_width: int = 0  # No outline
     text_outline_color: tuple = (0, 0, 0, 0)  # Disabled
+    text_font_path: Optional[str] = None  # TrueType font file (None = first of WATERMARK_FONT_PATHS found)
     
     # Web optimization settings
     long_edge_pixels: int = 2400  # Resize to this on long edge (larger for legible watermark)
@@ -103,30 +210,107 @@ class ProcessingConfig:
     # Performance settings
     use_multiprocessing: bool = False  # Disabled - causes issues with PyInstaller GUI
     max_workers: Optional[int] = None
+    jpeg_shrink_on_load: bool = True  # Let libjpeg decode large JPEGs at reduced scale
+    cache_text_overlay: bool = True  # Render the tiled text watermark once per width, reuse per image
+    
+    # Azure settings
+    blob_max_concurrency: int = 8  # Parallel chunk transfers per blob upload/download
+    http_pool_size: Optional[int] = None  # Max pooled HTTP connections (None = 4x max_workers, min 32)
     
     # PDF settings
     pdf_dpi: int = 200
+    reuse_pdf_context: bool = True  # Render PDFs in-process with PyMuPDF instead of a pdftoppm subprocess per file
     
-    def save_to_file(self, filepath: str) -> None:
-        """Save configuration to YAML file."""
-        with open(filepath, 'w') as f:
-            yaml.dump(asdict(self), f, default_flow_style=False)
+    def save_to_file(self, filepath: str, fmt: Optional[str] = None) -> None:
+        """Save configuration to a YAML or JSON file (by ``fmt`` or extension).
+        
+        The document is serialised in memory and written with a single call.
+        """
+        if _config_format(filepath, fmt) == 'json':
+            data = json.dumps(asdict(self), indent=2).encode('utf-8')
+        else:
+            import yaml
+            data = yaml.dump(asdict(self), Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                             default_flow_style=False, encoding='utf-8')
+        Path(filepath).write_bytes(data)
     
     @classmethod
-    def load_from_file(cls, filepath: str) -> 'ProcessingConfig':
-        """Load configuration from YAML file."""
-        with open(filepath, 'r') as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+    def load_from_file(cls, filepath: str, use_cache: bool = True,
+                       fmt: Optional[str] = None) -> 'ProcessingConfig':
+        """Load configuration from a YAML or JSON file (by ``fmt`` or extension).
+        
+        With ``use_cache``, a parsed YAML file is cached under ~/.cache/ipp and
+        reused until the file's mtime or size changes. JSON is read directly.
+        """
+        if _config_format(filepath, fmt) == 'json':
+            data = json.loads(Path(filepath).read_bytes())
+        else:
+            data = _load_yaml_cached(filepath) if use_cache else _parse_yaml_file(filepath)
+        
+        # JSON and safe-dumped YAML store tuples (e.g. colours) as lists
+        tuple_fields = {f.name for f in fields(cls) if f.type is tuple}
+        return cls(**{key: tuple(value) if key in tuple_fields and isinstance(value, list) else value
+                      for key, value in data.items()})
+
+
+def iter_image_files(folder_path: str, subfolder_name: Optional[str] = "web_optimized",
+                     web_suffix: Optional[str] = "_web") -> Iterator[str]:
+    """Yield supported images under folder_path as they are found, in walk order.
+    
+    Skips output subfolders and files that already carry the web suffix.
+    Module-level so callers that only need a file count (e.g. the GUI scan)
+    don't have to build an ImageProcessor or hold the full list.
+    """
+    # Get the output subfolder name to exclude
+    output_subfolder = subfolder_name.lower() if subfolder_name else "web_optimized"
+    web_suffix = web_suffix.lower() if web_suffix else "_web"
+    
+    # Depth-first os.scandir walk: DirEntry carries the file type, so no per-file stat
+    pending = [folder_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk: don't follow directory symlinks, and skip
+                        # output subfolders to prevent reprocessing
+                        if not entry.is_symlink() and entry.name.lower() != output_subfolder:
+                            pending.append(entry.path)
+                        continue
+                    
+                    file_stem, file_ext = os.path.splitext(entry.name.lower())
+                    
+                    # Skip files that have already been processed (have web suffix)
+                    if web_suffix and file_stem.endswith(web_suffix):
+                        continue
+                    
+                    if file_ext in SUPPORTED_EXTENSIONS:
+                        yield entry.path
+        except OSError:
+            continue  # Unreadable directory - os.walk skips these too
+
+
+def find_image_files(folder_path: str, subfolder_name: Optional[str] = "web_optimized",
+                     web_suffix: Optional[str] = "_web") -> List[str]:
+    """Find supported images under folder_path, sorted, skipping output folders and outputs."""
+    return sorted(iter_image_files(folder_path, subfolder_name, web_suffix))
 
 
 class ImageProcessor:
     """Advanced image processor with watermarking and optimization capabilities."""
     
+    _SUPPORTED_EXTS = SUPPORTED_EXTENSIONS
+    
     def __init__(self, config: ProcessingConfig):
         self.config = config
-        self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.pdf'}
+        self.supported_formats = self._SUPPORTED_EXTS
         self.watermark_image = None
+        # Optional threading/multiprocessing Event; checked between decode, resize and encode
+        self.stop_event = None
+        # Rendered text overlays keyed on image width (font size follows width)
+        self._text_overlay_cache: Dict[int, Image.Image] = {}
+        # One processor may serve several threads (Azure workers, the GUI thread fallback)
+        self._text_overlay_lock = threading.Lock()
         
         # Load watermark if specified
         if config.watermark_path and os.path.exists(config.watermark_path):
@@ -136,6 +320,19 @@ class ImageProcessor:
         os.makedirs(config.output_folder, exist_ok=True)
         os.makedirs("logs", exist_ok=True)
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the lock, stop event and overlay cache (for ProcessPoolExecutor)."""
+        state = self.__dict__.copy()
+        del state['_text_overlay_lock']
+        state['stop_event'] = None
+        state['_text_overlay_cache'] = {}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled processor with a fresh overlay lock."""
+        self.__dict__.update(state)
+        self._text_overlay_lock = threading.Lock()
+    
     def load_watermark(self, watermark_path: str) -> None:
         """Load and prepare watermark image."""
         try:
@@ -157,122 +354,12 @@ class ImageProcessor:
             if image.mode != 'RGBA':
                 image = image.convert('RGBA')
             
-            img_width, img_height = image.size
-            
-            # Calculate font size based on image dimensions
-            font_size = max(int(img_width * self.config.text_font_size_ratio), 12)
-            
-            # Try to load a font, fall back to default
-            try:
-                # Try modern crisp fonts first (Segoe UI is clean and modern)
-                font_paths = [
-                    "C:/Windows/Fonts/segoeui.ttf",  # Modern Windows font - crisp and clean
-                    "C:/Windows/Fonts/calibri.ttf",  # Clean sans-serif
-                    "C:/Windows/Fonts/arial.ttf",    # Fallback
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                    "/System/Library/Fonts/Helvetica.ttc",
-                ]
-                font = None
-                for font_path in font_paths:
-                    if os.path.exists(font_path):
-                        font = ImageFont.truetype(font_path, font_size)
-                        logger.debug(f"Using font: {font_path}")
-                        break
-                if font is None:
-                    font = ImageFont.load_default()
-            except Exception:
-                font = ImageFont.load_default()
-            
-            # Create a temporary image to measure text size
-            temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
-            temp_draw = ImageDraw.Draw(temp_img)
-            
-            # Get text bounding box - prepend hardcoded copyright symbol
-            text = "\u00A9 " + self.config.watermark_text
-            bbox = temp_draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            # Create watermark overlay for single text block (will be rotated)
-            # Make it bigger to account for rotation and outline
-            padding = 80
-            single_text_img = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(single_text_img)
-            
-            # Get opacity and color settings
-            opacity = self.config.text_watermark_opacity
-            
-            # Get watermark color (default to grey if not set)
-            text_color = getattr(self.config, 'text_watermark_color', (128, 128, 128))
-            if isinstance(text_color, list):
-                text_color = tuple(text_color)
-            # Add opacity as alpha channel
-            fill_color = (*text_color[:3], opacity)
-            
-            # Draw text with outline for visibility on any background (if enabled)
-            if self.config.use_text_outline and self.config.text_outline_width > 0:
-                outline_width = self.config.text_outline_width
-                outline_color = self.config.text_outline_color
-                # Convert list to tuple if needed (for YAML compatibility)
-                if isinstance(outline_color, list):
-                    outline_color = tuple(outline_color)
-                
-                # Draw outline by rendering text multiple times offset in all directions
-                for dx in range(-outline_width, outline_width + 1):
-                    for dy in range(-outline_width, outline_width + 1):
-                        if dx != 0 or dy != 0:  # Skip center position
-                            draw.text((padding + dx, padding + dy), text, font=font, fill=outline_color)
-            
-            # Draw main text (grey or configured color)
-            draw.text((padding, padding), text, font=font, fill=fill_color)
-            
-            # Rotate the text block
-            rotated_text = single_text_img.rotate(
-                self.config.text_rotation_angle, 
-                expand=True, 
-                resample=Image.Resampling.BICUBIC
-            )
-            
-            # Get rotated dimensions
-            rotated_width, rotated_height = rotated_text.size
-            
-            # Calculate spacing between watermarks
-            # spacing_ratio is the GAP between tiles as a fraction of tile size
-            # Total step = tile size + gap
-            gap_x = int(rotated_width * self.config.text_spacing_ratio)
-            gap_y = int(rotated_height * self.config.text_spacing_ratio)
-            spacing_x = rotated_width + gap_x
-            spacing_y = rotated_height + gap_y
-            
-            # Create the full overlay
-            overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-            
-            # Tile the rotated text across the entire image
-            # Start from negative positions to ensure full coverage
-            start_x = -rotated_width
-            start_y = -rotated_height
-            
-            tiles_placed = 0
-            y = start_y
-            row = 0
-            while y < img_height + rotated_height:
-                x = start_x
-                # Offset every other row for diagonal pattern
-                if row % 2 == 1:
-                    x += spacing_x // 2
-                
-                while x < img_width + rotated_width:
-                    overlay.paste(rotated_text, (x, y), rotated_text)
-                    tiles_placed += 1
-                    x += spacing_x
-                
-                y += spacing_y
-                row += 1
+            overlay = self._get_text_overlay(*image.size)
             
             # Composite the watermark onto the image
             result = Image.alpha_composite(image, overlay)
             
-            logger.info(f"Applied text watermark: '{text}' - {tiles_placed} tiles at {opacity}/255 opacity")
+            logger.info(f"Applied text watermark at {self.config.text_watermark_opacity}/255 opacity")
             return result
             
         except Exception as e:
@@ -281,6 +368,128 @@ class ImageProcessor:
             traceback.print_exc()
             return image
     
+    def _get_text_overlay(self, img_width: int, img_height: int) -> Image.Image:
+        """Return the tiled text overlay for an image size, rendering it at most once per width.
+        
+        Tiles are laid out from the top-left corner, so the overlay for a shorter
+        image of the same width is a crop of a taller one.
+        """
+        if not self.config.cache_text_overlay:
+            return self._render_text_overlay(img_width, img_height)
+        
+        with self._text_overlay_lock:
+            overlay = self._text_overlay_cache.get(img_width)
+            if overlay is None or overlay.height < img_height:
+                # Render at least a long-edge square so later portraits of this width reuse it
+                overlay = self._render_text_overlay(
+                    img_width, max(img_height, self.config.long_edge_pixels))
+                self._text_overlay_cache.pop(img_width, None)
+                if len(self._text_overlay_cache) >= TEXT_OVERLAY_CACHE_SIZE:
+                    # Evict the oldest width (dicts keep insertion order)
+                    del self._text_overlay_cache[next(iter(self._text_overlay_cache))]
+                self._text_overlay_cache[img_width] = overlay
+        
+        if overlay.height == img_height:
+            return overlay
+        return overlay.crop((0, 0, img_width, img_height))
+    
+    def _render_text_overlay(self, img_width: int, img_height: int) -> Image.Image:
+        """Render the rotated, tiled text watermark onto a transparent canvas."""
+        # Calculate font size based on image dimensions
+        font_size = max(int(img_width * self.config.text_font_size_ratio), 12)
+        
+        # Load the font (cached per path and size), fall back to default
+        font = _load_watermark_font(_find_watermark_font(self.config.text_font_path), font_size)
+        
+        # Create a temporary image to measure text size
+        temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
+        temp_draw = ImageDraw.Draw(temp_img)
+        
+        # Get text bounding box - prepend hardcoded copyright symbol
+        text = "\u00A9 " + self.config.watermark_text
+        bbox = temp_draw.textbbox((0, 0), text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        # Create watermark overlay for single text block (will be rotated)
+        # Make it bigger to account for rotation and outline
+        padding = 80
+        single_text_img = Image.new('RGBA', (text_width + padding * 2, text_height + padding * 2), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(single_text_img)
+        
+        # Get opacity and color settings
+        opacity = self.config.text_watermark_opacity
+        
+        # Get watermark color (default to grey if not set)
+        text_color = getattr(self.config, 'text_watermark_color', (128, 128, 128))
+        if isinstance(text_color, list):
+            text_color = tuple(text_color)
+        # Add opacity as alpha channel
+        fill_color = (*text_color[:3], opacity)
+        
+        # Draw text with outline for visibility on any background (if enabled)
+        if self.config.use_text_outline and self.config.text_outline_width > 0:
+            outline_width = self.config.text_outline_width
+            outline_color = self.config.text_outline_color
+            # Convert list to tuple if needed (for YAML compatibility)
+            if isinstance(outline_color, list):
+                outline_color = tuple(outline_color)
+            
+            # Draw outline by rendering text multiple times offset in all directions
+            for dx in range(-outline_width, outline_width + 1):
+                for dy in range(-outline_width, outline_width + 1):
+                    if dx != 0 or dy != 0:  # Skip center position
+                        draw.text((padding + dx, padding + dy), text, font=font, fill=outline_color)
+        
+        # Draw main text (grey or configured color)
+        draw.text((padding, padding), text, font=font, fill=fill_color)
+        
+        # Rotate the text block
+        rotated_text = single_text_img.rotate(
+            self.config.text_rotation_angle, 
+            expand=True, 
+            resample=Image.Resampling.BICUBIC
+        )
+        
+        # Get rotated dimensions
+        rotated_width, rotated_height = rotated_text.size
+        
+        # Calculate spacing between watermarks
+        # spacing_ratio is the GAP between tiles as a fraction of tile size
+        # Total step = tile size + gap
+        gap_x = int(rotated_width * self.config.text_spacing_ratio)
+        gap_y = int(rotated_height * self.config.text_spacing_ratio)
+        spacing_x = rotated_width + gap_x
+        spacing_y = rotated_height + gap_y
+        
+        # Create the full overlay
+        overlay = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
+        
+        # Tile the rotated text across the entire image
+        # Start from negative positions to ensure full coverage
+        start_x = -rotated_width
+        start_y = -rotated_height
+        
+        tiles_placed = 0
+        y = start_y
+        row = 0
+        while y < img_height + rotated_height:
+            x = start_x
+            # Offset every other row for diagonal pattern
+            if row % 2 == 1:
+                x += spacing_x // 2
+            
+            while x < img_width + rotated_width:
+                overlay.paste(rotated_text, (x, y), rotated_text)
+                tiles_placed += 1
+                x += spacing_x
+            
+            y += spacing_y
+            row += 1
+        
+        logger.debug(f"Rendered text watermark overlay '{text}': {img_width}x{img_height}, {tiles_placed} tiles")
+        return overlay
+    
     def apply_watermark(self, image: Image.Image) -> Image.Image:
         """Apply watermark to image - text watermark, tiled pattern, or single positioned watermark."""
         # Use text watermark if configured (primary mode for Michael J Wright Estate)
@@ -411,6 +620,25 @@ class ImageProcessor:
         }
         return positions.get(self.config.watermark_position, positions['bottom-right'])
     
+    def _draft_for_long_edge(self, image: Image.Image) -> None:
+        """Ask the decoder for a reduced-scale decode that still covers the target size.
+        
+        For JPEG this selects libjpeg's DCT scaling (1/2, 1/4, 1/8), so only the
+        needed coefficients are decoded; other formats ignore draft(). Like
+        Image.thumbnail(), the decode is kept at least JPEG_DRAFT_REDUCING_GAP
+        times the final size so the LANCZOS pass in resize_for_web() still
+        does the final, high-quality reduction.
+        """
+        width, height = image.size
+        scale = self.config.long_edge_pixels / max(width, height)
+        if scale * JPEG_DRAFT_REDUCING_GAP >= 1:
+            return
+        
+        requested = (int(width * scale * JPEG_DRAFT_REDUCING_GAP),
+                     int(height * scale * JPEG_DRAFT_REDUCING_GAP))
+        if image.draft(None, requested):
+            logger.debug(f"Draft decode {width}x{height} -> {image.size}")
+    
     def resize_for_web(self, image: Image.Image) -> Image.Image:
         """Resize image for web optimization.
         
@@ -444,6 +672,12 @@ class ImageProcessor:
     
     def process_pdf(self, pdf_path: str) -> List[Image.Image]:
         """Convert PDF pages to images."""
+        if self.config.reuse_pdf_context:
+            try:
+                return self._render_pdf_in_process(pdf_path)
+            except Exception as e:
+                logger.warning(f"PyMuPDF render failed for {pdf_path}, falling back to pdf2image: {e}")
+        
         try:
             images = convert_from_path(pdf_path, dpi=self.config.pdf_dpi)
             logger.info(f"Converted PDF to {len(images)} images: {pdf_path}")
@@ -452,6 +686,23 @@ class ImageProcessor:
             logger.error(f"Failed to process PDF {pdf_path}: {e}")
             return []
     
+    def _render_pdf_in_process(self, pdf_path: str) -> List[Image.Image]:
+        """Rasterize PDF pages with the already-loaded PyMuPDF library (no subprocess)."""
+        zoom = self.config.pdf_dpi / 72  # PDF user space is 72 units per inch
+        matrix = fitz.Matrix(zoom, zoom)
+        images = []
+        with fitz.open(pdf_path) as document:
+            for page in document:
+                pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+                images.append(Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples))
+        logger.info(f"Rendered PDF to {len(images)} images: {pdf_path}")
+        return images
+    
+    def _check_stop(self) -> None:
+        """Abandon the current file if a stop has been requested."""
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise ProcessingCancelled()
+    
     def process_single_image(self, input_path: str, output_path: str) -> bool:
         """Process a single image file with watermarking and optimization."""
         try:
@@ -472,7 +723,9 @@ class ImageProcessor:
                     
                     # Apply processing - resize FIRST, then watermark
                     # This ensures watermark text is correctly sized for the final output
+                    self._check_stop()
                     processed_image = self.resize_for_web(image)
+                    self._check_stop()
                     processed_image = self.apply_watermark(processed_image)
                     
                     # Convert to RGB if saving as JPEG
@@ -480,6 +733,7 @@ class ImageProcessor:
                         processed_image = processed_image.convert('RGB')
                     
                     # Save with appropriate settings
+                    self._check_stop()
                     self.save_optimized_image(processed_image, str(page_output_path))
                 
                 return True
@@ -487,71 +741,99 @@ class ImageProcessor:
             else:
                 # Process regular image
                 with Image.open(input_path) as image:
-                    # Extract comprehensive metadata from original
-                    orig_format = image.format or Path(input_path).suffix.upper().replace('.', '')
-                    orig_mode = image.mode
-                    orig_size = image.size
-                    
-                    # Extract EXIF data if available
-                    orig_exif = None
-                    try:
-                        orig_exif = image.getexif()
-                        if orig_exif:
-                            logger.info(f"Original EXIF tags: {len(orig_exif)} entries")
-                    except Exception:
-                        pass
-                    
-                    # Extract ICC color profile
-                    orig_icc_profile = image.info.get('icc_profile')
-                    if orig_icc_profile:
-                        logger.info(f"Original ICC profile: {len(orig_icc_profile)} bytes")
-                    
-                    # Extract other metadata
-                    orig_dpi = image.info.get('dpi', (72, 72))
-                    orig_info = {k: v for k, v in image.info.items() if k not in ('exif', 'icc_profile')}
-                    
-                    logger.info(f"Original: {orig_size[0]}x{orig_size[1]} {orig_format} ({orig_mode})")
-                    logger.info(f"Original DPI: {orig_dpi}, Info keys: {list(orig_info.keys())}")
-                    
-                    # Store metadata for later use in save
-                    self._current_orig_exif = orig_exif
-                    self._current_orig_icc = orig_icc_profile
-                    
-                    # Keep as much original quality as possible during processing
-                    # Work in RGB/RGBA to avoid multiple conversions
-                    if image.mode not in ('RGB', 'RGBA'):
-                        image = image.convert('RGB')
-                    
-                    # Resize for web FIRST (uses LANCZOS for best quality)
-                    processed_image = self.resize_for_web(image)
-                    
-                    # Apply watermark AFTER resize (so text is correctly sized)
-                    processed_image = self.apply_watermark(processed_image)
-                    
-                    # Convert to RGB if saving as JPEG
-                    if self.config.output_format.upper() == 'JPEG' and processed_image.mode == 'RGBA':
-                        processed_image = processed_image.convert('RGB')
-                    
-                    # Save optimized image (with preserved metadata)
-                    self.save_optimized_image(processed_image, output_path)
-                    
-                    # Clear stored metadata
-                    self._current_orig_exif = None
-                    self._current_orig_icc = None
-                    
+                    fallback_format = Path(input_path).suffix.upper().replace('.', '')
+                    self._process_opened_image(image, output_path, fallback_format)
                     return True
                     
+        except ProcessingCancelled:
+            logger.info(f"Stopped before finishing {input_path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to process {input_path}: {e}")
             return False
     
-    def save_optimized_image(self, image: Image.Image, output_path: str) -> None:
+    def process_single_image_bytes(self, image_data: bytes) -> Optional[bytes]:
+        """Process an encoded image held in memory and return the encoded output.
+        
+        Returns None on failure. PDFs are not supported here since they
+        produce one output per page.
+        """
+        try:
+            output_buffer = io.BytesIO()
+            with Image.open(io.BytesIO(image_data)) as image:
+                self._process_opened_image(image, output_buffer)
+            return output_buffer.getvalue()
+        except Exception as e:
+            logger.error(f"Failed to process in-memory image: {e}")
+            return None
+    
+    def _process_opened_image(self, image: Image.Image, output: Union[str, BinaryIO],
+                              fallback_format: str = "") -> None:
+        """Resize, watermark and save an opened image to a path or binary stream."""
+        # Extract comprehensive metadata from original
+        orig_format = image.format or fallback_format
+        orig_mode = image.mode
+        orig_size = image.size
+        
+        # Extract EXIF data if available
+        orig_exif = None
+        try:
+            orig_exif = image.getexif()
+            if orig_exif:
+                logger.info(f"Original EXIF tags: {len(orig_exif)} entries")
+        except Exception:
+            pass
+        
+        # Extract ICC color profile
+        orig_icc_profile = image.info.get('icc_profile')
+        if orig_icc_profile:
+            logger.info(f"Original ICC profile: {len(orig_icc_profile)} bytes")
+        
+        # Extract other metadata
+        orig_dpi = image.info.get('dpi', (72, 72))
+        orig_info = {k: v for k, v in image.info.items() if k not in ('exif', 'icc_profile')}
+        
+        logger.info(f"Original: {orig_size[0]}x{orig_size[1]} {orig_format} ({orig_mode})")
+        logger.info(f"Original DPI: {orig_dpi}, Info keys: {list(orig_info.keys())}")
+        
+        # Before any pixels are loaded, let libjpeg shrink on decode
+        if self.config.jpeg_shrink_on_load:
+            self._draft_for_long_edge(image)
+        
+        # Keep as much original quality as possible during processing
+        # Work in RGB/RGBA to avoid multiple conversions
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB')
+        else:
+            image.load()
+        self._check_stop()
+        
+        # Resize for web FIRST (uses LANCZOS for best quality)
+        processed_image = self.resize_for_web(image)
+        self._check_stop()
+        
+        # Apply watermark AFTER resize (so text is correctly sized)
+        processed_image = self.apply_watermark(processed_image)
+        
+        # Convert to RGB if saving as JPEG
+        if self.config.output_format.upper() == 'JPEG' and processed_image.mode == 'RGBA':
+            processed_image = processed_image.convert('RGB')
+        
+        # Save optimized image (with preserved metadata)
+        self._check_stop()
+        self.save_optimized_image(processed_image, output, exif=orig_exif)
+    
+    def save_optimized_image(self, image: Image.Image, output_path: Union[str, BinaryIO],
+                             exif: Optional[Image.Exif] = None) -> None:
         """Save image with optimized settings for web.
         
         Includes:
         - sRGB color space conversion
         - 72 DPI for web
         - JPEG at 75-80% quality targeting < 300KB
+        
+        ``exif`` is the source image's EXIF, kept in JPEG output when
+        preserve_metadata is set.
         """
         format_upper = self.config.output_format.upper()
         
@@ -576,7 +858,7 @@ class ImageProcessor:
         
         if format_upper == 'JPEG':
             # Try to hit target file size < 300KB with quality adjustment
-            image = self._save_jpeg_optimized(image, output_path, dpi)
+            image = self._save_jpeg_optimized(image, output_path, dpi, exif)
         elif format_upper == 'PNG':
             image.save(output_path, 'PNG', 
                       compress_level=self.config.png_compression, 
@@ -628,7 +910,8 @@ class ImageProcessor:
             logger.debug(f"sRGB conversion skipped: {e}")
             return image
     
-    def _save_jpeg_optimized(self, image: Image.Image, output_path: str, dpi: tuple) -> Image.Image:
+    def _save_jpeg_optimized(self, image: Image.Image, output_path: Union[str, BinaryIO], dpi: tuple,
+                             exif: Optional[Image.Exif] = None) -> Image.Image:
         """Save JPEG with maximum quality for crisp watermark text.
         
         Uses 4:4:4 subsampling to preserve watermark text sharpness.
@@ -651,24 +934,24 @@ class ImageProcessor:
         }
         
         # Preserve EXIF metadata if configured and available
-        if self.config.preserve_metadata:
-            orig_exif = getattr(self, '_current_orig_exif', None)
-            if orig_exif:
-                save_params['exif'] = orig_exif
-                logger.info("Preserving original EXIF metadata")
+        if self.config.preserve_metadata and exif:
+            save_params['exif'] = exif
+            logger.info("Preserving original EXIF metadata")
+        
+        # One-shot mode: a single progressive encode, no size search
+        if self.config.one_shot_quality is not None:
+            save_params['quality'] = quality = self.config.one_shot_quality
+            save_params['progressive'] = True
+            image.save(output_path, 'JPEG', **save_params)
+            logger.info(f"Saved {output_path} at quality {quality} (one-shot)")
+            return image
         
         # First attempt at configured quality
         buffer = io.BytesIO()
         image.save(buffer, 'JPEG', **save_params)
         size_kb = buffer.tell() / 1024
         
-        # If already under target, save directly (likely with 100% quality)
-        if size_kb <= target_size_kb:
-            image.save(output_path, 'JPEG', **save_params)
-            logger.info(f"Saved {output_path}: {size_kb:.1f}KB at quality {quality}")
-            return image
-        
-        # Otherwise, reduce quality until we hit target (rarely needed at 5MB limit)
+        # Reduce quality until we hit target (rarely needed at 5MB limit)
         while size_kb > target_size_kb and quality > min_quality:
             quality -= 3
             save_params['quality'] = quality
@@ -676,8 +959,12 @@ class ImageProcessor:
             image.save(buffer, 'JPEG', **save_params)
             size_kb = buffer.tell() / 1024
         
-        # Save with final quality
-        image.save(output_path, 'JPEG', **save_params)
+        # Write the last encode as-is rather than encoding it again
+        if isinstance(output_path, (str, os.PathLike)):
+            with open(output_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+        else:
+            output_path.write(buffer.getbuffer())
         logger.info(f"Saved {output_path}: {size_kb:.1f}KB at quality {quality}")
         
         return image
@@ -689,30 +976,12 @@ class ImageProcessor:
         - Files in the output subfolder (web_optimized) to prevent reprocessing
         - Files with the web output suffix (e.g., _web.jpg) 
         """
-        image_files = []
-        
-        # Get the output subfolder name to exclude
-        output_subfolder = self.config.subfolder_name.lower() if self.config.subfolder_name else "web_optimized"
-        web_suffix = self.config.web_output_suffix.lower() if self.config.web_output_suffix else "_web"
-        
-        for root, dirs, files in os.walk(folder_path):
-            # Skip output subfolders to prevent reprocessing
-            # Modify dirs in-place to prevent os.walk from descending into them
-            dirs[:] = [d for d in dirs if d.lower() != output_subfolder]
-            
-            for file in files:
-                file_lower = file.lower()
-                file_stem = Path(file).stem.lower()
-                
-                # Skip files that have already been processed (have web suffix)
-                if web_suffix and file_stem.endswith(web_suffix):
-                    continue
-                    
-                if Path(file).suffix.lower() in self.supported_formats:
-                    image_files.append(os.path.join(root, file))
+        image_files = find_image_files(folder_path, self.config.subfolder_name,
+                                       self.config.web_output_suffix)
         
+        output_subfolder = self.config.subfolder_name or "web_optimized"
         logger.info(f"Found {len(image_files)} original images (excluded output folder '{output_subfolder}')")
-        return sorted(image_files)
+        return image_files
     
     def process_folder(self, progress_callback=None) -> Dict[str, Any]:
         """Process all images in the configured input folder."""
@@ -766,21 +1035,22 @@ class ImageProcessor:
         
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
-            futures = [executor.submit(self._process_task, task) for task in tasks]
+            future_to_path = {executor.submit(self._process_task, task): task[0] for task in tasks}
             
-            # Process results with progress tracking
-            for i, future in enumerate(tqdm(futures, desc="Processing images")):
+            # Process results as they complete so one slow file doesn't stall progress
+            futures = as_completed(future_to_path)
+            for i, future in enumerate(tqdm(futures, total=len(future_to_path), desc="Processing images")):
                 try:
                     if future.result():
                         results["processed"] += 1
                     else:
                         results["failed"] += 1
                 except Exception as e:
-                    logger.error(f"Task failed: {e}")
+                    logger.error(f"Task failed for {future_to_path[future]}: {e}")
                     results["failed"] += 1
                 
                 if progress_callback:
-                    progress_callback(i + 1, len(futures))
+                    progress_callback(i + 1, len(future_to_path))
         
         return results
     
@@ -0,0 +1,62 @@
+"""
+Tests for ImageProcessor pickling and multiprocess folder processing.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from PIL import Image
+    from image_processor import ImageProcessor, ProcessingConfig
+    DEPENDENCIES_AVAILABLE = True
+except ImportError:
+    DEPENDENCIES_AVAILABLE = False
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "image processing dependencies not installed")
+class ImageProcessorPickleTests(unittest.TestCase):
+    """ProcessPoolExecutor pickles the processor along with its bound methods."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+    
+    def _make_config(self, **overrides) -> "ProcessingConfig":
+        return ProcessingConfig(input_folder=self.temp_dir.name,
+                                output_folder=self.temp_dir.name, **overrides)
+    
+    def test_pickle_round_trip(self):
+        processor = ImageProcessor(self._make_config())
+        processor.stop_event = threading.Event()
+        processor._text_overlay_cache[100] = Image.new('RGBA', (100, 100))
+        
+        restored = pickle.loads(pickle.dumps(processor))
+        
+        self.assertEqual(restored.config, processor.config)
+        self.assertIsNone(restored.stop_event)
+        self.assertEqual(restored._text_overlay_cache, {})
+        # The lock is recreated, not shared
+        self.assertIsNot(restored._text_overlay_lock, processor._text_overlay_lock)
+        with restored._text_overlay_lock:
+            pass
+    
+    def test_process_folder_with_multiprocessing(self):
+        for name, color in (("red.jpg", (200, 0, 0)), ("blue.jpg", (0, 0, 200))):
+            Image.new('RGB', (320, 240), color).save(os.path.join(self.temp_dir.name, name))
+        
+        processor = ImageProcessor(self._make_config(use_multiprocessing=True, max_workers=2))
+        results = processor.process_folder()
+        
+        self.assertEqual(results, {"processed": 2, "failed": 0, "total": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()